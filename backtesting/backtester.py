@@ -1,4 +1,5 @@
 import pandas as pd
+from collections import deque
 from scipy.signal import argrelextrema
 import numpy as np
 
@@ -16,9 +17,76 @@ def identify_support_resistance(data: pd.DataFrame, lookahead=20):
 
     return support_levels, resistance_levels
 
+class SupportResistanceTracker:
+    """
+    Incrementally tracks support and resistance levels as new local extrema are confirmed.
+
+    A bar is confirmed once `lookahead` later bars have been seen. It is a support (resistance)
+    level if its Low (High) is less (greater) than or equal to every Low (High) within
+    `lookahead` bars on either side, the same test identify_support_resistance runs with
+    argrelextrema. Each update is O(1) amortized using monotonic deques.
+    """
+
+    def __init__(self, lookahead=20):
+        self.lookahead = lookahead
+        self.support_levels = []
+        self.resistance_levels = []
+        self._seen_support = set()
+        self._seen_resistance = set()
+        self._lows = deque(maxlen=lookahead + 1)
+        self._highs = deque(maxlen=lookahead + 1)
+        # Indices of candidate window minima / maxima, values monotonic from left to right
+        self._min_window = deque()
+        self._max_window = deque()
+        self._nan_bars = deque()
+        self._count = 0
+
+    def update(self, high, low):
+        """Adds the next bar and confirms the bar `lookahead` bars back if it is an extremum."""
+        index = self._count
+        self._count += 1
+        self._lows.append(low)
+        self._highs.append(high)
+
+        window_start = index - 2 * self.lookahead
+        if low != low or high != high:
+            self._nan_bars.append(index)
+        else:
+            while self._min_window and self._min_window[-1][1] >= low:
+                self._min_window.pop()
+            self._min_window.append((index, low))
+            while self._max_window and self._max_window[-1][1] <= high:
+                self._max_window.pop()
+            self._max_window.append((index, high))
+        for window in (self._min_window, self._max_window, self._nan_bars):
+            while window and (window[0] if window is self._nan_bars else window[0][0]) < window_start:
+                window.popleft()
+
+        if index < self.lookahead:
+            return
+        # NaN anywhere in the window fails every comparison, so nothing is confirmed
+        if self._nan_bars:
+            return
+        candidate_low, candidate_high = self._lows[0], self._highs[0]
+        if candidate_low <= self._min_window[0][1] and candidate_low not in self._seen_support:
+            self._seen_support.add(candidate_low)
+            self.support_levels.append(candidate_low)
+        if candidate_high >= self._max_window[0][1] and candidate_high not in self._seen_resistance:
+            self._seen_resistance.add(candidate_high)
+            self.resistance_levels.append(candidate_high)
+
+    def nearest_resistance_above(self, price):
+        """Returns the lowest confirmed resistance level above price, or NaN if there is none."""
+        return min((level for level in self.resistance_levels if level > price), default=np.nan)
+
 def backtest_strategy(data: pd.DataFrame, strategy: callable, lookahead_sr=20, stop_loss_percentage=0.02):
     """
-    Backtests a given trading strategy on historical data with support/resistance based exits.
+    Backtests a given trading strategy on historical data.
+
+    A long position is entered on the close of a bar with a signal and exited on the close of
+    the first following bar without one. Support/resistance levels are tracked incrementally
+    while walking the bars, and each trade records the nearest confirmed resistance above its
+    entry price at the time of entry.
 
     Args:
         data (pd.DataFrame): DataFrame containing historical stock data with necessary indicators.
@@ -36,37 +104,48 @@ def backtest_strategy(data: pd.DataFrame, strategy: callable, lookahead_sr=20, s
         raise ValueError("The strategy function must return a DataFrame with a 'signal' column.")
 
     signals = signals_df['signal']
-    positions = pd.Series(0, index=data.index)  # Initialize with 0 for all dates
+    dates = data.index
+    has_signal = dates.isin(signals.index)
+    active = signals.reindex(dates, fill_value=False).astype(bool).to_numpy()
+    closes = data['Close'].to_numpy(dtype=float)
+    highs = data['High'].to_numpy(dtype=float)
+    lows = data['Low'].to_numpy(dtype=float)
+
+    positions = np.zeros(len(data), dtype=np.int64)
+    tracker = SupportResistanceTracker(lookahead_sr)
     in_position = False
+    entry_index = -1
     entry_price = 0
+    resistance_level = np.nan
     trades = []
 
-    for i in data.index:
-        support_levels, resistance_levels = identify_support_resistance(data.iloc[:data.index.get_loc(i) + 1], lookahead=lookahead_sr)
-        current_price = data['Close'][i]
-        if i in signals.index:
-            if signals[i] and not in_position:
+    for i in range(len(data)):
+        tracker.update(highs[i], lows[i])
+        if has_signal[i]:
+            if active[i] and not in_position:
                 positions[i] = 1  # Enter long position
                 in_position = True
-                entry_price = data['Close'][i]
-                stop_loss_level = entry_price * (1 - stop_loss_percentage)
-            elif in_position:
-                # Exit if price reaches a past resistance level (within a tolerance)
-                relevant_resistance = resistance_levels[resistance_levels > entry_price]
-                if not signals[i] and i in data.index:
-                    positions[i] = 0 # Exit long position
-                    in_position = False
-                    exit_price = current_price
-                    profit_loss_percentage = (exit_price - entry_price) / entry_price
-                    absolute_profit_loss = exit_price - entry_price
-                    trades.append({'entry_date': positions[positions == 1].index[-1], 'entry_price': entry_price, 'exit_date': i, 'exit_price': exit_price, 'profit_loss_percentage': profit_loss_percentage, 'absolute_profit_loss': absolute_profit_loss, 'exit_reason': 'Resistance'})
-                    entry_price = 0
-                    stop_loss_level = 0
+                entry_index = i
+                entry_price = closes[i]
+                resistance_level = tracker.nearest_resistance_above(entry_price)
+            elif in_position and not active[i]:
+                # Exit long position
+                in_position = False
+                exit_price = closes[i]
+                trades.append({
+                    'entry_date': dates[entry_index],
+                    'entry_price': entry_price,
+                    'exit_date': dates[i],
+                    'exit_price': exit_price,
+                    'profit_loss_percentage': (exit_price - entry_price) / entry_price,
+                    'absolute_profit_loss': exit_price - entry_price,
+                    'exit_reason': 'Resistance',
+                    'resistance_level': resistance_level,
+                })
+                entry_price = 0
         # If the date from data.index is not in signals.index, maintain the previous position
         elif in_position:
             positions[i] = 1
-        else:
-            positions[i] = 0
 
     trades_df = pd.DataFrame(trades)
-    return positions, trades_df
\ No newline at end of file
+    return pd.Series(positions, index=dates), trades_df
@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+from utils.bars import Bars
+
+
+def build_signal_panel(stocks_data: dict, strategy: callable, indicators=None):
+    """
+    Evaluates a strategy for every ticker and aligns the results on a common date index.
+
+    Args:
+        stocks_data (dict): Mapping of ticker symbol to its OHLCV DataFrame.
+        strategy (callable): Strategy function returning a DataFrame with a 'signal' column.
+        indicators (list): Indicator columns the strategy needs, defaults to all of them.
+
+    Returns:
+        tuple: (closes, signals) DataFrames of dates x tickers. Dates a ticker did not trade on
+        are NaN in both.
+    """
+    closes = {}
+    signals = {}
+    for ticker, data in stocks_data.items():
+        if data is None or data.empty:
+            continue
+        data = Bars.from_frame(data).with_indicators(indicators).frame()
+        closes[ticker] = data['Close']
+        signals[ticker] = strategy(data)['signal'].reindex(data.index, fill_value=False).astype(float)
+    return pd.DataFrame(closes).sort_index(), pd.DataFrame(signals).sort_index()
+
+
+def backtest_portfolio(closes: pd.DataFrame, signals: pd.DataFrame):
+    """
+    Backtests a signal panel across all tickers at once with the rules of backtest_strategy:
+    a long position is entered on the close of a bar with a signal and exited on the close of
+    the first following bar without one. Bars a ticker did not trade on keep its position.
+
+    Args:
+        closes (pd.DataFrame): Close prices, dates x tickers.
+        signals (pd.DataFrame): Signals aligned with closes, NaN where a ticker has no bar.
+
+    Returns:
+        tuple: (trades_df, equity_curve, metrics). The equity curve starts at 1.0 and splits
+        capital equally across the positions open on each day.
+    """
+    trades_df, return_sums, open_positions = simulate_portfolio(closes, signals)
+    equity_curve = build_equity_curve(return_sums, open_positions, closes.index)
+    return trades_df, equity_curve, calculate_portfolio_metrics(trades_df, equity_curve)
+
+
+def simulate_portfolio(closes: pd.DataFrame, signals: pd.DataFrame):
+    """
+    Runs the entry/exit state machine over a signal panel.
+
+    Returns:
+        tuple: (trades_df, return_sums, open_positions) where the last two hold, for every date,
+        the summed daily return of the positions held into it and how many there were. Results
+        of panels sharing a date index can be combined by adding them up.
+    """
+    signals = signals.reindex(index=closes.index, columns=closes.columns)
+    dates, tickers = closes.index, closes.columns
+    prices = closes.ffill().to_numpy(dtype=float)
+
+    # Position after each bar: the bar's signal where it traded, otherwise the previous position
+    state = signals.ffill().fillna(0).to_numpy(dtype=float) > 0
+    previous = np.vstack([np.zeros((1, state.shape[1]), dtype=bool), state[:-1]])
+    entries = state & ~previous
+    exits = ~state & previous
+
+    # Pair entries with exits per ticker; positions still open at the end are not trades
+    entry_cols, entry_rows = np.nonzero(entries.T)
+    exit_cols, exit_rows = np.nonzero(exits.T)
+    last_entry = np.r_[entry_cols[1:] != entry_cols[:-1], True] if len(entry_cols) else np.zeros(0, dtype=bool)
+    closed = ~(last_entry & state[-1][entry_cols]) if len(state) else last_entry
+    entry_cols, entry_rows = entry_cols[closed], entry_rows[closed]
+
+    entry_prices = prices[entry_rows, entry_cols]
+    exit_prices = prices[exit_rows, exit_cols]
+    trades_df = pd.DataFrame({
+        'ticker': tickers[entry_cols],
+        'entry_date': dates[entry_rows],
+        'entry_price': entry_prices,
+        'exit_date': dates[exit_rows],
+        'exit_price': exit_prices,
+        'profit_loss_percentage': (exit_prices - entry_prices) / entry_prices,
+        'absolute_profit_loss': exit_prices - entry_prices,
+    })
+
+    # Daily returns of the positions held into each bar
+    daily_returns = np.zeros_like(prices)
+    daily_returns[1:] = prices[1:] / prices[:-1] - 1
+    held = previous & np.isfinite(daily_returns)
+    return_sums = np.where(held, daily_returns, 0.0).sum(axis=1)
+    return trades_df, return_sums, held.sum(axis=1)
+
+
+def build_equity_curve(return_sums, open_positions, dates) -> pd.Series:
+    """Compounds the equally weighted daily return of the open positions into an equity curve."""
+    portfolio_returns = np.divide(
+        return_sums, open_positions, out=np.zeros(len(dates)), where=open_positions > 0
+    )
+    return pd.Series(np.cumprod(1 + portfolio_returns), index=dates, name='equity')
+
+
+def calculate_portfolio_metrics(trades_df: pd.DataFrame, equity_curve: pd.Series) -> dict:
+    num_trades = len(trades_df)
+    winning_trades = int((trades_df['profit_loss_percentage'] > 0).sum()) if num_trades else 0
+    drawdown = equity_curve / equity_curve.cummax() - 1 if not equity_curve.empty else equity_curve
+    return {
+        'total_trades': num_trades,
+        'win_rate': (winning_trades / num_trades) * 100 if num_trades > 0 else 0,
+        'average_profit_loss': trades_df['profit_loss_percentage'].mean() * 100 if num_trades > 0 else 0,
+        'total_return': (equity_curve.iloc[-1] - 1) * 100 if not equity_curve.empty else 0,
+        'max_drawdown': drawdown.min() * 100 if not equity_curve.empty else 0,
+    }
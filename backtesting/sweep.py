@@ -0,0 +1,117 @@
+import inspect
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from backtesting.portfolio import simulate_portfolio, build_equity_curve, calculate_portfolio_metrics
+from utils.bars import Bars
+
+# Strategy parameters that select an indicator column, mapped to the column prefix they select
+PARAMETER_INDICATORS = {
+    'short_period': 'EMA',
+    'long_period': 'EMA',
+    'sma_period': 'SMA',
+    'rsi_period': 'RSI',
+}
+
+# Tickers handed to a worker process at a time
+SWEEP_CHUNK_SIZE = 25
+
+
+def expand_grid(param_grid: dict) -> list:
+    """Expands {'short_period': [10, 20], 'long_period': [50]} into one dict per combination."""
+    names = list(param_grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(param_grid[name] for name in names))]
+
+
+def required_indicator_columns(strategy: callable, combinations: list) -> set:
+    """
+    Returns the distinct indicator columns needed to evaluate every parameter combination,
+    including the ones selected by parameters left at their defaults.
+    """
+    defaults = {
+        name: parameter.default
+        for name, parameter in inspect.signature(strategy).parameters.items()
+        if parameter.default is not inspect.Parameter.empty
+    }
+    columns = set()
+    for params in combinations:
+        for name, value in {**defaults, **params}.items():
+            if name in PARAMETER_INDICATORS:
+                columns.add(f"{PARAMETER_INDICATORS[name]}_{value}")
+    return columns
+
+
+def sweep_tickers(stocks_data: dict, strategy: callable, combinations: list, dates: pd.DatetimeIndex, indicators=None) -> list:
+    """
+    Evaluates every parameter combination on a chunk of tickers.
+
+    Indicator columns are computed once per ticker and shared by all combinations. Returns one
+    (trades_df, return_sums, open_positions) tuple per combination, aligned on dates.
+    """
+    # Strategies without period parameters read fixed columns, fall back to the declared ones
+    columns = sorted(required_indicator_columns(strategy, combinations)) or indicators
+    enriched = {ticker: Bars.from_frame(data).with_indicators(columns).frame() for ticker, data in stocks_data.items()}
+
+    closes = pd.DataFrame({ticker: data['Close'] for ticker, data in enriched.items()}).reindex(dates)
+    results = []
+    for params in combinations:
+        signals = pd.DataFrame({
+            ticker: strategy(data, **params)['signal'].reindex(data.index, fill_value=False).astype(float)
+            for ticker, data in enriched.items()
+        }).reindex(dates)
+        results.append(simulate_portfolio(closes, signals))
+    return results
+
+
+def run_parameter_sweep(stocks_data: dict, strategy: callable, param_grid: dict, indicators=None,
+                        max_workers=None, rank_by='average_profit_loss') -> pd.DataFrame:
+    """
+    Backtests every combination of a parameter grid across a universe of tickers.
+
+    Tickers are split into chunks evaluated on a process pool; each worker computes the
+    indicator columns of its tickers once and reuses them for every combination.
+
+    Args:
+        stocks_data (dict): Mapping of ticker symbol to its OHLCV DataFrame.
+        strategy (callable): Strategy function, e.g. ema_crossover_long.
+        param_grid (dict): Parameter name -> list of values to try.
+        indicators (list): Indicator columns the strategy declares, used when no parameter selects one.
+        max_workers (int): Worker processes, defaults to the CPU count. 0 runs in-process.
+        rank_by (str): Metric column to rank the combinations by, best first.
+
+    Returns:
+        pd.DataFrame: One row per combination with its parameters and portfolio metrics.
+    """
+    combinations = expand_grid(param_grid)
+    stocks_data = {ticker: data for ticker, data in stocks_data.items() if data is not None and not data.empty}
+    if not combinations or not stocks_data:
+        return pd.DataFrame()
+
+    dates = pd.DatetimeIndex(sorted(set().union(*(data.index for data in stocks_data.values()))))
+    tickers = list(stocks_data)
+    chunks = [
+        {ticker: stocks_data[ticker] for ticker in tickers[i:i + SWEEP_CHUNK_SIZE]}
+        for i in range(0, len(tickers), SWEEP_CHUNK_SIZE)
+    ]
+
+    if max_workers == 0:
+        chunk_results = [sweep_tickers(chunk, strategy, combinations, dates, indicators) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+            chunk_results = list(pool.map(
+                sweep_tickers, chunks, itertools.repeat(strategy),
+                itertools.repeat(combinations), itertools.repeat(dates), itertools.repeat(indicators)
+            ))
+
+    rows = []
+    for i, params in enumerate(combinations):
+        results = [chunk[i] for chunk in chunk_results]
+        trades_df = pd.concat([trades for trades, _, _ in results], ignore_index=True)
+        return_sums = np.sum([sums for _, sums, _ in results], axis=0)
+        open_positions = np.sum([counts for _, _, counts in results], axis=0)
+        equity_curve = build_equity_curve(return_sums, open_positions, dates)
+        rows.append({**params, **calculate_portfolio_metrics(trades_df, equity_curve)})
+
+    return pd.DataFrame(rows).sort_values(rank_by, ascending=False, ignore_index=True)
@@ -1,11 +1,12 @@
 import streamlit as st
 from backtesting.backtester import backtest_strategy
+from backtesting.portfolio import build_signal_panel, backtest_portfolio
 from utils.calculations import calculate_indicators
-from strategies.swing_strategies import ema_crossover_long, sma_price_crossover_long, rsi_oversold_reversal_long, macd_crossover_long
+from strategies.swing_strategies import ema_crossover_long, sma_price_crossover_long, rsi_oversold_reversal_long, macd_crossover_long, ema_200_weekly_breakout
 
 def run_backtest(backtest_ticker, backtest_start_date, backtest_end_date, backtest_strategy_option):
     if backtest_ticker and backtest_start_date and backtest_end_date and backtest_start_date < backtest_end_date:
-        from utils.data_fetching import fetch_stock_data # Import here to avoid circular dependency
+        from ui.data_cache import fetch_stock_data # Import here to avoid circular dependency
         backtest_data = fetch_stock_data(backtest_ticker, period=f"{(backtest_end_date - backtest_start_date).days}d")
         if backtest_data is not None:
             backtest_data = backtest_data[backtest_start_date:backtest_end_date].copy()
@@ -20,6 +21,8 @@ def run_backtest(backtest_ticker, backtest_start_date, backtest_end_date, backte
                 selected_strategy_func = rsi_oversold_reversal_long
             elif backtest_strategy_option == "MACD Crossover":
                 selected_strategy_func = macd_crossover_long
+            elif backtest_strategy_option == "EMA 200 Breakout":
+                selected_strategy_func = ema_200_weekly_breakout
 
             if selected_strategy_func:
                 positions, trades_df = backtest_strategy(backtest_data, selected_strategy_func)
@@ -32,6 +35,41 @@ def run_backtest(backtest_ticker, backtest_start_date, backtest_end_date, backte
         st.warning("Please select a stock, start date, end date, and strategy for backtesting.")
     st.markdown("---")
 
+def run_portfolio_backtest(tickers, timeframe, strategy):
+    from ui.data_cache import fetch_stocks_data # Import here to avoid circular dependency
+    from utils.constants import TIMEFRAMES
+
+    interval, period = TIMEFRAMES[timeframe]
+    with st.spinner(f"Fetching {len(tickers)} tickers..."):
+        stocks_data = fetch_stocks_data(tickers, period=period, interval=interval)
+    if not stocks_data:
+        st.error("Could not retrieve data for backtesting.")
+        return
+
+    closes, signals = build_signal_panel(stocks_data, strategy['function'], strategy.get('indicators'))
+    trades_df, equity_curve, metrics = backtest_portfolio(closes, signals)
+    display_portfolio_results(trades_df, equity_curve, metrics, strategy['name'], timeframe, len(stocks_data))
+    st.markdown("---")
+
+def display_portfolio_results(trades_df, equity_curve, metrics, strategy_name, timeframe, num_tickers):
+    st.subheader(f"Portfolio Backtest of {strategy_name} on {num_tickers} tickers ({timeframe})")
+    if trades_df.empty:
+        st.info("No trades were executed during the backtesting period.")
+        return
+    columns = st.columns(4)
+    columns[0].metric("Total Trades", metrics['total_trades'])
+    columns[1].metric("Win Rate (%)", f"{metrics['win_rate']:.2f}")
+    columns[2].metric("Total Return (%)", f"{metrics['total_return']:.2f}")
+    columns[3].metric("Max Drawdown (%)", f"{metrics['max_drawdown']:.2f}")
+    st.line_chart(equity_curve)
+    st.subheader("Per-Ticker Summary:")
+    per_ticker = trades_df.groupby('ticker')['profit_loss_percentage'].agg(
+        trades='count', win_rate=lambda x: (x > 0).mean() * 100, average_profit_loss=lambda x: x.mean() * 100
+    )
+    st.dataframe(per_ticker.sort_values('average_profit_loss', ascending=False))
+    st.subheader("Individual Trades:")
+    st.dataframe(trades_df)
+
 def display_backtesting_results(trades_df, ticker, strategy_name, start_date, end_date):
     st.subheader(f"Backtesting Results for {ticker} using {strategy_name} ({start_date} to {end_date})")
     if not trades_df.empty:
@@ -0,0 +1,24 @@
+import numpy as np
+import pandas as pd
+from tests import helpers
+
+# Deterministic synthetic OHLCV, so benchmark runs are reproducible without the network.
+# Prices follow a geometric random walk with alternating trends, which gives the swing,
+# crossover and retracement strategies something to find.
+
+
+def make_ohlcv(bars: int, seed: int = 0, freq: str = 'B', end: str = '2025-06-27') -> pd.DataFrame:
+    trend = np.where(np.arange(bars) % 120 < 80, 0.0008, -0.0012)
+    return helpers.make_ohlcv(bars, seed=seed, freq=freq, end=end, price=500.0, volatility=0.015, trend=trend,
+                              decimals=2, adj_close=True)
+
+
+def make_universe(tickers: int = 200, daily_bars: int = 500, weekly_bars: int = 520) -> dict:
+    """fetched_data as prefetch_stock_data fills it: ticker -> interval -> bars"""
+    return {
+        f"SYN{i:03d}.NS": {
+            '1d': make_ohlcv(daily_bars, seed=i),
+            '1wk': make_ohlcv(weekly_bars, seed=10_000 + i, freq='W-MON'),
+        }
+        for i in range(tickers)
+    }
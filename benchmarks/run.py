@@ -0,0 +1,169 @@
+"""
+Benchmarks of the scan, indicator, strategy and backtest hot paths on synthetic data.
+
+    python benchmarks/run.py                          # run every case
+    python benchmarks/run.py -k fibonacci --repeat 10 # cases matching a substring
+    python benchmarks/run.py --save baseline.json     # record a baseline
+    python benchmarks/run.py --compare baseline.json  # exit 1 if a case got slower than --threshold
+
+Each case reports the best and median wall time over --repeat runs and the peak memory
+traced by tracemalloc during one extra run.
+"""
+import argparse
+import functools
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from benchmarks.fixtures import make_ohlcv, make_universe
+
+
+class Case:
+    """A named benchmark: setup() builds the inputs outside of the timing, run(inputs) is timed."""
+
+    def __init__(self, name, setup, run):
+        self.name = name
+        self.setup = setup
+        self.run = run
+
+
+def build_cases():
+    from backtesting.backtester import backtest_strategy
+    from config.strategy_config import STRATEGIES, EMA_CROSSOVER
+    from strategies.fibonacci_strategies import identify_swing_points, fibonacci_retracement_strategy
+    from utils.bar_store import BarStore
+    from utils.calculations import calculate_indicators
+    from utils.data_fetching import load_stocks_data
+    from utils.data_sources import ReplayDataSource, set_data_source
+    from utils.memo import compute_cache
+    from utils.scan_engine import scan_tickers, scan_panel
+    from utils.signals import build_signal_row
+
+    daily = make_ohlcv(2500)
+    enriched = calculate_indicators(daily.copy())
+    timeframes = ['1 Day', '1 Week']
+    # The scans only read the universe, build it once
+    universe = functools.lru_cache(maxsize=None)(make_universe)
+
+    def scan(results):
+        return [build_signal_row(*result, timeframes) for result in results]
+
+    def cold_universe():
+        # The per-ticker scan memoizes by data fingerprint, start every run cold
+        compute_cache.clear()
+        return universe()
+
+    workspace = tempfile.TemporaryDirectory(prefix='cardinal-point-bench-')
+
+    @functools.lru_cache(maxsize=None)
+    def recording():
+        root = os.path.join(workspace.name, 'replay')
+        ReplayDataSource(root).record({ticker: data['1d'] for ticker, data in universe().items()}, '1d')
+        return root
+
+    def cold_store():
+        # An empty bar store, so every ticker goes through the data source
+        return BarStore(tempfile.mkdtemp(dir=workspace.name)), recording()
+
+    def load(inputs):
+        store, root = inputs
+        previous = set_data_source(ReplayDataSource(root))
+        try:
+            return load_stocks_data(list(universe()), period='2y', interval='1d', as_of_date=date(2025, 6, 27), store=store)
+        finally:
+            set_data_source(previous)
+
+    cases = [
+        Case('calculate_indicators[2500]', lambda: daily, lambda data: calculate_indicators(data.copy())),
+        Case('identify_swing_points[2500]', lambda: daily, lambda data: identify_swing_points(data)),
+        Case('fibonacci_retracement_strategy[2500]', lambda: daily, lambda data: fibonacci_retracement_strategy(data)),
+        Case('backtest_strategy[2500,EMA Crossover]', lambda: enriched,
+             lambda data: backtest_strategy(data, EMA_CROSSOVER['function'])),
+        Case('scan_panel[200 tickers,1d+1wk]', universe,
+             lambda fetched_data: scan(scan_panel(list(fetched_data), timeframes, fetched_data))),
+        Case('scan_tickers[200 tickers,1d+1wk]', cold_universe,
+             lambda fetched_data: scan(scan_tickers(list(fetched_data), timeframes, fetched_data, None, compute_workers=0))),
+        Case('load_stocks_data[200 tickers,1d,replay]', cold_store, load),
+    ]
+    for strategy in STRATEGIES:
+        cases.append(Case(f"strategy[2500,{strategy['name']}]", lambda: enriched,
+                          lambda data, function=strategy['function']: function(data)))
+    return cases
+
+
+def measure(case, repeat):
+    times = []
+    for _ in range(repeat):
+        inputs = case.setup()
+        start = time.perf_counter()
+        case.run(inputs)
+        times.append(time.perf_counter() - start)
+
+    inputs = case.setup()
+    tracemalloc.start()
+    try:
+        case.run(inputs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'best_s': min(times), 'median_s': statistics.median(times), 'peak_mb': peak / 2**20}
+
+
+def compare(results, baseline, threshold):
+    """Prints the ratio to the baseline per case and returns the names of the regressed cases"""
+    regressions = []
+    print(f"\n{'case':45} {'baseline':>10} {'now':>10} {'ratio':>7}")
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:45} {'-':>10} {result['best_s'] * 1000:9.2f}ms {'new':>7}")
+            continue
+        ratio = result['best_s'] / baseline[name]['best_s']
+        flag = ' REGRESSION' if ratio > threshold else ''
+        print(f"{name:45} {baseline[name]['best_s'] * 1000:8.2f}ms {result['best_s'] * 1000:8.2f}ms {ratio:6.2f}x{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cardinal Point benchmarks")
+    parser.add_argument('-k', dest='pattern', help="Only run cases whose name contains this substring")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed runs per case (default: 5)")
+    parser.add_argument('--save', help="Write the results to this JSON file")
+    parser.add_argument('--compare', help="Compare against results saved with --save")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="Slowdown ratio of the best time that counts as a regression (default: 1.25)")
+    args = parser.parse_args(argv)
+
+    results = {}
+    print(f"{'case':45} {'best':>10} {'median':>10} {'peak':>10}")
+    for case in build_cases():
+        if args.pattern and args.pattern not in case.name:
+            continue
+        result = measure(case, args.repeat)
+        results[case.name] = result
+        print(f"{case.name:45} {result['best_s'] * 1000:8.2f}ms {result['median_s'] * 1000:8.2f}ms {result['peak_mb']:8.2f}MB")
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump({'python': platform.python_version(), 'machine': platform.machine(), 'results': results}, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
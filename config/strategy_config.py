@@ -6,38 +6,68 @@ from strategies.swing_strategies import (
     ema_200_weekly_breakout
 )
 from strategies.fibonacci_strategies import fibonacci_retracement_strategy
+from strategies.panel_strategies import (
+    ema_crossover_long_panel,
+    sma_price_crossover_long_panel,
+    rsi_oversold_reversal_long_panel,
+    macd_crossover_long_panel,
+    ema_200_weekly_breakout_panel
+)
 
-# Define common strategy objects
+# Define common strategy objects. 'indicators' lists the indicator columns a strategy reads
+# with its default parameters, only those are calculated for the active strategies.
+# 'panel_function' is the variant evaluating the whole universe at once on a BarPanel.
 EMA_CROSSOVER = {
     'name': 'EMA Crossover',
     'function': ema_crossover_long,
+    'panel_function': ema_crossover_long_panel,
+    'indicators': ['EMA_20', 'EMA_50'],
 }
 
 SMA_PRICE_CROSSOVER = {
     'name': 'SMA Price Crossover',
     'function': sma_price_crossover_long,
+    'panel_function': sma_price_crossover_long_panel,
+    'indicators': ['SMA_50'],
 }
 
 RSI_OVERSOLD_REVERSAL = {
     'name': 'RSI Oversold Reversal',
     'function': rsi_oversold_reversal_long,
+    'panel_function': rsi_oversold_reversal_long_panel,
+    'indicators': ['RSI_14'],
 }
 
 MACD_CROSSOVER = {
     'name': 'MACD Crossover',
     'function': macd_crossover_long,
+    'panel_function': macd_crossover_long_panel,
+    'indicators': ['MACD', 'Signal'],
 }
 
 EMA_200_BREAKOUT = {
     'name': 'EMA 200 Breakout',
     'function': ema_200_weekly_breakout,
+    'panel_function': ema_200_weekly_breakout_panel,
+    'indicators': ['EMA_200'],
 }
 
 FIBONACCI_RETRACEMENT = {
     'name': 'Fibonacci Retracement',
     'function': fibonacci_retracement_strategy,
+    'indicators': [],
 }
 
+# All strategies, e.g. for picking one to backtest by name
+STRATEGIES = [
+    EMA_CROSSOVER,
+    SMA_PRICE_CROSSOVER,
+    RSI_OVERSOLD_REVERSAL,
+    MACD_CROSSOVER,
+    EMA_200_BREAKOUT,
+    FIBONACCI_RETRACEMENT,
+]
+
 # Strategy configuration by timeframe
 daily_strategies = [
     # EMA_CROSSOVER,
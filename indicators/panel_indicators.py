@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+
+# Indicators over a panel of closes (bars x tickers), one column per ticker. They use the same
+# pandas calls as technical_indicators.py column-wise, so each column equals the single-ticker
+# result as long as the panel only pads a ticker's history with NaN before its first bar.
+
+
+def panel_ema(closes: pd.DataFrame, period: int) -> pd.DataFrame:
+    return closes.ewm(span=period, adjust=False).mean()
+
+
+def panel_sma(closes: pd.DataFrame, period: int) -> pd.DataFrame:
+    return closes.rolling(window=period).mean()
+
+
+def panel_rsi(closes: pd.DataFrame, period: int = 14) -> pd.DataFrame:
+    delta = closes.diff(1)
+    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    rsi = 100 - (100 / (1 + gain / loss))
+    # The padding counts as zero gain/loss, hide windows reaching back before a ticker's first bar
+    return rsi.where(closes.notna().cumsum() >= period)
+
+
+def panel_macd(closes: pd.DataFrame, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9) -> dict:
+    """The ta.trend.MACD calculation, returns 'MACD', 'Signal' and 'Histogram' panels."""
+    def _ema(series, periods):
+        return series.ewm(span=periods, min_periods=periods, adjust=False).mean()
+
+    macd = _ema(closes, fast_period) - _ema(closes, slow_period)
+    signal = _ema(macd, signal_period)
+    return {'MACD': macd, 'Signal': signal, 'Histogram': macd - signal}
+
+
+def panel_indicators(closes: pd.DataFrame, columns) -> dict:
+    """
+    Calculates indicator columns named like calculate_indicators names them ('EMA_20',
+    'RSI_14', 'MACD', ...) over a panel of closes. Returns column -> 2-D float array.
+    """
+    indicators = {}
+    macd = None
+    for column in columns:
+        name, _, period = column.partition('_')
+        if column in ('MACD', 'Signal', 'Histogram'):
+            if macd is None:
+                macd = panel_macd(closes)
+            indicators[column] = macd[column].to_numpy()
+        elif name == 'EMA' and period.isdigit():
+            indicators[column] = panel_ema(closes, int(period)).to_numpy()
+        elif name == 'SMA' and period.isdigit():
+            indicators[column] = panel_sma(closes, int(period)).to_numpy()
+        elif name == 'RSI' and period.isdigit():
+            indicators[column] = panel_rsi(closes, int(period)).to_numpy()
+        else:
+            raise ValueError(f"Unknown indicator column '{column}'")
+    return {column: np.asarray(values, dtype=float) for column, values in indicators.items()}
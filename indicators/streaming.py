@@ -0,0 +1,363 @@
+import json
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+import pandas as pd
+
+# Stateful versions of the indicators in technical_indicators.py. They are seeded from history and
+# then updated one bar at a time in O(1), matching the batch functions to floating point tolerance.
+# update() appends a new bar, amend() revises the latest bar (e.g. an intraday refresh of today's
+# daily bar), and to_dict()/from_dict() serialize the state so it can be persisted between runs.
+# To make amend() possible update() keeps a checkpoint of what it changed, which is O(1) as well:
+# windowed indicators record the value leaving the window rather than copying the window.
+
+
+class StreamingIndicator(ABC):
+    """Base class holding the update/amend/serialization plumbing shared by the indicators."""
+
+    kind = None
+
+    def __init__(self):
+        self._previous = None
+        self.value = math.nan
+
+    def update(self, close: float):
+        """Adds the next bar and returns the indicator value for it."""
+        self._previous = self.checkpoint()
+        self.value = self._step(float(close))
+        return self.value
+
+    def amend(self, close: float):
+        """Replaces the latest bar with a revised close and returns the revised value."""
+        if self._previous is None:
+            raise ValueError("amend() needs a bar to revise, call update() first")
+        self.restore(self._previous)
+        self.value = self._step(float(close))
+        return self.value
+
+    def checkpoint(self) -> dict:
+        """Returns what restore() needs to undo the next update, the whole state by default."""
+        return self.get_state()
+
+    def restore(self, checkpoint: dict):
+        """Undoes the update made after checkpoint() returned checkpoint."""
+        self.set_state(checkpoint)
+
+    def seed(self, closes):
+        """Feeds a history of closes and returns the values for every bar."""
+        return [self.update(close) for close in closes]
+
+    def to_dict(self) -> dict:
+        return {'kind': self.kind, 'params': self.params(), 'state': self.get_state(), 'previous': self._previous}
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        indicator = cls(**data['params'])
+        indicator.set_state(data['state'])
+        indicator._previous = data['previous']
+        return indicator
+
+    @abstractmethod
+    def params(self) -> dict:
+        """Returns the constructor arguments, used by from_dict() to rebuild the indicator."""
+
+    @abstractmethod
+    def get_state(self) -> dict:
+        """Returns the full state as JSON-serializable values."""
+
+    @abstractmethod
+    def set_state(self, state: dict):
+        """Replaces the state with one returned by get_state()."""
+
+    @abstractmethod
+    def _step(self, close: float):
+        """Advances the state by one bar and returns the value for it."""
+
+
+class _EWM:
+    """pandas' ewm(adjust=False, ignore_na=False).mean() one observation at a time."""
+
+    def __init__(self, span: int, min_periods: int = 0):
+        self.alpha = 2 / (span + 1)
+        self.min_periods = max(min_periods, 1)
+        self.weighted = math.nan
+        self.old_weight = 1.0
+        self.observations = 0
+
+    def step(self, value: float) -> float:
+        is_observation = value == value
+        self.observations += is_observation
+        if self.weighted == self.weighted:
+            self.old_weight *= 1 - self.alpha
+            if is_observation:
+                if self.weighted != value:
+                    self.weighted = (self.old_weight * self.weighted + self.alpha * value) / (self.old_weight + self.alpha)
+                self.old_weight = 1.0
+        elif is_observation:
+            self.weighted = value
+        return self.weighted if self.observations >= self.min_periods else math.nan
+
+    def get_state(self) -> dict:
+        return {'weighted': self.weighted, 'old_weight': self.old_weight, 'observations': self.observations}
+
+    def set_state(self, state: dict):
+        self.weighted = state['weighted']
+        self.old_weight = state['old_weight']
+        self.observations = state['observations']
+
+
+class _RollingMean:
+    """rolling(window).mean() with a running sum; windows holding only zeros sum to exactly 0."""
+
+    def __init__(self, window: int):
+        self.window = window
+        self.values = deque()
+        self.total = 0.0
+        self.nans = 0
+        self.nonzero = 0
+
+    def step(self, value: float) -> float:
+        self.values.append(value)
+        self._add(value, 1)
+        if len(self.values) > self.window:
+            self._add(self.values.popleft(), -1)
+        if self.nonzero == 0:
+            self.total = 0.0
+        if len(self.values) < self.window or self.nans:
+            return math.nan
+        return self.total / self.window
+
+    def _add(self, value: float, sign: int):
+        if value != value:
+            self.nans += sign
+        else:
+            self.total += sign * value
+            self.nonzero += sign * (value != 0)
+
+    def get_state(self) -> dict:
+        return {'values': list(self.values), 'total': self.total, 'nans': self.nans, 'nonzero': self.nonzero}
+
+    def checkpoint(self) -> dict:
+        # step() appends a value and drops the oldest one once the window is full
+        dropped = self.values[0] if len(self.values) >= self.window else None
+        return {'dropped': dropped, 'total': self.total, 'nans': self.nans, 'nonzero': self.nonzero}
+
+    def restore(self, checkpoint: dict):
+        self.values.pop()
+        if checkpoint['dropped'] is not None:
+            self.values.appendleft(checkpoint['dropped'])
+        self.total = checkpoint['total']
+        self.nans = checkpoint['nans']
+        self.nonzero = checkpoint['nonzero']
+
+    def set_state(self, state: dict):
+        self.values = deque(state['values'])
+        self.total = state['total']
+        self.nans = state['nans']
+        self.nonzero = state['nonzero']
+
+
+class StreamingEMA(StreamingIndicator):
+    """Streaming calculate_ema."""
+
+    kind = 'EMA'
+
+    def __init__(self, period: int):
+        super().__init__()
+        self.period = period
+        self._ewm = _EWM(period)
+
+    def params(self) -> dict:
+        return {'period': self.period}
+
+    def get_state(self) -> dict:
+        return {'ewm': self._ewm.get_state(), 'value': self.value}
+
+    def set_state(self, state: dict):
+        self._ewm.set_state(state['ewm'])
+        self.value = state['value']
+
+    def _step(self, close: float):
+        return self._ewm.step(close)
+
+
+class StreamingSMA(StreamingIndicator):
+    """Streaming calculate_sma."""
+
+    kind = 'SMA'
+
+    def __init__(self, period: int):
+        super().__init__()
+        self.period = period
+        self._mean = _RollingMean(period)
+
+    def params(self) -> dict:
+        return {'period': self.period}
+
+    def get_state(self) -> dict:
+        return {'mean': self._mean.get_state(), 'value': self.value}
+
+    def set_state(self, state: dict):
+        self._mean.set_state(state['mean'])
+        self.value = state['value']
+
+    def checkpoint(self) -> dict:
+        return {'mean': self._mean.checkpoint(), 'value': self.value}
+
+    def restore(self, checkpoint: dict):
+        self._mean.restore(checkpoint['mean'])
+        self.value = checkpoint['value']
+
+    def _step(self, close: float):
+        return self._mean.step(close)
+
+
+class StreamingRSI(StreamingIndicator):
+    """Streaming calculate_rsi."""
+
+    kind = 'RSI'
+
+    def __init__(self, period: int = 14):
+        super().__init__()
+        self.period = period
+        self.last_close = math.nan
+        self._gain = _RollingMean(period)
+        self._loss = _RollingMean(period)
+
+    def params(self) -> dict:
+        return {'period': self.period}
+
+    def get_state(self) -> dict:
+        return {'last_close': self.last_close, 'gain': self._gain.get_state(),
+                'loss': self._loss.get_state(), 'value': self.value}
+
+    def set_state(self, state: dict):
+        self.last_close = state['last_close']
+        self._gain.set_state(state['gain'])
+        self._loss.set_state(state['loss'])
+        self.value = state['value']
+
+    def checkpoint(self) -> dict:
+        return {'last_close': self.last_close, 'gain': self._gain.checkpoint(),
+                'loss': self._loss.checkpoint(), 'value': self.value}
+
+    def restore(self, checkpoint: dict):
+        self.last_close = checkpoint['last_close']
+        self._gain.restore(checkpoint['gain'])
+        self._loss.restore(checkpoint['loss'])
+        self.value = checkpoint['value']
+
+    def _step(self, close: float):
+        delta = close - self.last_close
+        self.last_close = close
+        # Like delta.where(delta > 0, 0): a NaN delta counts as no gain and no loss
+        gain = self._gain.step(delta if delta > 0 else 0.0)
+        loss = self._loss.step(-delta if delta < 0 else 0.0)
+        if gain != gain or loss != loss:
+            return math.nan
+        if loss == 0:
+            return math.nan if gain == 0 else 100.0
+        return 100 - (100 / (1 + gain / loss))
+
+
+class StreamingMACD(StreamingIndicator):
+    """Streaming calculate_macd, value is a dict with 'MACD', 'Signal' and 'Histogram'."""
+
+    kind = 'MACD'
+
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+        super().__init__()
+        self.fast_period = fast_period
+        self.slow_period = slow_period
+        self.signal_period = signal_period
+        self._fast = _EWM(fast_period, min_periods=fast_period)
+        self._slow = _EWM(slow_period, min_periods=slow_period)
+        self._signal = _EWM(signal_period, min_periods=signal_period)
+        self.value = {'MACD': math.nan, 'Signal': math.nan, 'Histogram': math.nan}
+
+    def params(self) -> dict:
+        return {'fast_period': self.fast_period, 'slow_period': self.slow_period, 'signal_period': self.signal_period}
+
+    def get_state(self) -> dict:
+        return {'fast': self._fast.get_state(), 'slow': self._slow.get_state(),
+                'signal': self._signal.get_state(), 'value': dict(self.value)}
+
+    def set_state(self, state: dict):
+        self._fast.set_state(state['fast'])
+        self._slow.set_state(state['slow'])
+        self._signal.set_state(state['signal'])
+        self.value = dict(state['value'])
+
+    def _step(self, close: float):
+        macd = self._fast.step(close) - self._slow.step(close)
+        signal = self._signal.step(macd)
+        return {'MACD': macd, 'Signal': signal, 'Histogram': macd - signal}
+
+
+STREAMING_INDICATORS = {cls.kind: cls for cls in (StreamingEMA, StreamingSMA, StreamingRSI, StreamingMACD)}
+MACD_COLUMNS = ('MACD', 'Signal', 'Histogram')
+
+
+class IndicatorSet:
+    """
+    The streaming indicators behind a set of indicator columns named like calculate_indicators
+    names them ('EMA_200', 'RSI_14', 'MACD', ...), updated together from the Close of each bar.
+    """
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.indicators = {}
+        for column in self.columns:
+            name, _, period = column.partition('_')
+            if column in MACD_COLUMNS:
+                self.indicators.setdefault('MACD', StreamingMACD())
+            elif name in ('EMA', 'SMA', 'RSI') and period.isdigit():
+                self.indicators[column] = STREAMING_INDICATORS[name](int(period))
+            else:
+                raise ValueError(f"Unknown indicator column '{column}'")
+
+    def seed(self, data: pd.DataFrame, column: str = 'Close') -> pd.DataFrame:
+        """Feeds the history in data and returns the indicator columns for every bar."""
+        rows = [self.update(close) for close in data[column].to_numpy(dtype=float)]
+        return pd.DataFrame(rows, index=data.index, columns=self.columns)
+
+    def update(self, close: float) -> dict:
+        """Adds the next bar and returns the indicator values for it by column."""
+        for indicator in self.indicators.values():
+            indicator.update(close)
+        return self.values()
+
+    def amend(self, close: float) -> dict:
+        """Revises the latest bar and returns the revised indicator values by column."""
+        for indicator in self.indicators.values():
+            indicator.amend(close)
+        return self.values()
+
+    def values(self) -> dict:
+        values = {}
+        for column in self.columns:
+            if column in MACD_COLUMNS:
+                values[column] = self.indicators['MACD'].value[column]
+            else:
+                values[column] = self.indicators[column].value
+        return values
+
+    def to_dict(self) -> dict:
+        return {'columns': self.columns, 'indicators': {key: indicator.to_dict() for key, indicator in self.indicators.items()}}
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        indicator_set = cls(data['columns'])
+        indicator_set.indicators = {
+            key: STREAMING_INDICATORS[state['kind']].from_dict(state) for key, state in data['indicators'].items()
+        }
+        return indicator_set
+
+    def save(self, path: str):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str):
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
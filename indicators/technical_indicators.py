@@ -1,5 +1,4 @@
 import pandas as pd
-import ta
 
 def calculate_ema(data: pd.DataFrame, period: int, column: str = 'Close') -> pd.Series:
     """
@@ -49,9 +48,6 @@ def calculate_rsi(data: pd.DataFrame, period: int = 14, column: str = 'Close') -
     rsi = 100 - (100 / (1 + rs))
     return rsi
 
-import pandas as pd
-import ta
-
 # (Your existing calculate_ema, calculate_sma, calculate_rsi functions)
 
 def calculate_macd(data: pd.DataFrame, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9, column: str = 'Close') -> pd.DataFrame:
@@ -68,6 +64,8 @@ def calculate_macd(data: pd.DataFrame, fast_period: int = 12, slow_period: int =
     Returns:
         pd.DataFrame: DataFrame with 'MACD', 'Signal', and 'Histogram' columns.
     """
+    import ta  # Imported lazily to keep headless startup fast
+
     macd_indicator = ta.trend.MACD(data[column], window_fast=fast_period, window_slow=slow_period, window_sign=signal_period)
     macd = macd_indicator.macd()
     signal = macd_indicator.macd_signal()
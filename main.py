@@ -0,0 +1,280 @@
+"""
+Headless entry point for running signal scans without Streamlit.
+
+    python main.py scan --universe nifty200 --timeframes 1d,1wk --as-of 2025-07-24 --output signals.csv
+    python main.py sweep --strategy "EMA Crossover" --grid short_period=10,20 --grid long_period=50,100
+    python main.py live --universe nifty50 --timeframes 1d,1wk --poll-interval 60 --output live.csv
+    python main.py cube --universe nifty200 --interval 1d
+"""
+import argparse
+import functools
+import os
+import sys
+from datetime import datetime
+
+OUTPUT_FORMATS = ('csv', 'json', 'parquet')
+
+
+def parse_timeframes(value):
+    """Map a comma separated list of intervals ('1d,1wk') or timeframe names ('1 Day') to TIMEFRAMES names"""
+    from utils.constants import TIMEFRAMES
+
+    names_by_interval = {interval: name for name, (interval, _) in TIMEFRAMES.items()}
+    timeframes = []
+    for item in (part.strip() for part in value.split(',')):
+        if item in TIMEFRAMES:
+            timeframes.append(item)
+        elif item in names_by_interval:
+            timeframes.append(names_by_interval[item])
+        else:
+            raise argparse.ArgumentTypeError(f"Unknown timeframe '{item}', expected one of {sorted(names_by_interval)}")
+    return timeframes
+
+
+def parse_date(value):
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid date '{value}', expected YYYY-MM-DD")
+
+
+def get_universe(args):
+    from utils.constants import nifty_50_tickers_yfinance, nifty_200_tickers_yfinance
+
+    if args.tickers:
+        return [ticker.strip() for ticker in args.tickers.split(',') if ticker.strip()]
+    if args.universe == 'nifty50':
+        return nifty_50_tickers_yfinance
+    return nifty_200_tickers_yfinance
+
+
+def write_results(results, output, output_format):
+    import pandas as pd
+
+    if output is None:
+        results.to_csv(sys.stdout, index=False)
+        return
+
+    output_format = output_format or os.path.splitext(output)[1].lstrip('.').lower()
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Cannot infer an output format from '{output}', pass --format")
+    if output_format == 'csv':
+        results.to_csv(output, index=False)
+    elif output_format == 'json':
+        results.to_json(output, orient='records', indent=2)
+    else:
+        results.to_parquet(output, index=False)
+
+
+def parse_grid_param(value):
+    """Parse 'short_period=10,20,30' into ('short_period', [10, 20, 30])"""
+    name, sep, values = value.partition('=')
+    if not sep or not values:
+        raise argparse.ArgumentTypeError(f"Invalid grid '{value}', expected name=value1,value2")
+    parsed = []
+    for item in values.split(','):
+        try:
+            parsed.append(int(item))
+        except ValueError:
+            try:
+                parsed.append(float(item))
+            except ValueError:
+                raise argparse.ArgumentTypeError(f"Invalid value '{item}' for {name}")
+    return name.strip(), parsed
+
+
+def run_scan(args):
+    import pandas as pd
+    from config.strategy_config import STRATEGY_CONFIG
+    from utils.date_utils import get_current_time
+    from utils.data_fetching import fetch_stock_data, fetch_stocks_data
+    from utils.scan_engine import scan_tickers, scan_panel, panel_supported
+    from utils.signals import prefetch_stock_data, build_signal_row
+    from utils.profiling import profiler
+    from utils.logger import get_logger
+
+    log = get_logger(__name__)
+    profiler.enabled = bool(args.profile)
+    stock_tickers = get_universe(args)
+    selected_timeframes = [tf for tf in args.timeframes if tf in STRATEGY_CONFIG]
+    for timeframe in set(args.timeframes) - set(selected_timeframes):
+        log.warning(f"No strategies configured for {timeframe}, skipping it")
+    # An explicit --as-of date stands for that whole day, the default is now so that a scan run
+    # after the close includes today's session
+    as_of_date = args.as_of or get_current_time()
+    if args.compact:
+        fetch_stock_data = functools.partial(fetch_stock_data, compact=True)
+        fetch_stocks_data = functools.partial(fetch_stocks_data, compact=True)
+
+    fetched_data = {}
+    prefetch_stock_data(stock_tickers, selected_timeframes, fetched_data, as_of_date, fetch=fetch_stocks_data)
+    if panel_supported(selected_timeframes):
+        scan_results = scan_panel(stock_tickers, selected_timeframes, fetched_data, as_of_date, fetch=fetch_stocks_data)
+    else:
+        scan_results = scan_tickers(stock_tickers, selected_timeframes, fetched_data, as_of_date,
+                                    fetch_workers=args.fetch_workers, compute_workers=args.workers, fetch=fetch_stock_data)
+    rows = []
+    for signals_for_ticker, latest_close_1d, all_data_fetched in scan_results:
+        row = build_signal_row(signals_for_ticker, latest_close_1d, all_data_fetched, selected_timeframes)
+        if row is not None:
+            rows.append(row)
+
+    ticker_order = {ticker: i for i, ticker in enumerate(stock_tickers)}
+    rows.sort(key=lambda row: ticker_order[row['Ticker']])
+    results = pd.DataFrame(rows, columns=None if rows else ['Ticker'])
+    write_results(results, args.output, args.format)
+    log.info(f"Scanned {len(stock_tickers)} tickers as of {as_of_date}, {len(rows)} with signals")
+    if args.profile:
+        profiler.write_report(args.profile)
+        log.info(f"Wrote profiling report to {args.profile}")
+    return 0
+
+
+def run_sweep(args):
+    from backtesting.sweep import run_parameter_sweep
+    from config.strategy_config import STRATEGIES
+    from utils.constants import TIMEFRAMES
+    from utils.data_fetching import fetch_stocks_data
+    from utils.logger import get_logger
+
+    log = get_logger(__name__)
+    strategy = next((strategy for strategy in STRATEGIES if strategy['name'] == args.strategy), None)
+    if strategy is None:
+        raise ValueError(f"Unknown strategy '{args.strategy}', expected one of {[s['name'] for s in STRATEGIES]}")
+
+    interval, period = TIMEFRAMES[args.timeframe[0]]
+    stocks_data = fetch_stocks_data(get_universe(args), period=period, interval=interval, as_of_date=args.as_of)
+    results = run_parameter_sweep(stocks_data, strategy['function'], dict(args.grid), strategy.get('indicators'),
+                                  max_workers=args.workers, rank_by=args.rank_by)
+    write_results(results, args.output, args.format)
+    log.info(f"Swept {len(results)} parameter combinations of {args.strategy} over {len(stocks_data)} tickers")
+    return 0
+
+
+def run_live(args):
+    from config.strategy_config import STRATEGY_CONFIG
+    from utils.live import LiveScanner, run_live_scan
+    from utils.logger import get_logger
+
+    log = get_logger(__name__)
+    selected_timeframes = [tf for tf in args.timeframes if tf in STRATEGY_CONFIG]
+    for timeframe in set(args.timeframes) - set(selected_timeframes):
+        log.warning(f"No strategies configured for {timeframe}, skipping it")
+
+    def on_update(scanner, changed):
+        write_results(scanner.results(), args.output, args.format)
+        log.info(f"Updated signals, {len(changed)} tickers re-evaluated")
+
+    run_live_scan(LiveScanner(get_universe(args), selected_timeframes), args.poll_interval, on_update)
+    return 0
+
+
+def run_cube(args):
+    from utils.constants import TIMEFRAMES
+    from utils.data_fetching import load_stocks_data
+    from utils.price_cube import build_price_cube
+
+    stock_tickers = get_universe(args)
+    if not args.no_fetch:
+        # Top up the bar store the cube is built from
+        period = args.period or next(period for interval, period in TIMEFRAMES.values() if interval == args.interval)
+        load_stocks_data(stock_tickers, period=period, interval=args.interval)
+    build_price_cube(stock_tickers, interval=args.interval, root=args.root)
+    return 0
+
+
+def add_universe_arguments(parser, as_of=True):
+    parser.add_argument('--universe', choices=['nifty200', 'nifty50'], default='nifty200',
+                        help="Ticker universe to scan (default: nifty200)")
+    parser.add_argument('--tickers', help="Comma separated tickers to use instead of a universe")
+    if as_of:
+        parser.add_argument('--as-of', type=parse_date, default=None,
+                            help="Use data as of this date, YYYY-MM-DD (default: today)")
+    parser.add_argument('--output', '-o', help="Output file, results are written to stdout as CSV if omitted")
+    parser.add_argument('--format', choices=OUTPUT_FORMATS,
+                        help="Output format (default: inferred from the output file extension)")
+
+
+def build_parser():
+    from utils.scan_engine import DEFAULT_FETCH_WORKERS, DEFAULT_COMPUTE_WORKERS
+    from utils.live import DEFAULT_POLL_INTERVAL
+
+    parser = argparse.ArgumentParser(description="Cardinal Point signal scanner")
+    parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], default='INFO',
+                        help="Level of the log written to stderr (default: INFO)")
+    parser.add_argument('--replay', metavar='DIR',
+                        help="Read bars recorded in DIR (laid out like data/bars) instead of downloading them")
+    parser.add_argument('--replay-latency', type=float, default=0.0,
+                        help="Seconds every replayed download waits, to simulate the network (default: 0)")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    scan = subparsers.add_parser('scan', help="Scan a universe of tickers for strategy signals")
+    add_universe_arguments(scan)
+    scan.add_argument('--timeframes', type=parse_timeframes, default=parse_timeframes('1d'),
+                      help="Comma separated intervals or timeframe names, e.g. 1d,1wk (default: 1d)")
+    scan.add_argument('--workers', type=int, default=DEFAULT_COMPUTE_WORKERS,
+                      help="Processes evaluating indicators and strategies, 0 to evaluate in-process")
+    scan.add_argument('--fetch-workers', type=int, default=DEFAULT_FETCH_WORKERS,
+                      help="Threads fetching market data")
+    scan.add_argument('--profile', metavar='PATH', default=None,
+                      help="Time the scan's stages and write the report as JSON to PATH")
+    scan.add_argument('--compact', action='store_true',
+                      help="Hold the universe's bars as float32 prices, half the memory of full precision bars")
+    scan.set_defaults(handler=run_scan)
+
+    sweep = subparsers.add_parser('sweep', help="Backtest a grid of strategy parameters across a universe")
+    add_universe_arguments(sweep)
+    sweep.add_argument('--strategy', required=True, help="Strategy name from config/strategy_config, e.g. 'EMA Crossover'")
+    sweep.add_argument('--grid', type=parse_grid_param, action='append', required=True,
+                       help="Parameter values to try, e.g. --grid short_period=10,20 --grid long_period=50,100")
+    sweep.add_argument('--timeframe', type=parse_timeframes, default=parse_timeframes('1d'),
+                       help="Interval or timeframe name to backtest on (default: 1d)")
+    sweep.add_argument('--rank-by', default='average_profit_loss',
+                       choices=['total_trades', 'win_rate', 'average_profit_loss', 'total_return', 'max_drawdown'],
+                       help="Metric to rank the combinations by (default: average_profit_loss)")
+    sweep.add_argument('--workers', type=int, default=DEFAULT_COMPUTE_WORKERS,
+                       help="Worker processes, 0 to run in-process")
+    sweep.set_defaults(handler=run_sweep)
+
+    live = subparsers.add_parser('live', help="Keep the signal table current during market hours")
+    add_universe_arguments(live, as_of=False)
+    live.add_argument('--timeframes', type=parse_timeframes, default=parse_timeframes('1d'),
+                      help="Comma separated intervals or timeframe names, e.g. 1d,1wk (default: 1d)")
+    live.add_argument('--poll-interval', type=int, default=DEFAULT_POLL_INTERVAL,
+                      help=f"Seconds between polls of the forming bars (default: {DEFAULT_POLL_INTERVAL})")
+    live.set_defaults(handler=run_live)
+
+    cube = subparsers.add_parser('cube', help="Build the memory-mapped price cube of a universe from the bar store")
+    cube.add_argument('--universe', choices=['nifty200', 'nifty50'], default='nifty200',
+                      help="Ticker universe to include (default: nifty200)")
+    cube.add_argument('--tickers', help="Comma separated tickers to use instead of a universe")
+    cube.add_argument('--interval', choices=['1d', '1wk', '1mo'], default='1d', help="Bar interval (default: 1d)")
+    cube.add_argument('--period', help="History to fetch into the bar store first (default: the timeframe's period)")
+    cube.add_argument('--no-fetch', action='store_true', help="Build from the bar store as it is, without fetching")
+    cube.add_argument('--root', help="Directory of the cube (default: data/cube/<interval>)")
+    cube.set_defaults(handler=run_cube)
+    return parser
+
+
+def main(argv=None):
+    from utils.logger import configure_logging
+
+    args = build_parser().parse_args(argv)
+    configure_logging(level=args.log_level)
+    if args.replay:
+        use_replay(args.replay, args.replay_latency)
+    return args.handler(args)
+
+
+def use_replay(root, latency):
+    import tempfile
+    from utils.bar_store import bar_store
+    from utils.data_sources import ReplayDataSource, set_data_source
+
+    set_data_source(ReplayDataSource(root, latency=latency))
+    # Keep replayed bars out of the real bar store
+    bar_store.root = tempfile.mkdtemp(prefix='cardinal-point-replay-')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,71 +1,98 @@
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 def identify_swing_points(data, window=10):
-    """Identify swing highs and lows in the data"""
-    highs = data['High']
-    lows = data['Low']
-    
+    """
+    Identify swing highs and lows in the data.
+
+    A bar is a swing high when its High is strictly greater than the High of each of the
+    `window` bars before and after it, and a swing low when its Low is strictly lower than
+    theirs. Bars without a full window on both sides are never swing points.
+    """
+    highs = data['High'].to_numpy(dtype=float)
+    lows = data['Low'].to_numpy(dtype=float)
+    n = len(data)
+
     # Initialize swing points
-    swing_highs = pd.Series(index=data.index, dtype=float)
-    swing_lows = pd.Series(index=data.index, dtype=float)
-    
-    for i in range(window, len(data) - window):
-        # Check for swing high
-        if all(highs[i] > highs[i-window:i]) and all(highs[i] > highs[i+1:i+window+1]):
-            swing_highs[i] = highs[i]
-        # Check for swing low
-        if all(lows[i] < lows[i-window:i]) and all(lows[i] < lows[i+1:i+window+1]):
-            swing_lows[i] = lows[i]
-    
-    return swing_highs, swing_lows
-
-def fibonacci_retracement_strategy(data: pd.DataFrame, window: int = 10, trend_periods: int = 12) -> pd.DataFrame:
+    swing_highs = np.full(n, np.nan)
+    swing_lows = np.full(n, np.nan)
+
+    if n > 2 * window:
+        centre = slice(window, n - window)
+        # Row j of a sliding view holds bars j..j+window-1, so for a centre bar i the bars
+        # before it are row i-window and the bars after it are row i+1.
+        high_windows = sliding_window_view(highs, window)
+        low_windows = sliding_window_view(lows, window)
+        before, after = slice(0, n - 2 * window), slice(window + 1, n - window + 1)
+
+        # NaNs propagate through max/min and fail the comparison, like they do bar by bar
+        is_swing_high = (highs[centre] > high_windows[before].max(axis=1, initial=-np.inf)) & \
+                        (highs[centre] > high_windows[after].max(axis=1, initial=-np.inf))
+        is_swing_low = (lows[centre] < low_windows[before].min(axis=1, initial=np.inf)) & \
+                       (lows[centre] < low_windows[after].min(axis=1, initial=np.inf))
+
+        swing_highs[centre] = np.where(is_swing_high, highs[centre], np.nan)
+        swing_lows[centre] = np.where(is_swing_low, lows[centre], np.nan)
+
+    return pd.Series(swing_highs, index=data.index), pd.Series(swing_lows, index=data.index)
+
+def fibonacci_retracement_strategy(data: pd.DataFrame, window: int = 10, trend_periods: int = 12, latest_only: bool = False) -> pd.DataFrame:
     """
     Identifies potential buy signals based on Fibonacci retracement levels.
     Specifically looks for touches of the 50% retracement level after an uptrend.
+
+    For every bar the highest swing high of the previous `trend_periods` bars is taken
+    together with the lowest low from that swing high up to the bar. The bar signals when
+    it touches the 50% level between the two and the closes of the previous
+    `trend_periods` bars were non-decreasing.
+
+    With latest_only only the final bar is evaluated, from the trailing bars its swing highs
+    depend on, and a single row is returned.
     """
-    swing_highs, swing_lows = identify_swing_points(data, window)
-    
-    # Initialize signal series
-    signal = pd.Series(False, index=data.index)
-    entry_level = pd.Series(index=data.index, dtype=float)
-    
-    # Look for the most recent valid swing high and low
-    for i in range(len(data) - 1, window, -1):
-        if i < trend_periods:
-            continue
-            
-        # Find the most recent swing high before current point
-        recent_high = swing_highs.iloc[i-trend_periods:i].max()
-        if pd.isna(recent_high):
-            continue
-            
-        # Find the subsequent low using iloc for integer-based indexing
-        high_idx = swing_highs.iloc[i-trend_periods:i].idxmax()
-        current_idx = data.index[i]
-        mask = (data.index >= high_idx) & (data.index <= current_idx)
-        subsequent_low = data.loc[mask, 'Low'].min()
-        
-        if pd.isna(subsequent_low) or recent_high <= subsequent_low:
-            continue
-        
+    if latest_only:
+        # Swing highs of the previous trend_periods bars need window bars before them
+        data = data.iloc[-(trend_periods + window + 1):]
+    swing_highs, _ = identify_swing_points(data, window)
+    n = len(data)
+
+    signal = np.zeros(n, dtype=bool)
+    entry_level = np.full(n, np.nan)
+
+    first = max(window + 1, trend_periods)
+    if trend_periods >= 1 and n > first:
+        highs = data['High'].to_numpy(dtype=float)
+        lows = data['Low'].to_numpy(dtype=float)
+        closes = data['Close'].to_numpy(dtype=float)
+        positions = np.arange(first, n)
+        rows = positions - trend_periods
+
+        # Most recent swing high: the first maximum of swing highs in bars i-trend_periods..i-1
+        high_windows = sliding_window_view(np.nan_to_num(swing_highs.to_numpy(), nan=-np.inf), trend_periods)[rows]
+        high_offset = high_windows.argmax(axis=1)
+        recent_high = high_windows[np.arange(len(rows)), high_offset]
+
+        # Subsequent low: the lowest Low from the swing high up to and including bar i
+        low_windows = sliding_window_view(np.nan_to_num(lows, nan=np.inf), trend_periods + 1)[rows]
+        after_high = np.arange(trend_periods + 1) >= high_offset[:, None]
+        subsequent_low = np.where(after_high, low_windows, np.inf).min(axis=1)
+
+        valid = np.isfinite(recent_high) & np.isfinite(subsequent_low) & (recent_high > subsequent_low)
+
         # Calculate Fibonacci levels
-        diff = recent_high - subsequent_low
-        fib_50 = subsequent_low + (diff * 0.5)
-        
-        # Check if current candle touches 50% level
-        current_candle = data.iloc[i]
-        touches_fib_50 = (current_candle['Low'] <= fib_50 <= current_candle['High'])
-        
-        # Additional confirmation: prior uptrend
-        prior_uptrend = data.iloc[i-trend_periods:i]['Close'].is_monotonic_increasing
-        
-        if touches_fib_50 and prior_uptrend:
-            signal.iloc[i] = True
-            entry_level.iloc[i] = current_candle['Close']
-    
-    return pd.DataFrame({
-        'signal': signal,
-        'entry_level': entry_level
+        fib_50 = subsequent_low + (recent_high - subsequent_low) * 0.5
+        touches_fib_50 = (lows[positions] <= fib_50) & (fib_50 <= highs[positions])
+
+        # Additional confirmation: prior uptrend, i.e. no falling close between bars i-trend_periods and i-1
+        falling = np.concatenate(([0], np.cumsum(~(closes[1:] >= closes[:-1]))))
+        prior_uptrend = (falling[positions - 1] - falling[rows]) == 0
+
+        hits = positions[valid & touches_fib_50 & prior_uptrend]
+        signal[hits] = True
+        entry_level[hits] = closes[hits]
+
+    result = pd.DataFrame({
+        'signal': pd.Series(signal, index=data.index),
+        'entry_level': pd.Series(entry_level, index=data.index)
     })
+    return result.tail(1) if latest_only else result
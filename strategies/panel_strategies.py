@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+
+# Panel variants of the strategies in swing_strategies.py. They take a BarPanel (bars x tickers
+# arrays, aligned on each ticker's latest bar) and return the 'signal' of every ticker as a
+# bars x tickers boolean matrix in one pass. As in the single-ticker versions the entry level
+# of a signal is the High of its bar.
+
+
+def previous_bar(values: np.ndarray) -> np.ndarray:
+    """Row-wise shift(1): the previous bar of every ticker, NaN for the first row."""
+    shifted = np.full_like(values, np.nan)
+    shifted[1:] = values[:-1]
+    return shifted
+
+
+def crosses_above(values: np.ndarray, reference: np.ndarray) -> np.ndarray:
+    return (values > reference) & (previous_bar(values) <= previous_bar(reference))
+
+
+def ema_crossover_long_panel(panel, short_period: int = 20, long_period: int = 50, volume_multiplier: float = 1.5) -> np.ndarray:
+    short_ema = panel[f'EMA_{short_period}']
+    long_ema = panel[f'EMA_{long_period}']
+    volume = panel['Volume']
+    average_volume = pd.DataFrame(volume).rolling(window=20).mean().to_numpy()
+    crossover = crosses_above(short_ema, long_ema)
+    volume_spike = volume > (volume_multiplier * average_volume)
+    return crossover & volume_spike
+
+
+def sma_price_crossover_long_panel(panel, sma_period: int = 50) -> np.ndarray:
+    return crosses_above(panel['Close'], panel[f'SMA_{sma_period}'])
+
+
+def rsi_oversold_reversal_long_panel(panel, rsi_period: int = 14, oversold_level: int = 30) -> np.ndarray:
+    rsi = panel[f'RSI_{rsi_period}']
+    return (rsi > oversold_level) & (previous_bar(rsi) <= oversold_level)
+
+
+def macd_crossover_long_panel(panel) -> np.ndarray:
+    return crosses_above(panel['MACD'], panel['Signal'])
+
+
+def ema_200_weekly_breakout_panel(panel) -> np.ndarray:
+    close, ema_200 = panel['Close'], panel['EMA_200']
+    # Bars of every ticker up to and including each row, the padding counts as none
+    rows = np.arange(1, len(close) + 1)[:, None]
+    bar_count = rows - (len(close) - panel.lengths)[None, :]
+    return (
+        (bar_count >= 200)
+        & (close > ema_200)
+        & ((panel['Open'] <= ema_200) | (panel['Low'] <= ema_200))
+        & (close > panel['Open'])
+    )
@@ -1,65 +1,76 @@
 import pandas as pd
 
-def ema_crossover_long(data: pd.DataFrame, short_period: int = 20, long_period: int = 50, volume_multiplier: float = 1.5) -> pd.DataFrame:
+# Strategies take latest_only=True when only the signal on the final bar is consumed, as in the
+# scanner. They then evaluate just the trailing bars that decision depends on and return a
+# single row; indicator columns are computed over the full history beforehand either way.
+
+def latest_bars(data, bars: int, latest_only: bool):
+    """The trailing bars needed to decide the latest signal, or all of data for full evaluation"""
+    return data.iloc[-bars:] if latest_only else data
+
+def ema_crossover_long(data: pd.DataFrame, short_period: int = 20, long_period: int = 50, volume_multiplier: float = 1.5, latest_only: bool = False) -> pd.DataFrame:
     short_ema_col = f'EMA_{short_period}'
     long_ema_col = f'EMA_{long_period}'
     if short_ema_col not in data.columns or long_ema_col not in data.columns or 'Volume' not in data.columns:
         raise ValueError(...)
+    # The 20 bar average volume is the longest lookback
+    data = latest_bars(data, 20, latest_only)
     average_volume = data['Volume'].rolling(window=20).mean()
     crossover = (data[short_ema_col] > data[long_ema_col]) & (data[short_ema_col].shift(1) <= data[long_ema_col].shift(1))
     volume_spike = data['Volume'] > (volume_multiplier * average_volume)
     signal = crossover & volume_spike
     entry_level = data['High'][signal]
-    return pd.DataFrame({'signal': signal, 'entry_level': entry_level})
+    result = pd.DataFrame({'signal': signal, 'entry_level': entry_level})
+    return result.tail(1) if latest_only else result
 
-def sma_price_crossover_long(data: pd.DataFrame, sma_period: int = 50) -> pd.DataFrame:
+def sma_price_crossover_long(data: pd.DataFrame, sma_period: int = 50, latest_only: bool = False) -> pd.DataFrame:
     sma_col = f'SMA_{sma_period}'
     if sma_col not in data.columns or 'Close' not in data.columns:
         raise ValueError(...)
+    data = latest_bars(data, 2, latest_only)
     crossover = (data['Close'] > data[sma_col]) & (data['Close'].shift(1) <= data[sma_col].shift(1))
     signal = crossover
     entry_level = data['High'][signal]
-    return pd.DataFrame({'signal': signal, 'entry_level': entry_level})
+    result = pd.DataFrame({'signal': signal, 'entry_level': entry_level})
+    return result.tail(1) if latest_only else result
 
-def rsi_oversold_reversal_long(data: pd.DataFrame, rsi_period: int = 14, oversold_level: int = 30) -> pd.DataFrame:
+def rsi_oversold_reversal_long(data: pd.DataFrame, rsi_period: int = 14, oversold_level: int = 30, latest_only: bool = False) -> pd.DataFrame:
     rsi_col = f'RSI_{rsi_period}'
     if rsi_col not in data.columns:
         raise ValueError(...)
+    data = latest_bars(data, 2, latest_only)
     reversal = (data[rsi_col] > oversold_level) & (data[rsi_col].shift(1) <= oversold_level)
     signal = reversal
     entry_level = data['High'][signal]
-    return pd.DataFrame({'signal': signal, 'entry_level': entry_level})
+    result = pd.DataFrame({'signal': signal, 'entry_level': entry_level})
+    return result.tail(1) if latest_only else result
 
-def macd_crossover_long(data: pd.DataFrame) -> pd.DataFrame:
+def macd_crossover_long(data: pd.DataFrame, latest_only: bool = False) -> pd.DataFrame:
     if 'MACD' not in data.columns or 'Signal' not in data.columns:
         raise ValueError(...)
+    data = latest_bars(data, 2, latest_only)
     crossover = (data['MACD'] > data['Signal']) & (data['MACD'].shift(1) <= data['Signal'].shift(1))
     signal = crossover
     entry_level = data['High'][signal]
-    return pd.DataFrame({'signal': signal, 'entry_level': entry_level})
+    result = pd.DataFrame({'signal': signal, 'entry_level': entry_level})
+    return result.tail(1) if latest_only else result
 
-def ema_200_weekly_breakout(data: pd.DataFrame):
+def ema_200_weekly_breakout(data: pd.DataFrame, latest_only: bool = False):
     """
-    Generates a buy signal if the last weekly close is above the 200-week EMA,
-    but only if we have at least 200 data points.
+    Generates a buy signal on every bar that closes above the 200-week EMA after opening or
+    trading at or below it, but only once there are at least 200 bars up to that bar.
     """
-    # Check if we have enough data points
-    if len(data) < 200:
-        return pd.DataFrame({
-            'signal': pd.Series(False, index=data.index),
-            'entry_level': pd.Series(index=data.index, dtype=float),
-            'EMA_200': data['EMA_200']
-        })
-    
-    open = data['Open'].iloc[-1]
-    close = data['Close'].iloc[-1]
-    low = data['Low'].iloc[-1]
-    ema_200 = data['EMA_200'].iloc[-1]
-    signal = (close > ema_200) and (open <= ema_200 or low <= ema_200) and (close > open)
-    
-    data['signal'] = False
-    if signal:
-        data.loc[data.index[-1], 'signal'] = True
-    data['entry_level'] = data['Close'].where(data['signal'])
-    
-    return data[['signal', 'entry_level', 'EMA_200']]
\ No newline at end of file
+    # Number of bars up to and including each bar
+    bar_count = pd.Series(range(1, len(data) + 1), index=data.index)
+    data = latest_bars(data, 1, latest_only)
+    bar_count = latest_bars(bar_count, 1, latest_only)
+
+    ema_200 = data['EMA_200']
+    signal = (
+        (bar_count >= 200)
+        & (data['Close'] > ema_200)
+        & ((data['Open'] <= ema_200) | (data['Low'] <= ema_200))
+        & (data['Close'] > data['Open'])
+    )
+    entry_level = data['Close'].where(signal)
+    return pd.DataFrame({'signal': signal, 'entry_level': entry_level, 'EMA_200': ema_200})
\ No newline at end of file
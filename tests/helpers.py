@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+
+# Deterministic synthetic bars shared by the tests and benchmarks/fixtures.py, so neither needs the network.
+
+
+def make_ohlcv(bars=None, seed=0, freq='B', start=None, end=None, index=None, price=100.0, volatility=0.02,
+               trend=0.0, decimals=None, adj_close=False) -> pd.DataFrame:
+    """
+    Returns OHLCV bars whose closes follow a geometric random walk.
+
+    The dates are index when given, otherwise a date_range of freq with bars periods from start
+    (2020-01-01 by default) or up to end, or every period between start and end. trend is the
+    drift per bar, a scalar or one value per bar. decimals rounds the prices, which creates ties
+    like quoted prices do.
+    """
+    if index is None:
+        if start is None and end is None:
+            start = '2020-01-01'
+        index = pd.date_range(start=start, end=end, periods=bars, freq=freq, name='Date')
+    rng = np.random.default_rng(seed)
+    length = len(index)
+    close = price * np.exp(np.cumsum(trend + rng.normal(0, volatility, length)))
+    open = close * (1 + rng.normal(0, volatility / 3, length))
+    high = np.maximum(open, close) * (1 + rng.random(length) * volatility / 2)
+    low = np.minimum(open, close) * (1 - rng.random(length) * volatility / 2)
+    prices = {'Open': open, 'High': high, 'Low': low, 'Close': close}
+    if adj_close:
+        prices['Adj Close'] = close
+    if decimals is not None:
+        prices = {column: values.round(decimals) for column, values in prices.items()}
+    return pd.DataFrame({**prices, 'Volume': rng.integers(10**5, 10**7, length).astype(float)}, index=index)
@@ -0,0 +1,100 @@
+import unittest
+import numpy as np
+import pandas as pd
+from scipy.signal import argrelextrema
+from backtesting.backtester import SupportResistanceTracker, backtest_strategy
+from backtesting.portfolio import build_signal_panel, backtest_portfolio
+from tests.helpers import make_ohlcv
+
+
+def reference_backtest_strategy(data, strategy):
+    """The original per-bar loop without the unused support/resistance recomputation"""
+    signals = strategy(data)['signal']
+    positions = pd.Series(0, index=data.index)
+    in_position = False
+    entry_price = 0
+    trades = []
+
+    for i in data.index:
+        current_price = data['Close'].loc[i]
+        if i in signals.index:
+            if signals.loc[i] and not in_position:
+                positions.loc[i] = 1
+                in_position = True
+                entry_price = data['Close'].loc[i]
+            elif in_position:
+                if not signals.loc[i]:
+                    positions.loc[i] = 0
+                    in_position = False
+                    exit_price = current_price
+                    trades.append({'entry_date': positions[positions == 1].index[-1], 'entry_price': entry_price, 'exit_date': i, 'exit_price': exit_price, 'profit_loss_percentage': (exit_price - entry_price) / entry_price, 'absolute_profit_loss': exit_price - entry_price, 'exit_reason': 'Resistance'})
+                    entry_price = 0
+        elif in_position:
+            positions.loc[i] = 1
+        else:
+            positions.loc[i] = 0
+
+    return positions, pd.DataFrame(trades)
+
+
+def close_above_average(data):
+    signal = data['Close'] > data['Close'].rolling(10).mean()
+    return pd.DataFrame({'signal': signal, 'entry_level': data['Close'].where(signal)})
+
+
+class TestSupportResistanceTracker(unittest.TestCase):
+
+    def test_matches_argrelextrema_for_confirmed_bars(self):
+        data = make_ohlcv(600, seed=1, decimals=1)
+        lookahead = 20
+        tracker = SupportResistanceTracker(lookahead)
+        for high, low in zip(data['High'], data['Low']):
+            tracker.update(high, low)
+
+        # Bars in the last lookahead positions are not confirmed yet, leave them out of the reference
+        confirmed = len(data) - lookahead
+        min_indices = argrelextrema(data['Low'].values, np.less_equal, order=lookahead)[0]
+        max_indices = argrelextrema(data['High'].values, np.greater_equal, order=lookahead)[0]
+        expected_support = data['Low'].iloc[min_indices[min_indices < confirmed]].unique()
+        expected_resistance = data['High'].iloc[max_indices[max_indices < confirmed]].unique()
+        self.assertEqual(tracker.support_levels, list(expected_support))
+        self.assertEqual(tracker.resistance_levels, list(expected_resistance))
+        self.assertGreater(len(tracker.support_levels), 0)
+
+
+class TestBacktestStrategy(unittest.TestCase):
+
+    def test_matches_reference_loop(self):
+        data = make_ohlcv(1000, seed=2)
+        positions, trades = backtest_strategy(data, close_above_average)
+        expected_positions, expected_trades = reference_backtest_strategy(data, close_above_average)
+
+        pd.testing.assert_series_equal(positions, expected_positions)
+        self.assertGreater(len(trades), 0)
+        pd.testing.assert_frame_equal(trades[expected_trades.columns], expected_trades)
+        self.assertIn('resistance_level', trades.columns)
+
+
+class TestBacktestPortfolio(unittest.TestCase):
+
+    def test_trades_match_per_ticker_backtests(self):
+        stocks_data = {f"T{i}.NS": make_ohlcv(800 - 40 * i, seed=i) for i in range(5)}
+        # A gap in one ticker's history must keep its position like backtest_strategy does
+        gapped = stocks_data["T1.NS"]
+        stocks_data["T1.NS"] = gapped.drop(gapped.index[200:220])
+
+        closes, signals = build_signal_panel(stocks_data, close_above_average)
+        trades, equity_curve, metrics = backtest_portfolio(closes, signals)
+
+        for ticker, data in stocks_data.items():
+            _, expected = backtest_strategy(data, close_above_average)
+            actual = trades[trades['ticker'] == ticker].drop(columns='ticker').reset_index(drop=True)
+            pd.testing.assert_frame_equal(actual, expected[actual.columns], check_dtype=False)
+
+        self.assertEqual(metrics['total_trades'], len(trades))
+        self.assertEqual(len(equity_curve), len(closes))
+        self.assertLessEqual(metrics['max_drawdown'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
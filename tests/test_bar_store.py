@@ -0,0 +1,105 @@
+import unittest
+import tempfile
+from datetime import datetime
+from unittest import mock
+import numpy as np
+import pandas as pd
+from tests.helpers import make_ohlcv
+from utils.bar_store import BarStore, slice_bars
+from utils.data_fetching import load_stocks_data
+
+
+class TestBarStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = BarStore(self.tmp_dir.name)
+        # The source's bars from 2024-01-01 to 2024-03-01, downloads are slices of them
+        self.history = make_ohlcv(45, start='2024-01-01')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_missing_windows_without_data(self):
+        start, end = pd.Timestamp(2024, 1, 1), pd.Timestamp(2024, 2, 1)
+        self.assertEqual(self.store.missing_windows(None, start, end), [(start, end)])
+
+    def test_covered_request_is_answered_from_disk(self):
+        start, end = pd.Timestamp(2024, 1, 1), pd.Timestamp(2024, 3, 1)
+        data = self.store.merge("ABB.NS", "1d", None, self.history.iloc[:43], start, end)
+        stored = self.store.read("ABB.NS", "1d")
+        self.assertEqual(len(stored), len(data))
+        self.assertEqual(self.store.missing_windows(stored, pd.Timestamp(2024, 1, 15), pd.Timestamp(2024, 2, 1)), [])
+
+    def test_top_up_only_fetches_newer_bars(self):
+        # Stored on 2024-01-31 during the session, so its last bar was still forming
+        start, end = pd.Timestamp(2024, 1, 1), pd.Timestamp(2024, 1, 31)
+        stored = self.store.merge("ABB.NS", "1d", None, self.history.iloc[:23], start, end)
+        windows = self.store.missing_windows(stored, start, pd.Timestamp(2024, 3, 1))
+        self.assertEqual(windows, [(stored.index[-1], pd.Timestamp(2024, 3, 1))])
+
+        top_up = self.history.iloc[22:44].copy()
+        top_up['Close'] = 3.0
+        merged = self.store.merge("ABB.NS", "1d", stored, top_up, *windows[0])
+        self.assertEqual(len(merged), 23 + 21)
+        self.assertEqual(merged.loc[stored.index[-1], 'Close'], 3.0)
+        self.assertEqual(pd.Timestamp(merged.attrs['through']), pd.Timestamp(2024, 3, 1))
+
+    def test_empty_download_still_extends_the_window(self):
+        start, end = pd.Timestamp(2024, 1, 1), pd.Timestamp(2024, 2, 1)
+        stored = self.store.merge("ABB.NS", "1d", None, self.history.iloc[:23], start, end)
+        merged = self.store.merge("ABB.NS", "1d", stored, None, stored.index[-1], pd.Timestamp(2024, 2, 10))
+        self.assertEqual(len(merged), 23)
+        self.assertEqual(pd.Timestamp(self.store.read("ABB.NS", "1d").attrs['through']), pd.Timestamp(2024, 2, 10))
+        self.assertEqual(self.store.missing_windows(merged, start, pd.Timestamp(2024, 2, 10)), [])
+
+    def test_open_ended_download_is_complete_through_today(self):
+        start = pd.Timestamp(2024, 1, 1)
+        stored = self.store.merge("ABB.NS", "1d", None, self.history.iloc[:23], start, pd.Timestamp(2024, 2, 1))
+        with mock.patch('utils.bar_store.get_current_time', return_value=datetime(2024, 2, 5, 11, 0)):
+            merged = self.store.merge("ABB.NS", "1d", stored, self.history.iloc[:0], stored.index[-1])
+        self.assertEqual(pd.Timestamp(merged.attrs['through']), pd.Timestamp(2024, 2, 5))
+
+    def test_revised_history_is_not_spliced(self):
+        start, end = pd.Timestamp(2024, 1, 1), pd.Timestamp(2024, 2, 1)
+        stored = self.store.merge("ABB.NS", "1d", None, self.history.iloc[:23], start, end)
+        top_up = self.history.iloc[22:27].copy()
+        top_up[['Open', 'High', 'Low', 'Close']] *= 0.5
+        self.assertTrue(self.store.is_revised(stored, top_up))
+        self.assertFalse(self.store.is_revised(stored, self.history.iloc[22:27]))
+
+        with self.assertLogs('utils.bar_store', level='WARNING'):
+            merged = self.store.merge("ABB.NS", "1d", stored, top_up, stored.index[-1], pd.Timestamp(2024, 2, 8))
+        pd.testing.assert_frame_equal(merged, top_up, check_freq=False)
+        self.assertEqual(pd.Timestamp(merged.attrs['covered_from']), stored.index[-1])
+
+    def test_revised_history_is_refetched(self):
+        start = pd.Timestamp(2024, 1, 1)
+        stored = self.store.merge("ABB.NS", "1d", None, self.history.iloc[:23], start, pd.Timestamp(2024, 2, 1))
+        # A 2:1 split since the bars were stored, the source now serves the whole history halved
+        adjusted = self.history.copy()
+        adjusted[['Open', 'High', 'Low', 'Close']] *= 0.5
+
+        def download(tickers, interval, fetch_start, fetch_end=None):
+            return {tickers[0]: slice_bars(adjusted, fetch_start, fetch_end)}
+
+        now = datetime(2024, 2, 27, 11, 0)
+        with mock.patch('utils.data_fetching.download_stocks_data', side_effect=download) as downloads, \
+                mock.patch('utils.date_utils.get_current_time', return_value=now), \
+                self.assertLogs('utils.data_fetching', level='INFO'):
+            data = load_stocks_data(["ABB.NS"], period='30d', interval='1d', as_of_date=now, store=self.store)["ABB.NS"]
+
+        self.assertEqual([call.args[2] for call in downloads.call_args_list], [stored.index[-1], start])
+        np.testing.assert_array_equal(data['Close'], adjusted.loc[data.index, 'Close'])
+        rewritten = self.store.read("ABB.NS", "1d")
+        self.assertEqual((rewritten.index[0], rewritten.index[-1]), (start, pd.Timestamp(2024, 2, 26)))
+        np.testing.assert_array_equal(rewritten['Close'], adjusted.loc[rewritten.index, 'Close'])
+
+    def test_slice_bars_end_is_exclusive(self):
+        data = self.history.iloc[:10]
+        sliced = slice_bars(data, pd.Timestamp(2024, 1, 2), pd.Timestamp(2024, 1, 5))
+        self.assertEqual(list(sliced.index.day), [2, 3, 4])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+import numpy as np
+import pandas as pd
+from utils.bars import Bars
+from utils.calculations import calculate_indicators
+from tests.helpers import make_ohlcv
+
+
+class TestBars(unittest.TestCase):
+
+    def test_indicators_share_the_bars(self):
+        data = make_ohlcv(300, seed=2)
+        bars = Bars.from_frame(data)
+        enriched = bars.with_indicators()
+        self.assertIs(enriched.arrays['Close'], bars.arrays['Close'])
+        self.assertTrue(np.shares_memory(enriched.frame()['Close'].to_numpy(), data['Close'].to_numpy()))
+        pd.testing.assert_frame_equal(enriched.frame(), calculate_indicators(data.copy()))
+
+    def test_bars_are_read_only(self):
+        data = make_ohlcv(300, seed=2)
+        frame = Bars.from_frame(data).frame()
+        with self.assertRaises(ValueError):
+            frame.loc[frame.index[0], 'Close'] = 0.0
+        frame['EMA_5'] = frame['Close']
+        self.assertEqual(list(data.columns), ['Open', 'High', 'Low', 'Close', 'Volume'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,20 +1,47 @@
 #write test for utils/data_fetching.py
+import os
+import tempfile
 import unittest
-from utils.data_fetching import fetch_stock_data
+from unittest import mock
+from utils.bar_store import bar_store
+from utils.data_fetching import fetch_stock_data, compact_bars
+from utils.data_sources import ReplayDataSource, set_data_source
+from utils.calculations import calculate_indicators
 from utils.date_utils import get_last_business_day, get_last_business_friday
+from utils.trading_calendar import get_trading_calendar
 from utils.constants import TIMEFRAMES
 from datetime import datetime
+from tests.helpers import make_ohlcv
 import logging
+import numpy as np
 
 logging.basicConfig(level=logging.INFO)
 log = logging.getLogger(__name__)
 
+# Daily ABB.NS bars (synthetic prices on the NSE sessions of 2023-08-01..2025-07-31) replayed
+# instead of downloading, so the tests run offline and always see the same market
+REPLAY_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'replay')
+AS_OF_DATE = datetime(2025, 7, 24, 11, 0)
+
 class TestDataFetching(unittest.TestCase):
 
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.bar_store_root, bar_store.root = bar_store.root, self.tmp_dir.name
+        self.data_source = set_data_source(ReplayDataSource(REPLAY_DIR))
+        self.now = mock.patch('utils.date_utils.get_current_time', return_value=AS_OF_DATE)
+        self.now.start()
+
+    def tearDown(self):
+        self.now.stop()
+        set_data_source(self.data_source)
+        bar_store.root = self.bar_store_root
+        self.tmp_dir.cleanup()
+
     def test_daily_tf_data(self):
         ticker = "ABB.NS"
         interval, period = TIMEFRAMES.get('1 Day')
-        as_of_date = datetime.now()
+        as_of_date = AS_OF_DATE
         data = fetch_stock_data(ticker, period=period, interval=interval, as_of_date=as_of_date)
         self.assertIsNotNone(data)
         self.assertIn('Close', data.columns)
@@ -26,14 +53,33 @@ class TestDataFetching(unittest.TestCase):
     def test_weekly_tf_data(self):
         ticker = "ABB.NS"
         interval, period = TIMEFRAMES.get('1 Week')
-        as_of_date = datetime.now()
+        as_of_date = AS_OF_DATE
         data = fetch_stock_data(ticker, period=period, interval=interval, as_of_date=as_of_date)
         self.assertIsNotNone(data)
         self.assertIn('Close', data.columns)
-        expected_last_date = get_last_business_friday(as_of_date)
-        self.assertEqual(data.index[-1].date(), expected_last_date.date())
+        # The last complete week, labelled with its Monday like Yahoo Finance's weekly bars
+        expected_last_date = get_trading_calendar().week_start(get_last_business_friday(as_of_date))
+        self.assertEqual(data.index[-1].date(), expected_last_date)
+
+
+class TestCompactBars(unittest.TestCase):
+
+    def setUp(self):
+        self.data = make_ohlcv(2500, seed=1, start='2015-01-01', price=1500.0, decimals=2, adj_close=True)
+
+    def test_compact_bars(self):
+        compact = compact_bars(self.data)
+        self.assertEqual(list(compact.columns), ['Open', 'High', 'Low', 'Close', 'Volume'])
+        self.assertEqual(compact['Close'].dtype, np.float32)
+        self.assertEqual(compact['Volume'].dtype, np.int64)
+        self.assertLess(compact.memory_usage().sum(), 0.6 * self.data.memory_usage().sum())
+
+    def test_indicators_on_compact_bars(self):
+        expected = calculate_indicators(self.data.copy())
+        result = calculate_indicators(compact_bars(self.data))
+        for column in ['EMA_200', 'SMA_50', 'RSI_14', 'MACD']:
+            np.testing.assert_allclose(result[column], expected[column], rtol=1e-4, atol=1e-3)
 
-    
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,94 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+import pandas as pd
+from utils.bar_store import BarStore
+from utils.data_fetching import load_stocks_data
+from utils.data_sources import DataSource, ReplayDataSource, YahooDataSource, get_data_source, set_data_source
+from tests.helpers import make_ohlcv
+
+
+class TestReplayDataSource(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.tmp_dir.name, 'replay')
+        self.daily = make_ohlcv(300, seed=1, end='2025-07-25')
+        ReplayDataSource(self.root).record({'ABB.NS': self.daily}, '1d')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_download_window_and_as_of_cutoff(self):
+        source = ReplayDataSource(self.root, as_of_date='2025-07-16')
+        data = source.download(['ABB.NS', 'MISSING.NS'], '1d', pd.Timestamp('2025-07-01'))
+        self.assertEqual(list(data), ['ABB.NS'])
+        self.assertEqual(data['ABB.NS'].index[0], pd.Timestamp('2025-07-01'))
+        self.assertEqual(data['ABB.NS'].index[-1], pd.Timestamp('2025-07-16'))
+        pd.testing.assert_frame_equal(data['ABB.NS'], self.daily.loc['2025-07-01':'2025-07-16'], check_freq=False)
+
+        data = source.download(['ABB.NS'], '1d', pd.Timestamp('2025-07-01'), pd.Timestamp('2025-07-10'))
+        self.assertEqual(data['ABB.NS'].index[-1], pd.Timestamp('2025-07-09'))
+
+    def test_csv_recordings_and_resampled_fallback(self):
+        os.makedirs(os.path.join(self.root, '1wk'))
+        weekly = make_ohlcv(10, seed=2, freq='W-MON', end='2025-07-21')
+        weekly.to_csv(os.path.join(self.root, '1wk', 'TCS.NS.csv'))
+        source = ReplayDataSource(self.root)
+
+        data = source.download(['TCS.NS', 'ABB.NS'], '1wk', pd.Timestamp('2025-07-01'))
+        pd.testing.assert_frame_equal(data['TCS.NS'], weekly.loc['2025-07-01':], check_freq=False)
+        # ABB.NS only has a daily recording
+        self.assertEqual(data['ABB.NS'].index[-1], pd.Timestamp('2025-07-21'))
+        self.assertEqual(data['ABB.NS']['Close'].iloc[-1], self.daily['Close'].iloc[-1])
+
+    def test_latency(self):
+        with mock.patch('utils.data_sources.time.sleep') as sleep:
+            ReplayDataSource(self.root, latency=0.25).download(['ABB.NS'], '1d', pd.Timestamp('2025-07-01'))
+        sleep.assert_called_once_with(0.25)
+
+    def test_load_stocks_data_through_the_active_source(self):
+        store = BarStore(os.path.join(self.tmp_dir.name, 'bars'))
+        previous = set_data_source(ReplayDataSource(self.root))
+        try:
+            with mock.patch('utils.date_utils.get_current_time', return_value=datetime(2025, 7, 28, 11, 0)):
+                data = load_stocks_data(['ABB.NS'], period='6mo', interval='1d',
+                                        as_of_date=datetime(2025, 7, 24, 16, 0), store=store)['ABB.NS']
+        finally:
+            set_data_source(previous)
+        self.assertIsInstance(get_data_source(), YahooDataSource)
+        self.assertEqual(data.index[-1], pd.Timestamp('2025-07-24'))
+        # The replayed bars were stored like downloaded ones
+        self.assertEqual(store.read('ABB.NS', '1d').index[-1], pd.Timestamp('2025-07-24'))
+
+    def test_failed_download_leaves_the_window_missing(self):
+        class Failing(DataSource):
+            name = 'failing'
+
+            def download(self, tickers, interval, start, end=None):
+                raise ConnectionError("offline")
+
+        store = BarStore(os.path.join(self.tmp_dir.name, 'bars'))
+        start, end = pd.Timestamp('2025-07-01'), pd.Timestamp('2025-07-25')
+        stored = store.merge('ABB.NS', '1d', None, self.daily.loc[:'2025-07-10'], start, pd.Timestamp('2025-07-11'))
+        previous = set_data_source(Failing())
+        try:
+            with mock.patch('utils.date_utils.get_current_time', return_value=datetime(2025, 7, 28, 11, 0)):
+                load_stocks_data(['ABB.NS'], period='20d', interval='1d', as_of_date=datetime(2025, 7, 24, 16, 0), store=store)
+        finally:
+            set_data_source(previous)
+        self.assertEqual(store.read('ABB.NS', '1d').attrs, stored.attrs)
+        self.assertNotEqual(store.missing_windows(store.read('ABB.NS', '1d'), start, end), [])
+
+    def test_source_must_implement_download(self):
+        class Incomplete(DataSource):
+            name = 'incomplete'
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import unittest
+import numpy as np
+import pandas as pd
+from strategies.fibonacci_strategies import identify_swing_points, fibonacci_retracement_strategy
+from tests.helpers import make_ohlcv
+
+
+def reference_identify_swing_points(data, window=10):
+    """The original bar by bar implementation, kept as the reference for equivalence tests"""
+    highs = data['High']
+    lows = data['Low']
+
+    swing_highs = pd.Series(index=data.index, dtype=float)
+    swing_lows = pd.Series(index=data.index, dtype=float)
+
+    for i in range(window, len(data) - window):
+        if all(highs.iloc[i] > highs.iloc[i-window:i]) and all(highs.iloc[i] > highs.iloc[i+1:i+window+1]):
+            swing_highs.iloc[i] = highs.iloc[i]
+        if all(lows.iloc[i] < lows.iloc[i-window:i]) and all(lows.iloc[i] < lows.iloc[i+1:i+window+1]):
+            swing_lows.iloc[i] = lows.iloc[i]
+
+    return swing_highs, swing_lows
+
+
+def reference_fibonacci_retracement_strategy(data, window=10, trend_periods=12):
+    """The original backward scan over every bar, kept as the reference for equivalence tests"""
+    swing_highs, swing_lows = identify_swing_points(data, window)
+
+    signal = pd.Series(False, index=data.index)
+    entry_level = pd.Series(index=data.index, dtype=float)
+
+    for i in range(len(data) - 1, window, -1):
+        if i < trend_periods:
+            continue
+        recent_high = swing_highs.iloc[i-trend_periods:i].max()
+        if pd.isna(recent_high):
+            continue
+        high_idx = swing_highs.iloc[i-trend_periods:i].idxmax()
+        current_idx = data.index[i]
+        mask = (data.index >= high_idx) & (data.index <= current_idx)
+        subsequent_low = data.loc[mask, 'Low'].min()
+        if pd.isna(subsequent_low) or recent_high <= subsequent_low:
+            continue
+        diff = recent_high - subsequent_low
+        fib_50 = subsequent_low + (diff * 0.5)
+        current_candle = data.iloc[i]
+        touches_fib_50 = (current_candle['Low'] <= fib_50 <= current_candle['High'])
+        prior_uptrend = data.iloc[i-trend_periods:i]['Close'].is_monotonic_increasing
+        if touches_fib_50 and prior_uptrend:
+            signal.iloc[i] = True
+            entry_level.iloc[i] = current_candle['Close']
+
+    return pd.DataFrame({'signal': signal, 'entry_level': entry_level})
+
+
+def make_trending_ohlc(length, seed=0):
+    """Steady climbs followed by sharp pullbacks, so the retracement strategy actually fires"""
+    rng = np.random.default_rng(seed)
+    steps = np.where(np.arange(length) % 15 < 11, rng.random(length), -4 * rng.random(length))
+    close = 100 + steps.cumsum()
+    high = close + rng.random(length) * 3
+    low = close - rng.random(length) * 3
+    index = pd.date_range('2015-01-05', periods=length, freq='B')
+    return pd.DataFrame({'Open': close, 'High': high, 'Low': low, 'Close': close}, index=index)
+
+
+class TestIdentifySwingPoints(unittest.TestCase):
+
+    def assert_matches_reference(self, data, window):
+        swing_highs, swing_lows = identify_swing_points(data, window)
+        expected_highs, expected_lows = reference_identify_swing_points(data, window)
+        pd.testing.assert_series_equal(swing_highs, expected_highs)
+        pd.testing.assert_series_equal(swing_lows, expected_lows)
+
+    def test_matches_reference(self):
+        for seed, window in [(0, 10), (1, 5), (2, 20), (3, 1)]:
+            with self.subTest(seed=seed, window=window):
+                self.assert_matches_reference(make_ohlcv(520, seed=seed, freq='W-MON'), window)
+
+    def test_ties_are_not_swing_points(self):
+        self.assert_matches_reference(make_ohlcv(300, seed=4, freq='W-MON', decimals=0), 5)
+
+    def test_nan_bars(self):
+        data = make_ohlcv(200, seed=5, freq='W-MON')
+        data.iloc[[20, 57, 100], [1, 2]] = np.nan
+        self.assert_matches_reference(data, 10)
+
+    def test_short_data_has_no_swing_points(self):
+        swing_highs, swing_lows = identify_swing_points(make_ohlcv(20, freq='W-MON'), 10)
+        self.assertTrue(swing_highs.isna().all())
+        self.assertTrue(swing_lows.isna().all())
+
+
+class TestFibonacciRetracementStrategy(unittest.TestCase):
+
+    def assert_matches_reference(self, data, window, trend_periods):
+        result = fibonacci_retracement_strategy(data, window, trend_periods)
+        expected = reference_fibonacci_retracement_strategy(data, window, trend_periods)
+        pd.testing.assert_frame_equal(result, expected)
+        return result
+
+    def test_matches_reference(self):
+        for seed, window, trend_periods in [(0, 2, 3), (1, 3, 5), (2, 5, 4), (3, 10, 12)]:
+            with self.subTest(seed=seed, window=window, trend_periods=trend_periods):
+                self.assert_matches_reference(make_trending_ohlc(600, seed=seed), window, trend_periods)
+
+    def test_signals_are_found(self):
+        result = self.assert_matches_reference(make_trending_ohlc(600, seed=6), 2, 3)
+        self.assertGreater(result['signal'].sum(), 0)
+
+    def test_latest_only_matches_full_evaluation(self):
+        data = make_trending_ohlc(300, seed=6)
+        signals = 0
+        for window, trend_periods in [(2, 3), (10, 12)]:
+            for end in range(1, len(data) + 1):
+                full = fibonacci_retracement_strategy(data.iloc[:end], window, trend_periods).tail(1)
+                latest = fibonacci_retracement_strategy(data.iloc[:end], window, trend_periods, latest_only=True)
+                pd.testing.assert_frame_equal(latest, full)
+                signals += full['signal'].iloc[0]
+        self.assertGreater(signals, 0)
+
+    def test_random_walk_and_nan_bars(self):
+        data = make_ohlcv(400, seed=7, freq='W-MON')
+        data.iloc[[30, 31, 200], [1, 2, 3]] = np.nan
+        self.assert_matches_reference(data, 2, 2)
+
+    def test_short_data(self):
+        for length in [0, 5, 12, 13]:
+            with self.subTest(length=length):
+                self.assert_matches_reference(make_trending_ohlc(length), 10, 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+import pandas as pd
+from config.strategy_config import STRATEGIES
+from utils.calculations import calculate_indicators
+from utils.signals import calculate_signals_for_ticker
+from tests.helpers import make_ohlcv
+
+
+class TestLatestOnly(unittest.TestCase):
+
+    def test_latest_only_matches_the_last_row_of_a_full_evaluation(self):
+        # Histories of different lengths, some shorter than the 200 bars of the EMA 200 breakout
+        for seed, length in enumerate([183, 320, 150, 399, 240, 210], start=5):
+            ticker = f"T{seed}.NS"
+            data = calculate_indicators(make_ohlcv(length, seed=seed, end='2024-06-28'))
+            for end in range(len(data) - 40, len(data) + 1):
+                history = data.iloc[:end]
+                for strategy in STRATEGIES:
+                    full = strategy['function'](history)[['signal', 'entry_level']].tail(1)
+                    latest = strategy['function'](history, latest_only=True)[['signal', 'entry_level']]
+                    pd.testing.assert_frame_equal(latest, full, check_dtype=False, obj=f"{strategy['name']} {ticker}")
+
+    def test_strategies_do_not_modify_the_data(self):
+        data = calculate_indicators(make_ohlcv(300, seed=11))
+        expected = data.copy()
+        for strategy in STRATEGIES:
+            strategy['function'](data)
+            strategy['function'](data, latest_only=True)
+        pd.testing.assert_frame_equal(data, expected)
+
+    def test_calculate_signals_for_ticker(self):
+        data = calculate_indicators(make_ohlcv(300, seed=11))
+        signals, _ = calculate_signals_for_ticker(data, '1 Week', latest_only=True)
+        self.assertEqual(list(signals.index), [data.index[-1]])
+
+
+if __name__ == '__main__':
+    unittest.main()
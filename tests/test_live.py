@@ -0,0 +1,99 @@
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+import numpy as np
+import pandas as pd
+from indicators.technical_indicators import calculate_ema
+from utils.bar_store import BarStore
+from utils.live import LiveScanner, current_bar_start, run_live_scan
+from tests.helpers import make_ohlcv
+
+
+class TestLiveScanner(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = BarStore(self.tmp_dir.name)
+        self.history = make_ohlcv(300, seed=3, start='2023-01-02', volatility=0.01)
+        self.now = datetime(2024, 2, 26, 11, 0)  # The Monday after the last stored bar
+        self.history = self.history[self.history.index < pd.Timestamp(self.now.date())]
+        self.store.merge('ABB.NS', '1d', None, self.history, self.history.index[0], pd.Timestamp(self.now.date()))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def start_scanner(self):
+        scanner = LiveScanner(['ABB.NS'], ['1 Day'], store=self.store)
+        with mock.patch('utils.data_fetching.get_current_time', return_value=self.now), \
+                mock.patch('utils.data_fetching.download_stocks_data', return_value={}):
+            scanner.start()
+        return scanner
+
+    def poll(self, scanner, bar):
+        with mock.patch('utils.live.download_stocks_data', return_value={'ABB.NS': bar}) as download:
+            changed = scanner.poll(self.now)
+        download.assert_called_once_with(['ABB.NS'], '1d', pd.Timestamp(2024, 2, 26))
+        return changed
+
+    def test_poll_appends_then_amends_the_forming_bar(self):
+        scanner = self.start_scanner()
+        bar = make_ohlcv(1, seed=5, start=self.now.date(), volatility=0.01)
+
+        self.assertEqual(self.poll(scanner, bar), ['ABB.NS'])
+        revised = bar * 1.02
+        self.assertEqual(self.poll(scanner, revised), ['ABB.NS'])
+        # Polling an unchanged bar re-evaluates nothing
+        self.assertEqual(self.poll(scanner, revised), [])
+
+        frame = scanner.frames[('ABB.NS', '1 Day')]
+        expected = pd.concat([self.history, revised])
+        self.assertEqual(list(frame.index), list(expected.index))
+        np.testing.assert_allclose(frame['EMA_200'], calculate_ema(expected, 200), rtol=1e-9)
+        self.assertEqual(self.store.read('ABB.NS', '1d')['Close'].iloc[-1], revised['Close'].iloc[-1])
+        self.assertEqual(scanner.latest_close['ABB.NS'], f"{revised['Close'].iloc[-1]:.2f}")
+
+    def test_poll_rebuilds_the_forming_weekly_bar_from_daily_bars(self):
+        scanner = LiveScanner(['ABB.NS'], ['1 Week'], store=self.store)
+        with mock.patch('utils.data_fetching.get_current_time', return_value=self.now), \
+                mock.patch('utils.data_fetching.download_stocks_data', return_value={}):
+            scanner.start()
+        bar = make_ohlcv(1, seed=5, start=self.now.date(), volatility=0.01)
+
+        self.assertEqual(self.poll(scanner, bar), ['ABB.NS'])
+        frame = scanner.frames[('ABB.NS', '1 Week')]
+        self.assertEqual(frame.index[-1], pd.Timestamp(2024, 2, 26))
+        self.assertEqual(frame['Close'].iloc[-1], bar['Close'].iloc[-1])
+        self.assertIsNone(self.store.read('ABB.NS', '1wk'))
+
+    def test_current_bar_start(self):
+        now = datetime(2024, 2, 28, 10, 0)
+        self.assertEqual(current_bar_start('1d', now), pd.Timestamp(2024, 2, 28))
+        self.assertEqual(current_bar_start('1wk', now), pd.Timestamp(2024, 2, 26))
+        self.assertEqual(current_bar_start('1mo', now), pd.Timestamp(2024, 2, 1))
+
+    def test_run_live_scan_polls_during_the_session(self):
+        times = iter([datetime(2024, 2, 26, 9, 0), datetime(2024, 2, 26, 9, 0), datetime(2024, 2, 26, 9, 15),
+                      datetime(2024, 2, 26, 12, 0), datetime(2024, 2, 26, 15, 31)])
+        scanner = mock.Mock(stock_tickers=['ABB.NS'])
+        scanner.poll.return_value = ['ABB.NS']
+        sleep = mock.Mock()
+        updates = []
+
+        run_live_scan(scanner, poll_interval=60, on_update=lambda s, changed: updates.append(changed),
+                      clock=lambda: next(times), sleep=sleep)
+
+        scanner.start.assert_called_once()
+        self.assertEqual(scanner.poll.call_count, 3)
+        self.assertEqual(sleep.call_args_list, [mock.call(900.0), mock.call(60), mock.call(60)])
+        self.assertEqual(len(updates), 4)
+
+    def test_run_live_scan_skips_holidays(self):
+        scanner = mock.Mock(stock_tickers=['ABB.NS'])
+        # Republic Day, a Friday
+        run_live_scan(scanner, clock=lambda: datetime(2024, 1, 26, 10, 0), sleep=mock.Mock())
+        scanner.start.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
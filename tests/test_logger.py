@@ -0,0 +1,50 @@
+import io
+import logging
+import unittest
+from utils import logger as logger_module
+from utils.logger import HANDLER_NAME, configure_logging, get_logger, shutdown_logging
+
+
+class TestLogger(unittest.TestCase):
+
+    def tearDown(self):
+        configure_logging(level=logging.INFO)
+
+    def test_get_logger_is_idempotent(self):
+        for _ in range(3):
+            log = get_logger('tests.idempotent')
+        self.assertEqual([handler.get_name() for handler in log.handlers], [HANDLER_NAME])
+
+    def test_replaces_handler_left_by_reload(self):
+        log = get_logger('tests.reload')
+        stale = logging.StreamHandler(io.StringIO())
+        stale.set_name(HANDLER_NAME)
+        log.addHandler(stale)
+        get_logger('tests.reload')
+        self.assertEqual(log.handlers, [logger_module._handler])
+
+    def test_async_sink_writes_records(self):
+        stream = io.StringIO()
+        configure_logging(stream=stream)
+        log = get_logger('tests.async')
+        self.assertIsInstance(log.handlers[0], logging.handlers.QueueHandler)
+        for i in range(3):
+            log.info(f"ticker {i}")
+        shutdown_logging()
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertIn('tests.async - INFO - ticker 2', lines[-1])
+
+    def test_level_applies_to_existing_loggers(self):
+        log = get_logger('tests.level')
+        stream = io.StringIO()
+        configure_logging(level='WARNING', async_logging=False, stream=stream)
+        log.info("dropped")
+        log.warning("kept")
+        self.assertEqual(log.level, logging.WARNING)
+        self.assertNotIn("dropped", stream.getvalue())
+        self.assertIn("kept", stream.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+import argparse
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date, datetime
+from unittest import mock
+import pandas as pd
+import main
+from utils.bar_store import bar_store
+from utils.constants import nifty_50_tickers_yfinance, nifty_200_tickers_yfinance
+from utils.data_sources import get_data_source, set_data_source
+from utils.scan_engine import scan_panel
+
+REPLAY_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'replay')
+
+
+def pin_clock(now):
+    """Patches every module that reads the clock to now"""
+    return [mock.patch(f'{module}.get_current_time', return_value=now)
+            for module in ('utils.date_utils', 'utils.data_fetching', 'utils.bar_store')]
+
+
+class TestParser(unittest.TestCase):
+
+    def parse(self, *argv):
+        with mock.patch('sys.stderr'):
+            return main.build_parser().parse_args(argv)
+
+    def test_scan(self):
+        args = self.parse('scan', '--tickers', 'ABB.NS,TCS.NS', '--timeframes', '1d,1 Week', '--as-of', '2025-07-24',
+                          '--workers', '0', '--compact', '-o', 'signals.json')
+        self.assertIs(args.handler, main.run_scan)
+        self.assertEqual(main.get_universe(args), ['ABB.NS', 'TCS.NS'])
+        self.assertEqual(args.timeframes, ['1 Day', '1 Week'])
+        self.assertEqual(args.as_of, date(2025, 7, 24))
+        self.assertEqual((args.workers, args.compact, args.output, args.profile), (0, True, 'signals.json', None))
+
+    def test_scan_defaults(self):
+        args = self.parse('scan')
+        self.assertEqual(args.timeframes, ['1 Day'])
+        self.assertIsNone(args.as_of)
+        self.assertEqual(main.get_universe(args), nifty_200_tickers_yfinance)
+        self.assertEqual(main.get_universe(self.parse('scan', '--universe', 'nifty50')), nifty_50_tickers_yfinance)
+
+    def test_sweep(self):
+        args = self.parse('sweep', '--strategy', 'EMA Crossover', '--grid', 'short_period=10,20',
+                          '--grid', 'volume_multiplier=1.5', '--timeframe', '1wk', '--rank-by', 'win_rate')
+        self.assertIs(args.handler, main.run_sweep)
+        self.assertEqual(args.grid, [('short_period', [10, 20]), ('volume_multiplier', [1.5])])
+        self.assertEqual((args.timeframe, args.rank_by), (['1 Week'], 'win_rate'))
+
+    def test_live(self):
+        args = self.parse('live', '--universe', 'nifty50', '--timeframes', '1d,1wk', '--poll-interval', '30')
+        self.assertIs(args.handler, main.run_live)
+        self.assertEqual((args.timeframes, args.poll_interval), (['1 Day', '1 Week'], 30))
+        self.assertFalse(hasattr(args, 'as_of'))
+
+    def test_cube(self):
+        args = self.parse('--replay', 'recordings', 'cube', '--tickers', 'ABB.NS', '--interval', '1wk', '--no-fetch')
+        self.assertIs(args.handler, main.run_cube)
+        self.assertEqual((args.replay, args.interval, args.no_fetch, args.root), ('recordings', '1wk', True, None))
+
+    def test_invalid_arguments(self):
+        for argv in (['scan', '--as-of', '24-07-2025'], ['scan', '--timeframes', '1h'], ['sweep', '--strategy', 'x', '--grid', 'short_period'],
+                     ['cube', '--interval', '1h'], []):
+            with self.subTest(argv=argv), self.assertRaises(SystemExit):
+                self.parse(*argv)
+
+    def test_parse_date(self):
+        self.assertEqual(main.parse_date('2025-07-24'), date(2025, 7, 24))
+        with self.assertRaises(argparse.ArgumentTypeError):
+            main.parse_date('2025-02-30')
+
+
+class TestScanCommand(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.bar_store_root = bar_store.root
+        self.data_source = get_data_source()
+
+    def tearDown(self):
+        if bar_store.root != self.bar_store_root:
+            # The temporary store use_replay made
+            shutil.rmtree(bar_store.root, ignore_errors=True)
+        bar_store.root = self.bar_store_root
+        set_data_source(self.data_source)
+        self.tmp_dir.cleanup()
+
+    def run_main(self, *argv, now):
+        patches = pin_clock(now)
+        for patch in patches:
+            patch.start()
+        try:
+            with mock.patch('utils.scan_engine.scan_panel', wraps=scan_panel) as scan:
+                exit_code = main.main(['--log-level', 'WARNING', '--replay', REPLAY_DIR, *argv])
+        finally:
+            for patch in patches:
+                patch.stop()
+        return exit_code, scan
+
+    def test_scan_after_the_close_includes_todays_bar(self):
+        output = os.path.join(self.tmp_dir.name, 'signals.csv')
+        exit_code, scan = self.run_main('scan', '--tickers', 'ABB.NS', '--workers', '0', '-o', output,
+                                        now=datetime(2025, 7, 24, 16, 30))
+        self.assertEqual(exit_code, 0)
+        fetched_data = scan.call_args.args[2]
+        self.assertEqual(fetched_data['ABB.NS']['1d'].index[-1], pd.Timestamp('2025-07-24'))
+
+    def test_scan_during_the_session_leaves_out_the_forming_bar(self):
+        output = os.path.join(self.tmp_dir.name, 'signals.csv')
+        _, scan = self.run_main('scan', '--tickers', 'ABB.NS', '--workers', '0', '-o', output,
+                                now=datetime(2025, 7, 24, 11, 0))
+        self.assertEqual(scan.call_args.args[2]['ABB.NS']['1d'].index[-1], pd.Timestamp('2025-07-23'))
+
+    def test_explicit_as_of_stands_for_the_whole_day(self):
+        output = os.path.join(self.tmp_dir.name, 'signals.csv')
+        _, scan = self.run_main('scan', '--tickers', 'ABB.NS', '--as-of', '2025-07-15', '-o', output,
+                                now=datetime(2025, 7, 24, 11, 0))
+        self.assertEqual(scan.call_args.args[3], date(2025, 7, 15))
+        self.assertEqual(scan.call_args.args[2]['ABB.NS']['1d'].index[-1], pd.Timestamp('2025-07-15'))
+
+    def test_replay_scan(self):
+        output = os.path.join(self.tmp_dir.name, 'signals.json')
+        exit_code, _ = self.run_main('scan', '--tickers', 'ABB.NS,MISSING.NS', '--timeframes', '1d,1wk', '--as-of', '2025-07-15',
+                                     '--workers', '0', '-o', output, now=datetime(2025, 7, 24, 11, 0))
+        self.assertEqual(exit_code, 0)
+        results = pd.read_json(output, orient='records', dtype=False)
+        self.assertEqual(results.to_dict('records'), [{
+            'Ticker': 'ABB.NS', '1 Day Signals': 'EMA 200 Breakout', '1 Day Signal Date': '2025-07-15',
+            '1 Week Signals': 'No Signal', '1 Week Signal Date': 'N/A', 'Last Close': '496.59',
+        }])
+
+    def test_compact_scan_holds_float32_bars(self):
+        output = os.path.join(self.tmp_dir.name, 'signals.csv')
+        _, scan = self.run_main('scan', '--tickers', 'ABB.NS', '--compact', '-o', output,
+                                now=datetime(2025, 7, 24, 16, 30))
+        data = scan.call_args.args[2]['ABB.NS']['1d']
+        self.assertEqual(data['Close'].dtype, 'float32')
+        self.assertNotIn('Adj Close', data.columns)
+
+
+if __name__ == '__main__':
+    unittest.main()
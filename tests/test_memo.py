@@ -0,0 +1,73 @@
+import tempfile
+import unittest
+from unittest import mock
+import pandas as pd
+from utils.data_fetching import compact_bars
+from utils.memo import ComputeCache, data_fingerprint
+from utils.signals import get_indicator_frame, get_signals_for_ticker
+from tests.helpers import make_ohlcv
+
+
+class TestComputeCache(unittest.TestCase):
+
+    def test_lru_eviction_by_count(self):
+        cache = ComputeCache(max_entries=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertEqual(cache.get('a'), (True, 1))
+        self.assertEqual(cache.get('b'), (False, None))
+        self.assertEqual(len(cache), 2)
+
+    def test_eviction_by_size(self):
+        frame = make_ohlcv(260, freq='W-MON')
+        cache = ComputeCache(max_bytes=int(frame.memory_usage().sum() * 1.5))
+        cache.put('a', frame)
+        cache.put('b', frame)
+        self.assertEqual(list(cache.entries), ['b'])
+
+    def test_disk_backing_outlives_the_instance(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            ComputeCache(disk_dir=tmp_dir).put(('indicators', 'ABB.NS'), make_ohlcv(260, freq='W-MON'))
+            found, value = ComputeCache(disk_dir=tmp_dir).get(('indicators', 'ABB.NS'))
+            self.assertTrue(found)
+            pd.testing.assert_frame_equal(value, make_ohlcv(260, freq='W-MON'))
+
+    def test_fingerprint_changes_with_a_revised_last_bar(self):
+        data = make_ohlcv(260, freq='W-MON')
+        revised = data.copy()
+        revised.iloc[-1, revised.columns.get_loc('Close')] += 1
+        self.assertNotEqual(data_fingerprint(data), data_fingerprint(revised))
+
+
+class TestCachedComputations(unittest.TestCase):
+
+    def test_indicators_and_signals_are_computed_once(self):
+        cache = ComputeCache()
+        data = make_ohlcv(260, freq='W-MON')
+        with mock.patch('utils.bars.iter_indicators', side_effect=lambda bars, columns: [('EMA_200', bars['Close'])]) as indicators, \
+                mock.patch('utils.signals.calculate_signals_for_ticker', return_value=(pd.DataFrame(), {})) as signals:
+            for _ in range(3):
+                frame = get_indicator_frame('ABB.NS', '1wk', data, ['EMA_200'], cache=cache)
+                get_signals_for_ticker('ABB.NS', '1wk', frame, '1 Week', cache=cache)
+            get_indicator_frame('ABB.NS', '1wk', data, cache=cache)
+
+        self.assertEqual(indicators.call_count, 2)  # The default column set is a separate entry
+        self.assertEqual(signals.call_count, 1)
+        self.assertNotIn('EMA_200', data.columns)
+
+    def test_compact_and_full_bars_share_an_entry(self):
+        cache = ComputeCache()
+        data = make_ohlcv(260, freq='W-MON')
+        # Prices float32 cannot hold exactly
+        data[['Open', 'High', 'Low', 'Close']] += 0.1
+        with mock.patch('utils.bars.iter_indicators', side_effect=lambda bars, columns: [('EMA_200', bars['Close'])]) as indicators:
+            get_indicator_frame('ABB.NS', '1wk', compact_bars(data), ['EMA_200'], cache=cache)
+            get_indicator_frame('ABB.NS', '1wk', data, ['EMA_200'], cache=cache)
+        self.assertEqual(indicators.call_count, 1)
+        self.assertEqual(len(cache), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
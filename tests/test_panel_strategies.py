@@ -0,0 +1,108 @@
+import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
+from config.strategy_config import STRATEGIES, EMA_200_BREAKOUT
+from utils.calculations import calculate_indicators, required_indicators
+from utils.panel import BarPanel
+from utils.scan_engine import scan_panel, scan_tickers
+from utils.signals import process_ticker_signals, prefetch_stock_data
+from tests.helpers import make_ohlcv
+
+
+class TestPanelStrategies(unittest.TestCase):
+
+    def setUp(self):
+        # Histories of different lengths, some shorter than the 200 bars of the EMA 200 breakout
+        lengths = [183, 320, 150, 399, 240, 199, 275, 210]
+        self.stocks_data = {f"T{i}.NS": make_ohlcv(length, seed=11 + i, end='2024-06-28')
+                            for i, length in enumerate(lengths)}
+        self.panel = BarPanel.from_stocks_data(self.stocks_data, required_indicators(STRATEGIES))
+
+    def test_panel_indicators_match_per_ticker(self):
+        for j, (ticker, data) in enumerate(self.stocks_data.items()):
+            enriched = calculate_indicators(data.copy())
+            for column in ['EMA_20', 'SMA_50', 'RSI_14', 'MACD', 'Signal', 'EMA_200']:
+                np.testing.assert_allclose(self.panel[column][-len(data):, j], enriched[column].to_numpy(),
+                                           rtol=1e-12, err_msg=f"{ticker} {column}")
+
+    def test_panel_strategies_match_per_ticker(self):
+        for strategy in STRATEGIES:
+            if 'panel_function' not in strategy:
+                continue
+            signals = strategy['panel_function'](self.panel)
+            for j, (ticker, data) in enumerate(self.stocks_data.items()):
+                expected = strategy['function'](calculate_indicators(data.copy()))['signal'].to_numpy(dtype=bool)
+                np.testing.assert_array_equal(signals[-len(data):, j], expected, err_msg=f"{strategy['name']} {ticker}")
+                self.assertFalse(signals[:-len(data), j].any())
+
+    def test_ema_200_breakout_fires_on_latest_bar(self):
+        data = max(self.stocks_data.values(), key=len).iloc[-250:].copy()
+        data.iloc[-1, data.columns.get_loc('Open')] = 1.0
+        data.iloc[-1, data.columns.get_loc('Close')] = data['Close'].max() * 2
+        panel = BarPanel.from_stocks_data({'T0.NS': data}, ['EMA_200'])
+        self.assertTrue(EMA_200_BREAKOUT['panel_function'](panel)[-1, 0])
+
+    def test_ema_200_breakout_signals_over_history(self):
+        data = calculate_indicators(max(self.stocks_data.values(), key=len).copy(), ['EMA_200'])
+        for position in (150, 250, 300):
+            data.iloc[position, data.columns.get_loc('Open')] = 1.0
+            data.iloc[position, data.columns.get_loc('Close')] = data['Close'].max() * 2
+        data = calculate_indicators(data, ['EMA_200'])
+        signals = EMA_200_BREAKOUT['function'](data)['signal']
+        # Bars before the 200th never signal
+        self.assertEqual(list(signals.iloc[[150, 250, 300]]), [False, True, True])
+        self.assertFalse(signals.iloc[:199].any())
+
+    def test_scan_panel_matches_process_ticker_signals(self):
+        fetched_data = {ticker: {'1d': data, '1wk': data} for ticker, data in self.stocks_data.items()}
+        tickers = list(self.stocks_data) + ['MISSING.NS']
+        timeframes = ['1 Day', '1 Week']
+        expected = [process_ticker_signals(ticker, timeframes, fetched_data, None, fetch=mock.Mock(return_value=None))
+                    for ticker in tickers]
+        fetch = mock.Mock(return_value={})
+        self.assertEqual(scan_panel(tickers, timeframes, fetched_data, fetch=fetch)[:-1], expected[:-1])
+        self.assertFalse(scan_panel(tickers, timeframes, fetched_data, fetch=fetch)[-1][2])
+
+    def test_scan_panel_without_data(self):
+        results = scan_panel(['MISSING.NS'], ['1 Day', '1 Week'], {}, fetch=mock.Mock(return_value={}))
+        self.assertEqual(results, [({'Ticker': 'MISSING.NS'}, None, False)])
+
+    def test_scan_tickers_reports_failed_evaluations(self):
+        def process(ticker, selected_timeframes, fetched_data, as_of_date, fetch):
+            if ticker == 'BAD.NS':
+                raise ValueError("corrupt bars")
+            return {'Ticker': ticker}, '1.00', True
+
+        with mock.patch('utils.scan_engine.process_ticker_signals', side_effect=process), \
+                self.assertLogs('utils.scan_engine', level='ERROR') as logs:
+            results = list(scan_tickers(['ABB.NS', 'BAD.NS'], ['1 Day'], {}, None, compute_workers=0))
+        self.assertCountEqual(results, [({'Ticker': 'ABB.NS'}, '1.00', True), ({'Ticker': 'BAD.NS'}, None, False)])
+        self.assertIn('BAD.NS', logs.output[0])
+
+    def test_scan_uses_the_injected_fetchers(self):
+        fetched_data = {}
+        fetch_many = mock.Mock(return_value=dict(self.stocks_data))
+        prefetch_stock_data(list(self.stocks_data) + ['MISSING.NS'], ['1 Day', '1 Week'], fetched_data, None, fetch=fetch_many)
+        self.assertEqual([call.kwargs['interval'] for call in fetch_many.call_args_list], ['1d', '1wk'])
+        self.assertIs(fetched_data['T0.NS']['1wk'], self.stocks_data['T0.NS'])
+
+        fetch_one = mock.Mock(return_value=None)
+        results = list(scan_tickers(['MISSING.NS'], ['1 Day'], fetched_data, None, compute_workers=0, fetch=fetch_one))
+        fetch_one.assert_called_once_with('MISSING.NS', period='2y', interval='1d', as_of_date=None)
+        self.assertEqual(results, [({'Ticker': 'MISSING.NS'}, None, False)])
+
+    def test_scan_panel_fetches_missing_tickers(self):
+        tickers = list(self.stocks_data)
+        complete = {ticker: {'1d': data} for ticker, data in self.stocks_data.items()}
+        fetched_data = {ticker: dict(data) for ticker, data in complete.items() if ticker != tickers[0]}
+        fetched = {tickers[0]: self.stocks_data[tickers[0]]}
+        fetch = mock.Mock(return_value=fetched)
+        results = scan_panel(tickers, ['1 Day'], fetched_data, '2025-06-27', fetch=fetch)
+        fetch.assert_called_once_with([tickers[0]], period='2y', interval='1d', as_of_date='2025-06-27')
+        self.assertIs(fetched_data[tickers[0]]['1d'], fetched[tickers[0]])
+        self.assertEqual(results, scan_panel(tickers, ['1 Day'], complete))
+
+
+if __name__ == '__main__':
+    unittest.main()
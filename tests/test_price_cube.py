@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+import numpy as np
+import pandas as pd
+from utils.bar_store import BarStore
+from utils.price_cube import CURRENT_FILE, PriceCube, build_price_cube
+from tests.helpers import make_ohlcv
+
+
+class TestPriceCube(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = BarStore(os.path.join(self.tmp_dir.name, 'bars'))
+        self.root = os.path.join(self.tmp_dir.name, 'cube', '1d')
+        # Business days, so they include the NSE holidays the cube leaves out
+        self.abb = make_ohlcv(120, seed=1, end='2025-08-29')
+        self.tcs = make_ohlcv(60, seed=2, end='2025-08-22')
+        for ticker, data in (('ABB.NS', self.abb), ('TCS.NS', self.tcs)):
+            self.store.merge(ticker, '1d', None, data, data.index[0], data.index[-1] + pd.Timedelta(days=1))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def build(self, interval='1d', root=None):
+        return build_price_cube(['ABB.NS', 'TCS.NS', 'MISSING.NS'], interval=interval,
+                                root=root or self.root, store=self.store)
+
+    def test_build_aligns_tickers_on_the_calendar(self):
+        self.build()
+        cube = PriceCube.open(self.root)
+        self.assertIsInstance(cube['Close'], np.memmap)
+        self.assertEqual(cube['Close'].shape, (len(cube.dates), 3))
+        self.assertEqual(cube.column('TCS.NS'), 1)
+        # Independence Day is not a session
+        self.assertNotIn(pd.Timestamp('2025-08-15'), cube.dates)
+        self.assertEqual(cube.dates[-1], pd.Timestamp('2025-08-29'))
+
+        sessions = self.abb.index[self.abb.index.isin(cube.dates)]
+        pd.testing.assert_frame_equal(cube.frame('ABB.NS'), self.abb.loc[sessions, list(cube.fields)],
+                                      check_freq=False, check_names=False)
+        self.assertTrue(np.isnan(cube['Close'][:, 2]).all())
+        self.assertEqual(cube.stocks_data().keys(), {'ABB.NS', 'TCS.NS'})
+
+    def test_cross_section(self):
+        cube = self.build()
+        # The bar on or before a Sunday is the Friday's, TCS.NS has no bar that week
+        section = cube.cross_section('2025-08-31', ['Close'])
+        self.assertEqual(section.loc['ABB.NS', 'Close'], self.abb.loc['2025-08-29', 'Close'])
+        self.assertTrue(np.isnan(section.loc['TCS.NS', 'Close']))
+
+    def test_weekly_cube_from_daily_bars(self):
+        cube = self.build('1wk', os.path.join(self.tmp_dir.name, 'cube', '1wk'))
+        self.assertEqual(cube.dates[-1], pd.Timestamp('2025-08-25'))
+        self.assertEqual(cube.frame('TCS.NS')['Close'].iloc[-1], self.tcs['Close'].iloc[-1])
+
+    def test_rebuild_replaces_the_cube(self):
+        self.build()
+        self.store.merge('TCS.NS', '1d', self.store.read('TCS.NS', '1d'), self.abb.tail(5) * 2,
+                         pd.Timestamp('2025-08-25'), pd.Timestamp('2025-08-30'))
+        previous = PriceCube.open(self.root)
+        cube = self.build()
+        self.assertEqual(cube.frame('TCS.NS')['Close'].iloc[-1], self.abb['Close'].iloc[-1] * 2)
+        self.assertEqual(PriceCube.open(self.root).root, cube.root)
+        # The previous version stays readable, older ones are removed
+        self.assertEqual(previous.frame('TCS.NS')['Close'].iloc[-1], self.tcs['Close'].iloc[-1])
+        self.build()
+        versions = sorted(os.listdir(self.root))
+        self.assertEqual(len(versions), 3)
+        self.assertIn(CURRENT_FILE, versions)
+        self.assertNotIn(os.path.basename(previous.root), versions)
+        self.assertIn(os.path.basename(cube.root), versions)
+
+    def test_forming_bars_are_left_out(self):
+        now = datetime(2025, 8, 27, 11, 0)
+        with mock.patch('utils.price_cube.get_current_time', return_value=now), \
+                mock.patch('utils.date_utils.get_current_time', return_value=now):
+            daily = self.build()
+            weekly = self.build('1wk', os.path.join(self.tmp_dir.name, 'cube', '1wk'))
+        self.assertEqual(daily.dates[-1], pd.Timestamp('2025-08-26'))
+        self.assertEqual(daily.end, pd.Timestamp('2025-08-27'))
+        # The week of 2025-08-25 is still forming on the Wednesday
+        self.assertEqual(weekly.dates[-1], pd.Timestamp('2025-08-18'))
+        self.assertEqual(weekly.frame('ABB.NS')['Close'].iloc[-1], self.abb.loc['2025-08-22', 'Close'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import json
+import os
+import tempfile
+import unittest
+from utils.profiling import Profiler, NULL_STAGE, profiled_call, profiler
+
+
+class TestProfiler(unittest.TestCase):
+
+    def test_disabled_profiler_records_nothing(self):
+        disabled = Profiler()
+        self.assertIs(disabled.stage('indicators'), NULL_STAGE)
+        with disabled.stage('indicators'):
+            pass
+        disabled.count('cache.hits')
+        self.assertEqual(disabled.snapshot(), {'timings': {}, 'counters': {}})
+
+    def test_stages_and_counters(self):
+        enabled = Profiler(enabled=True)
+        for _ in range(3):
+            with enabled.stage('strategy.EMA Crossover'):
+                pass
+        enabled.count('fetch.bytes', 100)
+        enabled.count('fetch.bytes', 50)
+
+        snapshot = enabled.snapshot()
+        timing = snapshot['timings']['strategy.EMA Crossover']
+        self.assertEqual(timing['calls'], 3)
+        self.assertGreaterEqual(timing['total_s'], timing['max_s'])
+        self.assertEqual(snapshot['counters'], {'fetch.bytes': 150})
+
+    def test_timed_decorator(self):
+        enabled = Profiler(enabled=True)
+
+        @enabled.timed('double')
+        def double(value):
+            return value * 2
+
+        self.assertEqual(double(2), 4)
+        enabled.enabled = False
+        self.assertEqual(double(3), 6)
+        self.assertEqual(enabled.snapshot()['timings']['double']['calls'], 1)
+
+    def test_merge_and_report(self):
+        worker = Profiler(enabled=True)
+        worker.add_time('indicators', 0.5)
+        worker.count('compute_cache.misses', 2)
+        main = Profiler(enabled=True)
+        main.add_time('indicators', 0.25)
+        main.merge(worker.snapshot())
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'report.json')
+            main.write_report(path)
+            with open(path) as f:
+                report = json.load(f)
+        self.assertEqual(report['timings']['indicators'], {'calls': 2, 'total_s': 0.75, 'max_s': 0.5})
+        self.assertEqual(report['counters'], {'compute_cache.misses': 2})
+
+    def test_profiled_call_returns_stats(self):
+        def work():
+            with profiler.stage('work'):
+                return 42
+
+        result, stats = profiled_call(work)
+        self.assertEqual(result, 42)
+        self.assertEqual(stats['timings']['work']['calls'], 1)
+        self.assertFalse(profiler.enabled)
+        profiler.reset()
+
+
+if __name__ == '__main__':
+    unittest.main()
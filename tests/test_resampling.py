@@ -0,0 +1,69 @@
+import tempfile
+import unittest
+from unittest import mock
+import pandas as pd
+from utils.bar_store import BarStore
+from utils.data_fetching import load_stocks_data
+from utils.resampling import resample_bars, period_starts
+from tests.helpers import make_ohlcv
+
+
+def nse_sessions(start, end):
+    # NSE sessions, 2025-04-14 and 2025-04-18 are holidays
+    return pd.bdate_range(start, end, freq='C', holidays=['2025-04-14', '2025-04-18'], name='Date')
+
+
+class TestResampling(unittest.TestCase):
+
+    def test_weekly_bars_match_groupby(self):
+        daily = make_ohlcv(index=nse_sessions('2025-03-03', '2025-05-30'), adj_close=True)
+        weekly = resample_bars(daily, '1wk')
+        expected = daily.groupby(period_starts(daily.index, '1wk')).agg(
+            {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Adj Close': 'last', 'Volume': 'sum'})
+        pd.testing.assert_frame_equal(weekly, expected, check_names=False)
+        # The week of the Ambedkar Jayanti Monday is still labelled with that Monday
+        self.assertIn(pd.Timestamp('2025-04-14'), weekly.index)
+        self.assertEqual(weekly.loc['2025-04-14', 'Close'], daily.loc['2025-04-17', 'Close'])
+
+    def test_monthly_bars(self):
+        daily = make_ohlcv(index=nse_sessions('2025-01-01', '2025-04-30'), adj_close=True)
+        monthly = resample_bars(daily, '1mo')
+        self.assertEqual(list(monthly.index), list(pd.date_range('2025-01-01', periods=4, freq='MS')))
+        self.assertEqual(monthly.loc['2025-02-01', 'Open'], daily.loc['2025-02-03', 'Open'])
+        self.assertEqual(monthly.loc['2025-02-01', 'Volume'], daily.loc['2025-02', 'Volume'].sum())
+
+    def test_weekly_request_is_answered_from_daily_bars(self):
+        daily = make_ohlcv(index=nse_sessions('2024-12-02', '2025-05-30'), adj_close=True)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = BarStore(tmp_dir)
+            store.merge('ABB.NS', '1d', None, daily, daily.index[0], pd.Timestamp('2025-05-31'))
+            with mock.patch('utils.date_utils.get_current_time', return_value=pd.Timestamp('2025-06-02 11:00')), \
+                    mock.patch('utils.data_fetching.download_stocks_data') as download:
+                weekly = load_stocks_data(['ABB.NS'], period='90d', interval='1wk',
+                                          as_of_date=pd.Timestamp('2025-05-29 12:00'), store=store)['ABB.NS']
+            download.assert_not_called()
+            self.assertIsNone(store.read('ABB.NS', '1wk'))
+
+        # Window starts 2025-02-28, the week of the as-of date is not complete yet
+        self.assertEqual(weekly.index[0], pd.Timestamp('2025-03-03'))
+        self.assertEqual(weekly.index[-1], pd.Timestamp('2025-05-19'))
+        self.assertEqual(weekly['Close'].iloc[-1], daily.loc['2025-05-23', 'Close'])
+
+    def test_latest_weekly_request_leaves_out_the_forming_week(self):
+        daily = make_ohlcv(index=nse_sessions('2024-12-02', '2025-05-28'), adj_close=True)
+        now = pd.Timestamp('2025-05-28 11:00').to_pydatetime()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = BarStore(tmp_dir)
+            store.merge('ABB.NS', '1d', None, daily, daily.index[0])
+            with mock.patch('utils.date_utils.get_current_time', return_value=now), \
+                    mock.patch('utils.data_fetching.get_current_time', return_value=now), \
+                    mock.patch('utils.data_fetching.download_stocks_data', return_value={}):
+                weekly = load_stocks_data(['ABB.NS'], period='90d', interval='1wk', store=store)['ABB.NS']
+
+        # 2025-05-26 is the week of the Wednesday the request is made on
+        self.assertEqual(weekly.index[-1], pd.Timestamp('2025-05-19'))
+        self.assertEqual(weekly['Close'].iloc[-1], daily.loc['2025-05-23', 'Close'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import json
+import unittest
+import numpy as np
+from indicators.technical_indicators import calculate_ema, calculate_sma, calculate_rsi, calculate_macd
+from indicators.streaming import StreamingIndicator, StreamingEMA, StreamingSMA, StreamingRSI, StreamingMACD, IndicatorSet
+from tests.helpers import make_ohlcv
+
+
+class TestStreamingIndicators(unittest.TestCase):
+    def setUp(self):
+        self.data = make_ohlcv(400, seed=7)
+        # A flat stretch exercises the zero gain / zero loss cases of the RSI
+        self.data.iloc[50:70, self.data.columns.get_loc('Close')] = self.data['Close'].iloc[50]
+
+    def assert_matches(self, streamed, expected):
+        np.testing.assert_allclose(np.asarray(streamed, dtype=float), expected.to_numpy(dtype=float), rtol=1e-9, atol=1e-9)
+
+    def test_ema_sma_rsi_match_batch(self):
+        closes = self.data['Close']
+        self.assert_matches(StreamingEMA(20).seed(closes), calculate_ema(self.data, 20))
+        self.assert_matches(StreamingSMA(50).seed(closes), calculate_sma(self.data, 50))
+        self.assert_matches(StreamingRSI(14).seed(closes), calculate_rsi(self.data, 14))
+
+    def test_macd_matches_batch(self):
+        expected = calculate_macd(self.data)
+        values = StreamingMACD().seed(self.data['Close'])
+        for column in ['MACD', 'Signal', 'Histogram']:
+            self.assert_matches([v[column] for v in values], expected[column])
+
+    def test_amend_revises_the_latest_bar(self):
+        columns = ['EMA_20', 'SMA_50', 'RSI_14', 'MACD', 'Signal', 'Histogram']
+        indicators = IndicatorSet(columns)
+        indicators.seed(self.data.iloc[:-1])
+        indicators.update(self.data['Close'].iloc[-1] * 1.05)
+        indicators.amend(self.data['Close'].iloc[-1] * 0.97)
+        values = indicators.amend(self.data['Close'].iloc[-1])
+
+        expected = IndicatorSet(columns).seed(self.data).iloc[-1]
+        np.testing.assert_allclose([values[c] for c in columns], expected[columns].to_numpy(dtype=float), rtol=1e-9)
+
+    def test_state_round_trips_through_json(self):
+        columns = ['EMA_200', 'RSI_14', 'MACD']
+        indicators = IndicatorSet(columns)
+        indicators.seed(self.data.iloc[:-1])
+        restored = IndicatorSet.from_dict(json.loads(json.dumps(indicators.to_dict())))
+
+        close = self.data['Close'].iloc[-1]
+        self.assertEqual(restored.update(close), indicators.update(close))
+        self.assertEqual(restored.amend(close + 1), indicators.amend(close + 1))
+
+    def test_sma_undo_data_does_not_copy_the_window(self):
+        closes = self.data['Close']
+        sma = StreamingSMA(200)
+        for close in closes.iloc[:-1]:
+            sma.update(close)
+        sma.update(closes.iloc[-1] * 1.05)
+        self.assertNotIn(list, [type(value) for value in sma._previous['mean'].values()])
+
+        restored = StreamingSMA.from_dict(json.loads(json.dumps(sma.to_dict())))
+        expected = calculate_sma(self.data, 200).iloc[-1]
+        self.assertAlmostEqual(sma.amend(closes.iloc[-1]), expected, places=9)
+        self.assertAlmostEqual(restored.amend(closes.iloc[-1]), expected, places=9)
+
+    def test_indicator_must_implement_the_interface(self):
+        class Incomplete(StreamingIndicator):
+            def _step(self, close):
+                return close
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+    def test_unknown_column(self):
+        with self.assertRaises(ValueError):
+            IndicatorSet(['VWAP'])
+
+
+if __name__ == '__main__':
+    unittest.main()
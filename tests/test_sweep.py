@@ -0,0 +1,56 @@
+import functools
+import unittest
+from unittest import mock
+import numpy as np
+from backtesting.portfolio import build_signal_panel, backtest_portfolio
+from backtesting.sweep import expand_grid, required_indicator_columns, run_parameter_sweep
+from strategies.swing_strategies import ema_crossover_long
+from utils.bars import Bars
+from tests.helpers import make_ohlcv
+
+
+class TestSweep(unittest.TestCase):
+
+    def setUp(self):
+        self.stocks_data = {f"T{i}.NS": make_ohlcv(400, seed=i) for i in range(3)}
+        self.grid = {'short_period': [10, 20], 'long_period': [50, 100], 'volume_multiplier': [1.0]}
+
+    def test_expand_grid(self):
+        self.assertEqual(expand_grid({'short_period': [10, 20], 'long_period': [50, 100]}), [
+            {'short_period': 10, 'long_period': 50}, {'short_period': 10, 'long_period': 100},
+            {'short_period': 20, 'long_period': 50}, {'short_period': 20, 'long_period': 100},
+        ])
+        self.assertEqual(expand_grid({}), [{}])
+        self.assertEqual(expand_grid({'short_period': []}), [])
+
+    def test_required_indicator_columns_include_defaults(self):
+        columns = required_indicator_columns(ema_crossover_long, expand_grid({'short_period': [10, 20]}))
+        self.assertEqual(columns, {'EMA_10', 'EMA_20', 'EMA_50'})
+
+    def test_empty_grid_or_universe(self):
+        self.assertTrue(run_parameter_sweep(self.stocks_data, ema_crossover_long, {'short_period': []}, max_workers=0).empty)
+        self.assertTrue(run_parameter_sweep({}, ema_crossover_long, self.grid, max_workers=0).empty)
+
+    def test_matches_a_backtest_per_combination(self):
+        results = run_parameter_sweep(self.stocks_data, ema_crossover_long, self.grid, max_workers=0)
+        self.assertEqual(len(results), 4)
+        self.assertTrue(results['average_profit_loss'].is_monotonic_decreasing)
+        for params in expand_grid(self.grid):
+            indicators = [f"EMA_{params['short_period']}", f"EMA_{params['long_period']}"]
+            closes, signals = build_signal_panel(self.stocks_data, functools.partial(ema_crossover_long, **params), indicators)
+            _, _, expected = backtest_portfolio(closes, signals)
+            row = results[(results['short_period'] == params['short_period']) & (results['long_period'] == params['long_period'])]
+            self.assertEqual(len(row), 1)
+            for metric, value in expected.items():
+                np.testing.assert_allclose(row[metric].iloc[0], value, rtol=1e-9, err_msg=f"{params} {metric}")
+
+    def test_indicators_are_computed_once_per_ticker(self):
+        with mock.patch.object(Bars, 'with_indicators', autospec=True, side_effect=Bars.with_indicators) as with_indicators:
+            run_parameter_sweep(self.stocks_data, ema_crossover_long, self.grid, max_workers=0)
+        self.assertEqual(with_indicators.call_count, len(self.stocks_data))
+        for call in with_indicators.call_args_list:
+            self.assertEqual(call.args[1], ['EMA_10', 'EMA_100', 'EMA_20', 'EMA_50'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from datetime import date, datetime
+from unittest.mock import patch
+from utils.date_utils import get_end_date
+from utils.trading_calendar import TradingCalendar, get_trading_calendar
+
+
+class TestTradingCalendar(unittest.TestCase):
+
+    def setUp(self):
+        self.calendar = get_trading_calendar()
+
+    def test_sessions_exclude_weekends_and_holidays(self):
+        self.assertTrue(self.calendar.is_session(date(2025, 10, 20)))
+        # Diwali Laxmi Pujan and Balipratipada
+        self.assertFalse(self.calendar.is_session(date(2025, 10, 21)))
+        self.assertFalse(self.calendar.is_session(date(2025, 10, 22)))
+        self.assertFalse(self.calendar.is_session(date(2025, 10, 25)))
+        self.assertEqual(len(self.calendar.sessions[self.calendar.sessions.year == 2025]), 261 - 14)
+        # Republic Day and Gandhi Jayanti
+        self.assertFalse(self.calendar.is_session(date(2026, 1, 26)))
+        self.assertFalse(self.calendar.is_session(date(2026, 10, 2)))
+
+    def test_warns_outside_the_holiday_table(self):
+        calendar = TradingCalendar.from_csv()
+        with self.assertLogs('utils.trading_calendar', level='WARNING') as logs:
+            self.assertTrue(calendar.is_session(date(2030, 1, 1)))
+            calendar.last_session(date(2030, 1, 5))
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn('2030', logs.output[0])
+
+    def test_last_and_previous_session(self):
+        self.assertEqual(self.calendar.last_session(date(2025, 10, 22)), date(2025, 10, 20))
+        self.assertEqual(self.calendar.last_session(datetime(2025, 10, 23, 12)), date(2025, 10, 23))
+        self.assertEqual(self.calendar.previous_session(date(2025, 10, 23)), date(2025, 10, 20))
+        with self.assertRaises(ValueError):
+            self.calendar.last_session(date(1999, 12, 31))
+
+    def test_session_bounds_and_weeks(self):
+        self.assertEqual(self.calendar.session_bounds(date(2025, 7, 24)),
+                         (datetime(2025, 7, 24, 9, 15), datetime(2025, 7, 24, 15, 30)))
+        with self.assertRaises(ValueError):
+            self.calendar.session_bounds(date(2025, 8, 15))
+        self.assertEqual(self.calendar.week_start(date(2025, 7, 27)), date(2025, 7, 21))
+        # Good Friday
+        self.assertEqual(self.calendar.last_session_of_week(date(2025, 4, 14)), date(2025, 4, 17))
+        closed_week = TradingCalendar(holidays=[f'2025-07-{day}' for day in range(21, 26)])
+        self.assertIsNone(closed_week.last_session_of_week(date(2025, 7, 23)))
+
+    @patch('utils.date_utils.get_current_time')
+    def test_end_date_skips_holidays(self, current_time_mock):
+        current_time_mock.return_value = datetime(2025, 10, 24, 11, 0)
+        # Any as-of date from the close of the 20th until the next session ends on the same day
+        for as_of_date in (datetime(2025, 10, 20, 16, 0), datetime(2025, 10, 21, 12, 0), date(2025, 10, 22)):
+            self.assertEqual(get_end_date(as_of_date, "1d"), datetime(2025, 10, 21))
+        # Monthly bars end with the last complete month
+        self.assertEqual(get_end_date(date(2025, 9, 30), "1mo"), datetime(2025, 10, 1))
+        self.assertEqual(get_end_date(date(2025, 10, 23), "1mo"), datetime(2025, 10, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,12 +9,13 @@ ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(ROOT_DIR)
 
 import pandas as pd
-from ui.components import sidebar
+from ui.components import sidebar, display_profiling_summary
 from ui.show_signals import show_signals
-from backtesting.ui import run_backtest
+from backtesting.ui import run_backtest, run_portfolio_backtest
 from utils.date_utils import get_current_time
 from utils.constants import nifty_200_tickers_yfinance
 from config.strategy_config import STRATEGY_CONFIG
+from utils.profiling import profiler
 
 if __name__ == '__main__':
     current_time = get_current_time()
@@ -22,16 +23,24 @@ if __name__ == '__main__':
 
     app_mode = st.sidebar.radio(
         "Select Mode",
-        ["Show Signals", "Backtesting", "Fibonacci Analysis", "View Computed Data"],
-        index=3
+        ["Show Signals", "Backtesting", "Portfolio Backtesting", "Fibonacci Analysis", "View Computed Data"],
+        index=4
     )
 
     if app_mode == "Backtesting":
         stock_tickers, backtest_ticker, backtest_start_date, backtest_end_date, backtest_strategy_option, run_backtest_button, selected_analysis_timeframes = sidebar(app_mode)
         run_backtest(backtest_ticker, backtest_start_date, backtest_end_date, backtest_strategy_option)
+    elif app_mode == "Portfolio Backtesting":
+        stock_tickers, timeframe, strategy = sidebar(app_mode)
+        if st.sidebar.button("Run Portfolio Backtest"):
+            run_portfolio_backtest(stock_tickers, timeframe, strategy)
     elif app_mode == "Show Signals":
         stock_tickers, selected_analysis_timeframes, as_of_date = sidebar(app_mode)
+        profiler.enabled = st.sidebar.checkbox("Profile Scan", value=False)
+        profiler.reset()
         show_signals(stock_tickers, selected_analysis_timeframes, as_of_date)
+        if profiler.enabled:
+            display_profiling_summary(profiler.snapshot())
     elif app_mode == "Fibonacci Analysis":
         ticker = st.sidebar.selectbox("Select Stock", nifty_200_tickers_yfinance)
         timeframe = st.sidebar.selectbox("Select Timeframe", list(STRATEGY_CONFIG.keys()), index=0)
@@ -3,7 +3,8 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
 from utils.constants import nifty_50_tickers_yfinance, nifty_200_tickers_yfinance
-from config.strategy_config import STRATEGY_CONFIG
+from config.strategy_config import STRATEGY_CONFIG, STRATEGIES
+from utils.profiling import profiler
 
 def sidebar_show_signals():
     selected_timeframes = st.sidebar.multiselect(
@@ -38,10 +39,21 @@ def sidebar_backtesting():
     )
     backtest_start_date = st.sidebar.date_input("Backtest Start Date")
     backtest_end_date = st.sidebar.date_input("Backtest End Date")
-    backtest_strategy_option = st.sidebar.selectbox("Select Strategy for Backtesting", ["EMA Crossover", "SMA Price Crossover", "RSI Oversold Reversal", "MACD Crossover"])
+    backtest_strategy_option = st.sidebar.selectbox("Select Strategy for Backtesting", ["EMA Crossover", "SMA Price Crossover", "RSI Oversold Reversal", "MACD Crossover", "EMA 200 Breakout"])
     run_backtest = st.sidebar.button("Run Backtest")
     return backtest_ticker, backtest_start_date, backtest_end_date, backtest_strategy_option, run_backtest
 
+def sidebar_portfolio_backtesting():
+    timeframe = st.sidebar.selectbox("Select Timeframe", list(STRATEGY_CONFIG.keys()), index=0)
+    strategy_name = st.sidebar.selectbox("Select Strategy for Backtesting", [strategy['name'] for strategy in STRATEGIES])
+    strategy = next(strategy for strategy in STRATEGIES if strategy['name'] == strategy_name)
+    stock_tickers = st.sidebar.multiselect(
+        "Select Indian Stocks for Backtesting",
+        nifty_200_tickers_yfinance,
+        default=nifty_200_tickers_yfinance
+    )
+    return stock_tickers, timeframe, strategy
+
 def sidebar(app_mode):
     
     stock_tickers = []
@@ -60,6 +72,8 @@ def sidebar(app_mode):
         backtest_ticker, backtest_start_date, backtest_end_date, backtest_strategy_option, run_backtest = sidebar_backtesting()
         stock_tickers = [backtest_ticker] # For consistency in the return value
         return stock_tickers, backtest_ticker, backtest_start_date, backtest_end_date, backtest_strategy_option, run_backtest, selected_analysis_timeframes
+    elif app_mode == "Portfolio Backtesting":
+        return sidebar_portfolio_backtesting()
 
 def get_signal_messages(latest_signals, latest_entry_levels):
     reasons = []
@@ -170,6 +184,7 @@ def add_exit_levels(fig, signal_type, breakout_signals, latest_entry_levels, dat
             fig.add_hline(y=exit1, line=dict(color='green', dash='dash'), name=f'{signal_type} Exit 1', row=1, col=1)
             fig.add_hline(y=exit2, line=dict(color='green', dash='dot'), name=f'{signal_type} Exit 2', row=1, col=1)
 
+@profiler.timed('ui.chart')
 def display_stock_chart(data, breakout_signals, latest_entry_levels=None):
     fig = make_subplots(rows=3, cols=1, shared_xaxes=True,
                         row_heights=[3, 1, 1], vertical_spacing=0.03,
@@ -191,3 +206,17 @@ def display_indicator_values(data, ticker):
     if st.checkbox(f"Show Indicator Values for {ticker}", value=True):
         st.subheader("Indicator Values:")
         st.dataframe(data.tail())
+
+def display_profiling_summary(snapshot):
+    with st.expander("Profiling Summary", expanded=True):
+        timings = pd.DataFrame.from_dict(snapshot['timings'], orient='index')
+        if timings.empty:
+            st.info("No stages were timed in this run.")
+        else:
+            timings.index.name = 'Stage'
+            timings['avg_ms'] = timings['total_s'] / timings['calls'] * 1000
+            st.dataframe(timings.style.format({'total_s': '{:.3f}', 'max_s': '{:.3f}', 'avg_ms': '{:.2f}'}))
+        if snapshot['counters']:
+            counters = pd.Series(snapshot['counters'], name='Count')
+            counters.index.name = 'Counter'
+            st.dataframe(counters)
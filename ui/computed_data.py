@@ -1,13 +1,12 @@
 import streamlit as st
 import pandas as pd
-from utils.data_fetching import fetch_stock_data
-from utils.calculations import calculate_indicators
+from ui.data_cache import fetch_stock_data
+from utils.signals import get_indicator_frame
 from utils.constants import TIMEFRAMES
 from config.strategy_config import STRATEGY_CONFIG
-import logging
+from utils.logger import get_logger
 
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+log = get_logger(__name__)
 
 def show_computed_data(ticker, timeframe, as_of_date):
     """Display computed technical indicators and data for a given ticker and timeframe"""
@@ -24,7 +23,7 @@ def show_computed_data(ticker, timeframe, as_of_date):
         return
 
     # Calculate indicators
-    data = calculate_indicators(stock_data.copy())
+    data = get_indicator_frame(ticker, timeframe_value, stock_data)
     # Create a DataFrame with all relevant indicators
     display_data = pd.DataFrame()
     display_data['Date'] = data.index
@@ -0,0 +1,14 @@
+import streamlit as st
+from utils import data_fetching
+
+# Streamlit caching lives in the UI layer so utils.data_fetching stays importable without streamlit.
+# The cached frames live as long as the app server, so they are kept as compact bars.
+
+@st.cache_data
+def fetch_stock_data(ticker, period="1y", interval="1d", as_of_date=None):
+    return data_fetching.fetch_stock_data(ticker, period=period, interval=interval, as_of_date=as_of_date, compact=True)
+
+@st.cache_data
+def fetch_stocks_data(tickers, period="1y", interval="1d", as_of_date=None, chunk_size=data_fetching.BULK_CHUNK_SIZE):
+    return data_fetching.fetch_stocks_data(tickers, period=period, interval=interval, as_of_date=as_of_date,
+                                           chunk_size=chunk_size, compact=True)
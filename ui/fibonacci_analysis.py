@@ -1,7 +1,7 @@
 import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
-from utils.data_fetching import fetch_stock_data
+from ui.data_cache import fetch_stock_data
 from utils.constants import TIMEFRAMES
 from strategies.fibonacci_strategies import identify_swing_points
 
@@ -0,0 +1,153 @@
+import os
+import numpy as np
+import pandas as pd
+from utils.constants import DATA_DIR
+from utils.date_utils import get_current_time
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+BAR_STORE_DIR = os.path.join(DATA_DIR, 'bars')
+
+# Relative difference between a stored complete bar and its re-download above which the stored
+# history counts as revised, e.g. adjusted for a split or dividend since it was fetched
+REVISION_TOLERANCE = 1e-4
+PRICE_COLUMNS = ('Open', 'High', 'Low', 'Close', 'Adj Close')
+
+
+class BarStore:
+    """
+    On-disk store of OHLCV bars with one Parquet file per ticker and interval.
+
+    Every file remembers the window it is known to be complete for: 'covered_from' is the
+    earliest start that was requested and 'through' is the exclusive end of the latest fetch.
+    Requests inside that window are answered from disk, anything outside of it is fetched
+    as a backfill or a top-up and merged into the file.
+    """
+
+    def __init__(self, root: str = BAR_STORE_DIR):
+        self.root = root
+
+    def path(self, ticker: str, interval: str) -> str:
+        return os.path.join(self.root, interval, f"{ticker}.parquet")
+
+    def read(self, ticker: str, interval: str):
+        """
+        Reads the stored bars for a ticker.
+
+        Returns:
+            pd.DataFrame: Stored bars with the coverage window in attrs, or None if nothing is stored.
+        """
+        path = self.path(ticker, interval)
+        if not os.path.exists(path):
+            return None
+        try:
+            return pd.read_parquet(path)
+        except Exception as e:
+            log.warning(f"Discarding unreadable bar file {path}: {e}")
+            return None
+
+    def write(self, ticker: str, interval: str, data: pd.DataFrame):
+        path = self.path(ticker, interval)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        data.to_parquet(tmp_path)
+        os.replace(tmp_path, path)
+
+    def missing_windows(self, data, start: pd.Timestamp, end=None) -> list:
+        """
+        Returns the (start, end) windows that have to be downloaded to answer a request.
+
+        A window end of None means "up to now"; requests without an end always top up the
+        latest bar since it may still be forming.
+        """
+        if data is None or data.empty:
+            return [(start, end)]
+
+        windows = []
+        covered_from = pd.Timestamp(data.attrs.get('covered_from', data.index[0]))
+        through = pd.Timestamp(data.attrs.get('through', data.index[-1]))
+        if start < covered_from:
+            windows.append((start, covered_from))
+        if end is None or end > through:
+            last_timestamp = data.index[-1]
+            if end is None or last_timestamp < end:
+                # Re-fetch the last stored bar as well, it may have been a partial one
+                windows.append((last_timestamp.normalize(), end))
+        return windows
+
+    def is_revised(self, data, new_data, tolerance=REVISION_TOLERANCE) -> bool:
+        """
+        Whether downloaded bars disagree with the complete stored bars they overlap (those
+        before 'through'; a forming bar is expected to change), meaning the source has
+        revised the history since it was stored.
+        """
+        if data is None or data.empty or new_data is None or new_data.empty:
+            return False
+        through = pd.Timestamp(data.attrs.get('through', data.index[-1]))
+        overlap = new_data.index[new_data.index.isin(data.index) & (new_data.index < through)]
+        columns = [column for column in PRICE_COLUMNS if column in data.columns and column in new_data.columns]
+        if overlap.empty or not columns:
+            return False
+        stored = data.loc[overlap, columns].to_numpy(dtype=np.float64)
+        downloaded = new_data.loc[overlap, columns].to_numpy(dtype=np.float64)
+        return not np.allclose(downloaded, stored, rtol=tolerance, atol=0, equal_nan=True)
+
+    def merge(self, ticker: str, interval: str, data, new_data, start: pd.Timestamp, end=None):
+        """
+        Merges freshly downloaded bars into the stored ones and persists the result.
+        Downloaded bars replace stored bars with the same timestamp. A successful download of
+        [start, end) without any bar still extends the stored window over it, so it is not
+        requested again.
+
+        Revised bars are never spliced onto the stale history (see is_revised): the stored
+        bars are dropped and the file only keeps the downloaded window, load_stocks_data
+        refetches the rest.
+        """
+        if self.is_revised(data, new_data):
+            log.warning(f"Stored {interval} bars of {ticker} were revised at the source, dropping them")
+            data = None
+        has_new_data = new_data is not None and not new_data.empty
+        if data is None or data.empty:
+            if not has_new_data:
+                return data
+            merged = new_data.copy()
+            covered_from, through = start, end
+        else:
+            merged = pd.concat([data[~data.index.isin(new_data.index)], new_data]).sort_index() if has_new_data else data.copy()
+            covered_from = min(start, pd.Timestamp(data.attrs.get('covered_from', data.index[0])))
+            through = pd.Timestamp(data.attrs.get('through', data.index[-1]))
+            if end is None or end > through:
+                through = end
+
+        if through is None:
+            # Open ended fetch: everything before today is final
+            through = pd.Timestamp(get_current_time()).normalize()
+        attrs = {'covered_from': str(covered_from), 'through': str(through)}
+        if not has_new_data and data.attrs == attrs:
+            return data
+        merged.attrs = attrs
+        self.write(ticker, interval, merged)
+        return merged
+
+    def replace(self, ticker: str, interval: str, new_data, start: pd.Timestamp, end=None):
+        """Rewrites a ticker's stored bars with the download of [start, end), dropping the rest"""
+        if new_data is None or new_data.empty:
+            path = self.path(ticker, interval)
+            if os.path.exists(path):
+                os.remove(path)
+            return None
+        return self.merge(ticker, interval, None, new_data, start, end)
+
+
+def slice_bars(data: pd.DataFrame, start: pd.Timestamp, end=None) -> pd.DataFrame:
+    """Returns the bars in [start, end) without the store bookkeeping attrs."""
+    mask = data.index >= start
+    if end is not None:
+        mask &= data.index < end
+    sliced = data[mask]
+    sliced.attrs = {}
+    return sliced
+
+
+bar_store = BarStore()
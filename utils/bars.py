@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+from utils.calculations import iter_indicators
+
+
+def readonly(values) -> np.ndarray:
+    """A read-only view of values"""
+    array = np.asarray(values).view()
+    array.flags.writeable = False
+    return array
+
+
+class Bars:
+    """
+    Read-only bars of one ticker: a DatetimeIndex and one array per column. Columns keep their
+    dtype, so compact bars (float32 prices, int64 volume) stay compact; indicators are float64.
+
+    Stages share a Bars instead of copying DataFrames. Adding indicators returns a new Bars
+    holding the same OHLCV arrays plus the new ones, and frame() wraps the arrays in a
+    DataFrame without copying them. The arrays are not writeable, so no stage can change the
+    bars another stage sees: writing into them through a frame() raises, adding columns to
+    the frame does not touch them.
+    """
+
+    __slots__ = ('index', 'arrays')
+
+    def __init__(self, index: pd.Index, arrays: dict):
+        self.index = index
+        self.arrays = arrays
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame):
+        """Wraps the columns of data without copying them"""
+        if len(set(data.dtypes)) == 1:
+            # A frame of one block converts to a view of it, one column per row of the block
+            values = data.to_numpy()
+            return cls(data.index, {column: readonly(values[:, i]) for i, column in enumerate(data.columns)})
+        return cls(data.index, {column: readonly(data[column].to_numpy()) for column in data.columns})
+
+    @property
+    def columns(self) -> list:
+        return list(self.arrays)
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, column):
+        return column in self.arrays
+
+    def __getitem__(self, column) -> pd.Series:
+        return pd.Series(self.arrays[column], index=self.index, name=column, copy=False)
+
+    def with_columns(self, arrays: dict):
+        """Returns a Bars with arrays added or replaced, sharing the existing ones"""
+        return Bars(self.index, {**self.arrays, **{column: readonly(values) for column, values in arrays.items()}})
+
+    def with_indicators(self, columns=None):
+        """Returns a Bars with the indicator columns calculate_indicators adds"""
+        return self.with_columns({column: values.to_numpy() for column, values in iter_indicators(self, columns)})
+
+    def frame(self) -> pd.DataFrame:
+        """A DataFrame over the arrays, without copying them"""
+        return pd.DataFrame(self.arrays, index=self.index, copy=False)
@@ -1,12 +1,57 @@
 from indicators.technical_indicators import calculate_ema, calculate_sma, calculate_rsi, calculate_macd
 import pandas as pd
 
-def calculate_indicators(data: pd.DataFrame):
-    data['EMA_200'] = calculate_ema(data, 200, column='Close')
-    data['EMA_20'] = calculate_ema(data, 20, column='Close')
-    data['SMA_50'] = calculate_sma(data, 50, column='Close')
-    data['RSI_14'] = calculate_rsi(data, column='Close')
-    data['EMA_50'] = calculate_ema(data, 50, column='Close')
-    macd_df = calculate_macd(data)
-    data = pd.concat([data, macd_df], axis=1)
-    return data
\ No newline at end of file
+MACD_COLUMNS = ('MACD', 'Signal', 'Histogram')
+
+# Everything the charts and the computed data view display
+DEFAULT_INDICATORS = ['EMA_200', 'EMA_20', 'SMA_50', 'RSI_14', 'EMA_50', *MACD_COLUMNS]
+
+def required_indicators(strategies) -> list:
+    """Returns the union of the 'indicators' declared by strategy config dicts, in declaration order."""
+    return list(dict.fromkeys(column for strategy in strategies for column in strategy.get('indicators', [])))
+
+def calculate_indicators(data: pd.DataFrame, columns=None):
+    """
+    Adds indicator columns to data in place and returns it.
+
+    Args:
+        data (pd.DataFrame): DataFrame containing the stock data.
+        columns (list): Indicator columns to add, e.g. from required_indicators. Defaults to DEFAULT_INDICATORS.
+    """
+    for column, values in iter_indicators(data, columns):
+        data[column] = values
+    return data
+
+def iter_indicators(data, columns=None):
+    """
+    Yields (column, pd.Series) for the indicator columns calculate_indicators adds. data only
+    needs to return a Close Series for data['Close'], e.g. a utils.bars.Bars.
+    """
+    if columns is None:
+        columns = DEFAULT_INDICATORS
+    macd_df = None
+    for column in columns:
+        if column in MACD_COLUMNS:
+            # One MACD calculation provides all three columns
+            if macd_df is None:
+                macd_df = calculate_macd(data)
+            yield column, macd_df[column]
+        else:
+            yield column, calculate_indicator(data, column)
+
+def calculate_indicator(data: pd.DataFrame, column: str) -> pd.Series:
+    """
+    Calculates a single indicator column named the way calculate_indicators names them,
+    e.g. 'EMA_20', 'SMA_50', 'RSI_14' or one of the MACD columns.
+    """
+    name, _, period = column.partition('_')
+    if period.isdigit():
+        if name == 'EMA':
+            return calculate_ema(data, int(period), column='Close')
+        if name == 'SMA':
+            return calculate_sma(data, int(period), column='Close')
+        if name == 'RSI':
+            return calculate_rsi(data, int(period), column='Close')
+    if column in MACD_COLUMNS:
+        return calculate_macd(data)[column]
+    raise ValueError(f"Unknown indicator column '{column}'")
\ No newline at end of file
@@ -1,6 +1,11 @@
 from datetime import date
+import os
 import pandas as pd
 
+# Resolve data files against the project root so scripts can be run from any directory
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(ROOT_DIR, 'data')
+
 nifty_50_tickers_yfinance = [
     "ADANIENT.NS",
     "ADANIPORTS.NS",
@@ -52,10 +57,20 @@ nifty_50_tickers_yfinance = [
     "SHRIRAMFIN.NS"
 ]
 def get_nifty_200_tickers():
-    df = pd.read_csv('data/raw/ind_nifty200list.csv')
+    df = pd.read_csv(os.path.join(DATA_DIR, 'raw', 'ind_nifty200list.csv'))
     return [f"{ticker}.NS" for ticker in df['Symbol'].tolist()]
 
 nifty_200_tickers_yfinance = get_nifty_200_tickers()
 
 # get interval, period for the timeframes
-TIMEFRAMES = {'1 Day': ('1d', '2y'), '1 Week': ('1wk', '10y'), '1 Month': ('1mo', '10y')}
\ No newline at end of file
+TIMEFRAMES = {'1 Day': ('1d', '2y'), '1 Week': ('1wk', '10y'), '1 Month': ('1mo', '10y')}
+
+# Return fetched bars as float32 prices and int64 volume without unused columns (see
+# data_fetching.compact_bars). Off by default since float32 prices shift indicator values
+# in the 7th significant digit. The Streamlit app fetches compact bars on every page through
+# its caches, the scan included; the headless scan does with --compact.
+COMPACT_BARS = False
+
+# Build weekly and monthly bars from the stored daily bars (see utils/resampling.py) instead of
+# downloading and storing them separately, so every ticker's history is only fetched once
+RESAMPLE_FROM_DAILY = True
\ No newline at end of file
@@ -0,0 +1,150 @@
+import os
+import time
+from abc import ABC, abstractmethod
+import pandas as pd
+from utils.profiling import profiler
+from utils.resampling import RESAMPLED_INTERVALS, resample_bars
+
+# Where bars come from. load_stocks_data asks the active source only for the windows the bar
+# store is missing, so a source just has to answer "bars of these tickers in [start, end)".
+
+
+class DataSource(ABC):
+    """Interface of a source of OHLCV bars"""
+
+    name = None
+
+    @abstractmethod
+    def download(self, tickers, interval, start, end=None) -> dict:
+        """
+        Returns the bars of every ticker in [start, end) as a mapping of ticker to a DataFrame
+        cleaned by cleanup_columns. An end of None means up to now. Tickers without bars are
+        left out; errors are raised to the caller.
+        """
+
+
+class YahooDataSource(DataSource):
+    """Bars from Yahoo Finance, several tickers per grouped request"""
+
+    name = 'yahoo'
+
+    def download(self, tickers, interval, start, end=None) -> dict:
+        import yfinance as yf  # Imported lazily, it is slow to import and not needed for disk hits
+
+        with profiler.stage('fetch.download'):
+            data = yf.download(tickers, start=start, end=end, interval=interval, auto_adjust=False, group_by='ticker', progress=False)
+        if data is None or data.empty:
+            return {}
+        if profiler.enabled:
+            # In-memory size of the downloaded frame, yfinance does not expose the bytes on the wire
+            profiler.count('fetch.bytes', int(data.memory_usage(index=True).sum()))
+        return split_tickers_data(data, tickers)
+
+
+class ReplayDataSource(DataSource):
+    """
+    Bars recorded on disk, for running scans, backtests, tests and benchmarks offline.
+
+    Recordings are laid out like the bar store, <root>/<interval>/<ticker>.parquet (or .csv with
+    the dates in the first column), so a copy of data/bars can be replayed as is; record()
+    writes new ones. Weekly and monthly requests fall back to resampling the daily recording.
+
+    Args:
+        root (str): Directory of the recordings.
+        latency (float): Seconds every download waits, to simulate a network round trip.
+        as_of_date (date): Replay the market as of this date, later bars are never returned.
+    """
+
+    name = 'replay'
+
+    def __init__(self, root, latency=0.0, as_of_date=None):
+        self.root = root
+        self.latency = latency
+        self.as_of_date = None if as_of_date is None else pd.Timestamp(as_of_date).normalize()
+
+    def path(self, ticker, interval, extension='parquet'):
+        return os.path.join(self.root, interval, f"{ticker}.{extension}")
+
+    def read(self, ticker, interval):
+        """Returns the whole recording of a ticker, None if there is none"""
+        path = self.path(ticker, interval)
+        if os.path.exists(path):
+            return pd.read_parquet(path)
+        path = self.path(ticker, interval, 'csv')
+        if os.path.exists(path):
+            return pd.read_csv(path, index_col=0, parse_dates=True)
+        if interval in RESAMPLED_INTERVALS:
+            return resample_bars(self.read(ticker, '1d'), interval)
+        return None
+
+    def download(self, tickers, interval, start, end=None) -> dict:
+        if self.latency:
+            time.sleep(self.latency)
+
+        stocks_data = {}
+        for ticker in tickers:
+            data = self.read(ticker, interval)
+            if data is None:
+                continue
+            mask = data.index >= start
+            if end is not None:
+                mask &= data.index < end
+            if self.as_of_date is not None:
+                mask &= data.index.normalize() <= self.as_of_date
+            data = data[mask].dropna(how='all')
+            if not data.empty and 'Close' in data.columns:
+                data.attrs = {}
+                stocks_data[ticker] = cleanup_columns(data)
+        return stocks_data
+
+    def record(self, stocks_data: dict, interval: str):
+        """Writes bars (ticker -> DataFrame) as recordings of interval"""
+        os.makedirs(os.path.join(self.root, interval), exist_ok=True)
+        for ticker, data in stocks_data.items():
+            data = data.copy()
+            data.attrs = {}
+            data.to_parquet(self.path(ticker, interval))
+
+
+def split_tickers_data(data, tickers):
+    """
+    Splits a grouped multi-ticker download into per-ticker frames cleaned by cleanup_columns.
+    """
+    stocks_data = {}
+    if not isinstance(data.columns, pd.MultiIndex):
+        # A single ticker download comes back with flat columns
+        if len(tickers) == 1 and 'Close' in data.columns:
+            stocks_data[tickers[0]] = cleanup_columns(data.dropna(how='all'))
+        return stocks_data
+
+    available = data.columns.get_level_values(0)
+    for ticker in tickers:
+        if ticker not in available:
+            continue
+        ticker_data = data[ticker].dropna(how='all')
+        if ticker_data.empty or 'Close' not in ticker_data.columns:
+            continue
+        stocks_data[ticker] = cleanup_columns(ticker_data)
+    return stocks_data
+
+@profiler.timed('fetch.cleanup_columns')
+def cleanup_columns(data):
+    if 'Adj Close' in data.columns:
+        data = data[['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']].astype(float)
+    else:
+        data = data[['Open', 'High', 'Low', 'Close', 'Volume']].astype(float)
+    return data
+
+
+_data_source = YahooDataSource()
+
+
+def get_data_source() -> DataSource:
+    return _data_source
+
+
+def set_data_source(source: DataSource) -> DataSource:
+    """Makes source the one every download goes to and returns the previous one"""
+    global _data_source
+    previous, _data_source = _data_source, source
+    return previous
@@ -1,104 +1,102 @@
+import functools
 from datetime import datetime, timedelta
+from utils.trading_calendar import get_trading_calendar, MARKET_OPEN, MARKET_CLOSE
+
+# Calendar days covered by the periods accepted by get_start_date, besides '<n>d'
+PERIOD_DAYS = {'6mo': 183, '1y': 365, '2y': 730, '5y': 1825, '10y': 3650}
+
+
+@functools.lru_cache(maxsize=None)
+def _market_timezone():
+    import pytz
+
+    return pytz.timezone('Asia/Kolkata')
+
 
 def get_current_time():
     """
     Get the current time in the format YYYY-MM-DD HH:MM:SS
     """
-    from datetime import datetime
-    import pytz
-
-    local_tz = pytz.timezone('Asia/Kolkata')  # Change timezone as needed
-    dt = datetime.now(local_tz)
+    dt = datetime.now(_market_timezone())
     return datetime(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second)
 
 
 def get_start_date(period, as_of_date):
-    start = as_of_date
-    # Adjust the start based on the as_of_date and period
-    if(period == "1y"):
-        start = start - timedelta(days=365)
-    elif(period == "2y"):
-        start = start - timedelta(days=730)
-    elif(period == "6mo"):
-        start = start - timedelta(days=183)
-    elif(period == "5y"):
-        start = start - timedelta(days=1825)
-    elif(period == "10y"):  
-        start = start - timedelta(days=3650)
-    return start
+    if period in PERIOD_DAYS:
+        return as_of_date - timedelta(days=PERIOD_DAYS[period])
+    if period.endswith("d") and period[:-1].isdigit():
+        return as_of_date - timedelta(days=int(period[:-1]))
+    return as_of_date
 
 def get_end_date(as_of_date, interval):
-    # for interval '1 Day'
-    #  if as_of_date is in market hour then return as_of_date
-    #  else return the as_of_date + 1 day
-    # for interval '1 Week'
-    #  if as_of_date is in market hour then return as_of_date
-    #  else return the last business friday before the as_of_date + 1 day
-    as_of_date = datetime(as_of_date.year, as_of_date.month, as_of_date.day, 0, 0, 0)
-
-    if interval == "1d":
-        if is_market_time(as_of_date):
-            return as_of_date
-        elif is_after_market_time(as_of_date):
-            return as_of_date + timedelta(days=1)
-        elif is_before_market_time(as_of_date) and is_same_day(as_of_date, get_current_time()):
-            return as_of_date
-        else:
-            return as_of_date + timedelta(days=1)
-        
-    elif interval == "1wk":
-        if is_after_market_time(as_of_date) and is_same_day(as_of_date, get_current_time()):
-            return as_of_date + timedelta(days=1)
-        elif is_same_day(as_of_date, get_current_time()) and (is_before_market_time(as_of_date) or is_market_time(as_of_date) ):
-            as_of_date = as_of_date - timedelta(days=1)
-            return get_last_business_friday(as_of_date) + timedelta(days=1)
+    """
+    Returns the exclusive end of the bars that are complete as of as_of_date.
+
+    A session counts as complete once as_of_date is past its day, or on its day after the
+    close. An as_of_date on an earlier day than today stands for the end of that day, so a
+    past session is complete whatever time of day as_of_date carries. A daily request ends
+    the day after the last complete session, a weekly request on the Saturday after the last
+    complete week and a monthly request on the first of the month after the last complete
+    month, so every as_of_date between two sessions maps to the same end.
+    """
+    calendar = get_trading_calendar()
+    if not isinstance(as_of_date, datetime):
+        as_of_date = datetime(as_of_date.year, as_of_date.month, as_of_date.day)
+    day = as_of_date.date()
+    is_today = day == get_current_time().date()
+
+    def is_complete(session):
+        return session is not None and (
+            session < day or (session == day and (not is_today or as_of_date.time() > MARKET_CLOSE))
+        )
+
+    if interval == "1wk":
+        week_start = calendar.week_start(day)
+        if not is_complete(calendar.last_session_of_week(day)):
+            week_start -= timedelta(days=7)
+        end = week_start + timedelta(days=5)
+    elif interval == "1mo":
+        month_start = day.replace(day=1)
+        if is_complete(calendar.last_session_of_month(day)):
+            end = (month_start + timedelta(days=32)).replace(day=1)
         else:
-            return get_last_business_friday(as_of_date) + timedelta(days=1)
+            end = month_start
+    else:
+        session = calendar.last_session(day)
+        if not is_complete(session):
+            session = calendar.previous_session(session)
+        end = session + timedelta(days=1)
+    return datetime(end.year, end.month, end.day)
 
 def get_last_business_day(date):
-        # find the last working day before the given date excluding weekends
-        # if date is a weekend, return the last Friday
-        # if date is a monday, return the last Friday
-        # if date is a Friday, return the last Thursday
-        last_date = date
-        while True:
-            last_date -= timedelta(days=1)
-            if last_date.weekday() in [0, 1, 2, 3, 4]:
-                break
-        return last_date
-    
+    """Returns the last trading session before the given date"""
+    session = get_trading_calendar().previous_session(date)
+    return datetime.combine(session, datetime.min.time()) if isinstance(date, datetime) else session
+
 def get_last_business_friday(date):
-    # find the last working day before the given date excluding weekends which is a Friday
-    last_date = date    
-    
-    while last_date.weekday() != 4:
-        last_date -= timedelta(days=1)
-    return last_date
+    """Returns the given date if it is a Friday, otherwise the Friday before it"""
+    return date - timedelta(days=(date.weekday() - 4) % 7)
 
 def is_market_time(date):
     """
-    Check if the current time is within market hours (9:15 AM to 3:30 PM IST).
+    Check if the time is within a trading session (9:15 AM to 3:30 PM IST).
     """
-    return not(is_before_market_time(date) or is_after_market_time(date))
+    return get_trading_calendar().is_session(date) and MARKET_OPEN <= date.time() <= MARKET_CLOSE
 
 def is_before_market_time(date):
     """
-    Check if the current time is before market hours (9:15 AM IST).
+    Check if the time is before market hours (9:15 AM IST) of its day.
     """
-    current = get_current_time()
-    market_start = current.replace(hour=9, minute=15, second=0, microsecond=0)
-    return date < market_start
+    return date.time() < MARKET_OPEN
 
 def is_after_market_time(date):
     """
-    Check if the current time is after market hours (3:30 PM IST).
+    Check if the time is after market hours (3:30 PM IST) of its day.
     """
-    current = get_current_time()
-    market_end = current.replace(hour=15, minute=30, second=0, microsecond=0)
-    return date > market_end
+    return date.time() > MARKET_CLOSE
 
 def is_same_day(date1, date2):
     """
     Check if two dates are the same day.
     """
-    return date1.date() == date2.date()
\ No newline at end of file
+    return date1.date() == date2.date()
@@ -0,0 +1,209 @@
+import time
+from datetime import datetime
+import pandas as pd
+from config.strategy_config import STRATEGY_CONFIG
+from indicators.streaming import IndicatorSet
+from utils.bar_store import bar_store
+from utils.calculations import required_indicators
+from utils.constants import TIMEFRAMES
+from utils.data_fetching import load_stocks_data, download_stocks_data, BULK_CHUNK_SIZE
+from utils.date_utils import get_current_time, MARKET_OPEN, MARKET_CLOSE
+from utils.resampling import source_interval, resample_bars
+from utils.trading_calendar import get_trading_calendar
+from utils.signals import calculate_signals_for_ticker, update_latest_close, update_signals_for_ticker, build_signal_row
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# Seconds between polls of the forming bars
+DEFAULT_POLL_INTERVAL = 60
+
+
+def current_bar_start(interval, now):
+    """Returns the timestamp the bar forming at now is labelled with on Yahoo Finance"""
+    day = pd.Timestamp(now).normalize()
+    if interval == '1wk':
+        return day - pd.Timedelta(days=day.weekday())
+    if interval == '1mo':
+        return day.replace(day=1)
+    return day
+
+
+class LiveScanner:
+    """
+    Keeps the signal table of a universe current while the market is open.
+
+    start() loads the history of every selected timeframe from the bar store once and seeds
+    streaming indicators from it. Each poll() then downloads only the forming daily/weekly bar
+    of every ticker, merges it into the store, advances the indicators by that one bar and
+    re-evaluates the strategies of the tickers and timeframes whose bar actually changed.
+    Weekly and monthly bars built from daily bars are rebuilt from the polled daily bar.
+    """
+
+    def __init__(self, stock_tickers, selected_timeframes, store=bar_store, chunk_size=BULK_CHUNK_SIZE):
+        self.stock_tickers = list(stock_tickers)
+        self.selected_timeframes = [tf for tf in selected_timeframes if tf in STRATEGY_CONFIG]
+        self.store = store
+        self.chunk_size = chunk_size
+        self.stored = {}      # (ticker, source interval) -> stored bars, merged with every poll
+        self.frames = {}      # (ticker, timeframe) -> bars with indicator columns
+        self.indicators = {}  # (ticker, timeframe) -> IndicatorSet advanced with the frame
+        self.signals = {}     # ticker -> signal row as built by process_ticker_signals
+        self.latest_close = {}
+
+    def intervals(self):
+        """Returns interval -> timeframe names scanned on it"""
+        intervals = {}
+        for timeframe_name in self.selected_timeframes:
+            intervals.setdefault(TIMEFRAMES[timeframe_name][0], []).append(timeframe_name)
+        return intervals
+
+    def source_intervals(self):
+        """Returns source interval -> interval -> timeframe names scanned on it"""
+        sources = {}
+        for interval, timeframe_names in self.intervals().items():
+            sources.setdefault(source_interval(interval), {})[interval] = timeframe_names
+        return sources
+
+    def start(self):
+        """Loads history and evaluates every ticker once"""
+        for timeframe_name in self.selected_timeframes:
+            interval, period = TIMEFRAMES[timeframe_name]
+            source = source_interval(interval)
+            stocks_data = load_stocks_data(self.stock_tickers, period=period, interval=interval,
+                                           chunk_size=self.chunk_size, store=self.store)
+            for ticker, data in stocks_data.items():
+                if (ticker, source) not in self.stored:
+                    self.stored[(ticker, source)] = self.store.read(ticker, source)
+                indicators = IndicatorSet(required_indicators(STRATEGY_CONFIG[timeframe_name]))
+                self.frames[(ticker, timeframe_name)] = data.join(indicators.seed(data))
+                self.indicators[(ticker, timeframe_name)] = indicators
+
+        for ticker in self.stock_tickers:
+            self.signals[ticker] = {'Ticker': ticker}
+            for timeframe_name in self.selected_timeframes:
+                self.evaluate(ticker, timeframe_name)
+
+    def poll(self, now=None):
+        """
+        Downloads the forming bar of every ticker and re-evaluates what changed.
+
+        Returns:
+            list: Tickers whose signal row was re-evaluated.
+        """
+        now = now or get_current_time()
+        changed = set()
+        for source, intervals in self.source_intervals().items():
+            start = current_bar_start(source, now)
+            tickers = [ticker for ticker in self.stock_tickers if (ticker, source) in self.stored]
+            for i in range(0, len(tickers), self.chunk_size):
+                downloaded = download_stocks_data(tickers[i:i + self.chunk_size], source, start) or {}
+                for ticker, new_data in downloaded.items():
+                    new_data = new_data[new_data.index >= start]
+                    if new_data.empty:
+                        continue
+                    key = (ticker, source)
+                    self.stored[key] = self.store.merge(ticker, source, self.stored[key], new_data, start)
+                    for interval, timeframe_names in intervals.items():
+                        if interval == source:
+                            bars = new_data
+                        else:
+                            stored = self.stored[key]
+                            bars = resample_bars(stored[stored.index >= current_bar_start(interval, now)], interval)
+                        for timeframe_name in timeframe_names:
+                            if self.apply_bars(ticker, timeframe_name, bars):
+                                self.evaluate(ticker, timeframe_name)
+                                changed.add(ticker)
+
+        log.info(f"Live poll at {now:%H:%M:%S} re-evaluated {len(changed)} of {len(self.stock_tickers)} tickers")
+        return [ticker for ticker in self.stock_tickers if ticker in changed]
+
+    def apply_bars(self, ticker, timeframe_name, new_data):
+        """Advances a ticker's frame and indicators by the polled bars, returns whether anything changed"""
+        key = (ticker, timeframe_name)
+        data = self.frames.get(key)
+        if data is None:
+            return False
+        indicators = self.indicators[key]
+        columns = [column for column in new_data.columns if column in data.columns]
+
+        updated = False
+        appended = []
+        for timestamp, bar in new_data[columns].iterrows():
+            last_timestamp = data.index[-1] if not appended else appended[-1].name
+            if timestamp < last_timestamp:
+                continue
+            if timestamp == last_timestamp and not appended:
+                if data.loc[timestamp, columns].equals(bar):
+                    continue
+                values = indicators.amend(bar['Close'])
+                data.loc[timestamp, columns] = bar.to_numpy()
+                data.loc[timestamp, list(values)] = list(values.values())
+            else:
+                values = indicators.update(bar['Close'])
+                appended.append(pd.Series({**bar.to_dict(), **values}, name=timestamp))
+            updated = True
+
+        if appended:
+            # Strategies may have added their own columns to the frame, those are recalculated anyway
+            self.frames[key] = pd.concat([data, pd.DataFrame(appended).reindex(columns=data.columns)])
+        return updated
+
+    def evaluate(self, ticker, timeframe_name):
+        """Re-runs the strategies of one timeframe for a ticker and updates its signal row"""
+        data = self.frames.get((ticker, timeframe_name))
+        if data is None:
+            return
+        breakout_signals, _ = calculate_signals_for_ticker(data, timeframe_name, latest_only=True)
+        update_signals_for_ticker(self.signals[ticker], timeframe_name, breakout_signals.tail(1))
+        self.latest_close[ticker] = update_latest_close(data, timeframe_name, self.latest_close.get(ticker))
+
+    def results(self) -> pd.DataFrame:
+        """Returns the current signal table in ticker order, like the one-shot scan"""
+        rows = []
+        for ticker in self.stock_tickers:
+            all_data_fetched = all((ticker, tf) in self.frames for tf in self.selected_timeframes)
+            row = build_signal_row(dict(self.signals.get(ticker, {'Ticker': ticker})), self.latest_close.get(ticker),
+                                   all_data_fetched, self.selected_timeframes)
+            if row is not None:
+                rows.append(row)
+        return pd.DataFrame(rows, columns=None if rows else ['Ticker'])
+
+
+def run_live_scan(scanner, poll_interval=DEFAULT_POLL_INTERVAL, on_update=None, clock=get_current_time, sleep=time.sleep):
+    """
+    Polls a LiveScanner during market hours (09:15-15:30 IST on trading sessions).
+
+    Before the open it waits for it, during the session it polls every poll_interval seconds
+    and after the close it polls once more to pick up the closing bars, then returns.
+    on_update(scanner, changed_tickers) is called after the initial load and after every poll
+    that changed something.
+    """
+    now = clock()
+    if not get_trading_calendar().is_session(now):
+        log.info(f"{now.date()} is not a trading session, nothing to poll")
+        return
+
+    scanner.start()
+    if on_update:
+        on_update(scanner, list(scanner.stock_tickers))
+
+    polled = False
+    while True:
+        now = clock()
+        if now.time() < MARKET_OPEN:
+            sleep((datetime.combine(now.date(), MARKET_OPEN) - now).total_seconds())
+            continue
+        closed = now.time() > MARKET_CLOSE
+        if closed and not polled:
+            # Started after the close, the initial load already has the closing bars
+            return
+
+        changed = scanner.poll(now)
+        polled = True
+        if changed and on_update:
+            on_update(scanner, changed)
+        if closed:
+            log.info("Market closed, stopping live mode")
+            return
+        sleep(poll_interval)
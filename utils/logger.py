@@ -1,29 +1,99 @@
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Name of the handler get_logger attaches, used to recognise (and replace) it on loggers
+# configured before a module reload
+HANDLER_NAME = 'cardinal-point'
+
+_level = logging.INFO
+_handler = None
+_listener = None
+_logger_names = set()
+
+
+def configure_logging(level=None, async_logging=True, stream=None):
+    """
+    Sets up the sink shared by every logger from get_logger and applies level to all of them.
+
+    With async_logging the loggers only put records on a queue and a QueueListener thread
+    writes them to stream (stderr by default), so logging never blocks the caller on I/O.
+    Calling it again replaces the sink, flushing the previous one first.
+
+    Args:
+        level (int | str): Level of the loggers, e.g. logging.DEBUG or 'WARNING' (default: INFO).
+        async_logging (bool): Write through a background thread instead of in the caller.
+        stream: Stream the records are written to (default: sys.stderr).
+    """
+    global _level, _handler, _listener
+    if level is not None:
+        _level = logging.getLevelName(level.upper()) if isinstance(level, str) else level
+    shutdown_logging()
+
+    console = logging.StreamHandler(stream)
+    console.setFormatter(logging.Formatter(LOG_FORMAT))
+    if async_logging:
+        log_queue = queue.SimpleQueue()
+        _handler = logging.handlers.QueueHandler(log_queue)
+        _listener = logging.handlers.QueueListener(log_queue, console, respect_handler_level=True)
+        _listener.start()
+    else:
+        _handler = console
+    _handler.set_name(HANDLER_NAME)
+
+    for name in _logger_names:
+        _attach(logging.getLogger(name))
+
+
+def shutdown_logging():
+    """Stops the background writer after it has written every queued record"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def _restart_listener():
+    # A forked worker inherits the queue but not the writer thread, give it its own
+    global _listener
+    if _listener is not None:
+        _listener = logging.handlers.QueueListener(_listener.queue, *_listener.handlers, respect_handler_level=True)
+        _listener.start()
+
+
+def _attach(logger):
+    logger.setLevel(_level)
+    for handler in [handler for handler in logger.handlers if handler.get_name() == HANDLER_NAME]:
+        if handler is not _handler:
+            logger.removeHandler(handler)
+    if _handler not in logger.handlers:
+        logger.addHandler(_handler)
+
 
 def get_logger(name):
     """
-    Create a logger with the specified name and set its level to INFO.
-    
+    Returns the logger with the specified name, writing to the shared sink.
+
+    Safe to call any number of times for the same name: the logger gets exactly one handler,
+    also across Streamlit reruns and module reloads.
+
     Args:
         name (str): The name of the logger.
-        
+
     Returns:
         logging.Logger: Configured logger instance.
     """
+    if _handler is None:
+        configure_logging()
     logger = logging.getLogger(name)
-    logger.setLevel(logging.INFO)
-    
-    # Create console handler and set level to info
-    ch = logging.StreamHandler()
-    ch.setLevel(logging.INFO)
-    
-    # Create formatter
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    
-    # Add formatter to ch
-    ch.setFormatter(formatter)
-    
-    # Add ch to logger
-    logger.addHandler(ch)
-    
+    _logger_names.add(name)
+    _attach(logger)
     return logger
+
+
+atexit.register(shutdown_logging)
+os.register_at_fork(after_in_child=_restart_listener)
@@ -0,0 +1,149 @@
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from utils.logger import get_logger
+from utils.profiling import profiler
+
+log = get_logger(__name__)
+
+# Default bound of the in-memory cache, an entry's size is the memory of the frames it holds
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def data_fingerprint(data: pd.DataFrame) -> tuple:
+    """
+    Identifies a bar history cheaply: its length, first and last timestamp and the last bar's
+    close, which also tells a revised forming bar apart from the one it replaced.
+
+    The close is taken at float32 precision, so compact bars (see data_fetching.compact_bars)
+    and full precision bars of the same history share their cache entries.
+    """
+    if data is None or data.empty:
+        return (0,)
+    return (len(data), str(data.index[0]), str(data.index[-1]), float(np.float32(data['Close'].iloc[-1])))
+
+
+def value_size(value) -> int:
+    """Approximate memory held by a cached value"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(value.memory_usage(index=True, deep=False).sum())
+    if isinstance(value, (tuple, list)):
+        return sum(value_size(item) for item in value)
+    if isinstance(value, dict):
+        return sum(value_size(item) for item in value.values())
+    return 64
+
+
+class ComputeCache:
+    """
+    LRU cache of computed frames (indicator frames, strategy signals, ...) bounded by entry
+    count and size, optionally backed by a directory of pickles so entries outlive the process.
+
+    Keys are tuples such as ('indicators', ticker, interval, data_fingerprint(data), columns).
+    Cached values are shared, callers must not modify them.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES, disk_dir=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.entries = OrderedDict()
+        self.sizes = {}
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get_or_compute(self, key, compute):
+        """Returns the cached value for key, calling compute() and caching its result on a miss."""
+        found, value = self.get(key)
+        if not found:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def get(self, key):
+        """Returns (found, value)"""
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                profiler.count('compute_cache.hits')
+                return True, self.entries[key]
+
+        value = self._read_disk(key)
+        with self.lock:
+            if value is None:
+                self.misses += 1
+                profiler.count('compute_cache.misses')
+                return False, None
+            self.hits += 1
+            self._store(key, value)
+        profiler.count('compute_cache.disk_hits')
+        return True, value
+
+    def put(self, key, value):
+        with self.lock:
+            self._store(key, value)
+        self._write_disk(key, value)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.sizes.clear()
+            self.total_bytes = 0
+        if self.disk_dir and os.path.isdir(self.disk_dir):
+            for name in os.listdir(self.disk_dir):
+                if name.endswith('.pkl'):
+                    os.remove(os.path.join(self.disk_dir, name))
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _store(self, key, value):
+        if key in self.entries:
+            self.total_bytes -= self.sizes[key]
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        self.sizes[key] = value_size(value)
+        self.total_bytes += self.sizes[key]
+        # Evict least recently used entries, always keeping the one just stored
+        while len(self.entries) > 1 and (len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes):
+            evicted, _ = self.entries.popitem(last=False)
+            self.total_bytes -= self.sizes.pop(evicted)
+
+    def _disk_path(self, key):
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()
+        return os.path.join(self.disk_dir, f"{digest}.pkl")
+
+    def _read_disk(self, key):
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                stored_key, value = pickle.load(f)
+        except Exception as e:
+            log.warning(f"Discarding unreadable cache file {path}: {e}")
+            return None
+        return value if stored_key == key else None
+
+    def _write_disk(self, key, value):
+        if not self.disk_dir:
+            return
+        os.makedirs(self.disk_dir, exist_ok=True)
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((key, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+
+compute_cache = ComputeCache()
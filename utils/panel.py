@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+from indicators.panel_indicators import panel_indicators
+
+PANEL_FIELDS = ('Open', 'High', 'Low', 'Close', 'Volume')
+
+
+class BarPanel:
+    """
+    Bars of a universe of tickers as 2-D arrays of bars x tickers, one per field.
+
+    Histories are aligned on their latest bar rather than on calendar dates: the last row holds
+    every ticker's latest bar and shorter histories are padded with NaN at the top. Shifting a
+    row therefore means "the ticker's previous bar" exactly like shift(1) on its own DataFrame,
+    so panel strategies reproduce the single-ticker ones column by column.
+    """
+
+    def __init__(self, tickers, dates, fields, lengths):
+        self.tickers = list(tickers)
+        self.dates = dates      # bars x tickers datetime64, NaT in the padding
+        self.fields = fields    # field -> bars x tickers float array
+        self.lengths = lengths  # number of bars of every ticker
+
+    def __getitem__(self, field) -> np.ndarray:
+        return self.fields[field]
+
+    def __contains__(self, field):
+        return field in self.fields
+
+    @property
+    def last_dates(self) -> pd.DatetimeIndex:
+        return pd.DatetimeIndex(self.dates[-1]) if len(self.dates) else pd.DatetimeIndex([])
+
+    @classmethod
+    def from_stocks_data(cls, stocks_data: dict, indicators=(), fields=PANEL_FIELDS):
+        """
+        Builds a panel from ticker -> OHLCV DataFrame and adds the indicator columns, e.g.
+        from required_indicators, calculated over the whole panel at once.
+        """
+        stocks_data = {ticker: data for ticker, data in stocks_data.items() if data is not None and not data.empty}
+        tickers = list(stocks_data)
+        lengths = np.array([len(data) for data in stocks_data.values()], dtype=int)
+        rows = int(lengths.max()) if len(lengths) else 0
+
+        dates = np.full((rows, len(tickers)), np.datetime64('NaT'), dtype='datetime64[ns]')
+        arrays = {field: np.full((rows, len(tickers)), np.nan) for field in fields}
+        for j, data in enumerate(stocks_data.values()):
+            offset = rows - len(data)
+            dates[offset:, j] = data.index.to_numpy(dtype='datetime64[ns]')
+            for field in fields:
+                arrays[field][offset:, j] = data[field].to_numpy(dtype=float)
+
+        if indicators:
+            arrays.update(panel_indicators(pd.DataFrame(arrays['Close']), indicators))
+        return cls(tickers, dates, arrays, lengths)
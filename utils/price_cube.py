@@ -0,0 +1,183 @@
+import json
+import os
+import shutil
+import time
+import numpy as np
+import pandas as pd
+from utils.bar_store import bar_store, slice_bars
+from utils.constants import DATA_DIR, nifty_200_tickers_yfinance
+from utils.date_utils import get_current_time, get_end_date
+from utils.panel import PANEL_FIELDS
+from utils.resampling import source_interval, resample_bars, period_starts
+from utils.trading_calendar import get_trading_calendar
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+PRICE_CUBE_DIR = os.path.join(DATA_DIR, 'cube')
+
+# File in a cube's root naming the version directory that holds the current cube
+CURRENT_FILE = 'CURRENT'
+
+
+def current_version(root):
+    """Returns the directory of the current cube under root"""
+    try:
+        with open(os.path.join(root, CURRENT_FILE)) as f:
+            return os.path.join(root, f.read().strip())
+    except FileNotFoundError:
+        # A cube written before versions were kept sits in root itself
+        return root
+
+
+class PriceCube:
+    """
+    Bars of a whole universe as one dates x tickers array per field, memory-mapped from disk.
+
+    A cube directory holds index.json (interval, fields, the tickers in column order and the
+    exclusive end of the bars), dates.npy with the date axis and one <field>.npy per field. The
+    date axis is every trading session of the calendar (or every week/month holding one)
+    between the first and last bar, so rows line up across tickers; days a ticker has no bar
+    are NaN. Only complete bars are kept, so the last row is never a forming day/week/month.
+    Opening a cube only maps the files, processes opening the same cube share its pages through
+    the OS page cache.
+    """
+
+    def __init__(self, root, interval, dates, tickers, fields, end=None):
+        self.root = root
+        self.interval = interval
+        self.end = end
+        self.dates = dates
+        self.tickers = list(tickers)
+        self.columns = {ticker: j for j, ticker in enumerate(self.tickers)}
+        self.fields = fields  # field -> read-only dates x tickers memmap
+
+    @classmethod
+    def open(cls, root=None, interval='1d'):
+        root = current_version(root or os.path.join(PRICE_CUBE_DIR, interval))
+        with open(os.path.join(root, 'index.json')) as f:
+            index = json.load(f)
+        dates = pd.DatetimeIndex(np.load(os.path.join(root, 'dates.npy')), name='Date')
+        fields = {field: np.load(os.path.join(root, f"{field}.npy"), mmap_mode='r') for field in index['fields']}
+        end = pd.Timestamp(index['end']) if index.get('end') else None
+        return cls(root, index['interval'], dates, index['tickers'], fields, end)
+
+    def __getitem__(self, field) -> np.ndarray:
+        return self.fields[field]
+
+    def __contains__(self, ticker):
+        return ticker in self.columns
+
+    def column(self, ticker) -> int:
+        return self.columns[ticker]
+
+    def row(self, date) -> int:
+        """Returns the row of the last bar on or before date, -1 if the cube starts later"""
+        return int(self.dates.searchsorted(pd.Timestamp(date), side='right')) - 1
+
+    def cross_section(self, date, fields=None) -> pd.DataFrame:
+        """Returns the bar on or before date of every ticker, one row per ticker"""
+        row = self.row(date)
+        if row < 0:
+            raise KeyError(f"The cube starts after {date}")
+        return pd.DataFrame({field: np.asarray(self.fields[field][row]) for field in fields or self.fields},
+                            index=pd.Index(self.tickers, name='Ticker'))
+
+    def frame(self, ticker, start=None, end=None) -> pd.DataFrame:
+        """Returns a ticker's bars in [start, end) like the bar store holds them, without empty rows"""
+        first = 0 if start is None else int(self.dates.searchsorted(pd.Timestamp(start)))
+        last = len(self.dates) if end is None else int(self.dates.searchsorted(pd.Timestamp(end)))
+        j = self.column(ticker)
+        data = pd.DataFrame({field: np.array(values[first:last, j]) for field, values in self.fields.items()},
+                            index=self.dates[first:last])
+        return data[data['Close'].notna()]
+
+    def stocks_data(self, tickers=None, start=None, end=None) -> dict:
+        """Returns ticker -> bars, as load_stocks_data does, for the tickers with any bar in the window"""
+        stocks_data = {}
+        for ticker in tickers or self.tickers:
+            if ticker in self.columns:
+                data = self.frame(ticker, start, end)
+                if not data.empty:
+                    stocks_data[ticker] = data
+        return stocks_data
+
+
+def cube_dates(first, last, interval) -> pd.DatetimeIndex:
+    """Returns the date axis of a cube spanning first..last: the sessions or the periods holding one"""
+    sessions = get_trading_calendar().sessions
+    sessions = sessions[(sessions >= first.normalize()) & (sessions <= last.normalize())]
+    if interval == '1d':
+        return sessions.rename('Date')
+    return pd.DatetimeIndex(period_starts(sessions, interval).unique(), name='Date')
+
+
+def build_price_cube(tickers=None, interval='1d', root=None, store=bar_store, fields=PANEL_FIELDS) -> PriceCube:
+    """
+    Writes the cube of the tickers' stored bars (the NIFTY 200 of data/raw/ind_nifty200list.csv
+    in its order by default) and returns it opened.
+
+    Only reads the bar store, fill it first with load_stocks_data. Weekly and monthly cubes are
+    built from the daily bars when those are what the store keeps (see utils/resampling.py).
+    Bars on days the calendar has no session for are left out, and so is the bar still forming
+    now (see date_utils.get_end_date).
+
+    Every build is written to a new version directory under root and made current by atomically
+    replacing the CURRENT file, so root always holds a complete cube. The previous version is
+    kept for readers that resolved it just before the swap, older ones are removed.
+    """
+    tickers = list(dict.fromkeys(tickers or nifty_200_tickers_yfinance))
+    root = root or os.path.join(PRICE_CUBE_DIR, interval)
+    source = source_interval(interval)
+    end = pd.Timestamp(get_end_date(get_current_time(), interval))
+
+    stored = {}
+    for ticker in tickers:
+        data = store.read(ticker, source)
+        if data is None or data.empty:
+            continue
+        data = slice_bars(resample_bars(data, interval) if source != interval else data, data.index[0], end)
+        if not data.empty:
+            stored[ticker] = data
+    if not stored:
+        raise ValueError(f"No complete {source} bars stored for any of the {len(tickers)} tickers")
+
+    first = min(data.index[0] for data in stored.values())
+    last = max(data.index[-1] for data in stored.values())
+    dates = cube_dates(first, last, interval)
+
+    previous = current_version(root) if os.path.exists(os.path.join(root, CURRENT_FILE)) else None
+    version = f"v{time.time_ns()}"
+    version_root = os.path.join(root, version)
+    os.makedirs(version_root)
+    np.save(os.path.join(version_root, 'dates.npy'), dates.to_numpy())
+    for field in fields:
+        # Written a ticker column at a time straight into the mapped file
+        values = np.lib.format.open_memmap(os.path.join(version_root, f"{field}.npy"), mode='w+',
+                                           dtype=np.float64, shape=(len(dates), len(tickers)))
+        values[:] = np.nan
+        for j, ticker in enumerate(tickers):
+            data = stored.get(ticker)
+            if data is None or field not in data.columns:
+                continue
+            rows = dates.get_indexer(data.index.normalize())
+            found = rows >= 0
+            values[rows[found], j] = data[field].to_numpy(dtype=np.float64)[found]
+        values.flush()
+        del values
+    with open(os.path.join(version_root, 'index.json'), 'w') as f:
+        json.dump({'interval': interval, 'fields': list(fields), 'tickers': tickers, 'end': end.date().isoformat()}, f)
+
+    pointer = os.path.join(root, f"{CURRENT_FILE}.{os.getpid()}.tmp")
+    with open(pointer, 'w') as f:
+        f.write(version)
+    os.replace(pointer, os.path.join(root, CURRENT_FILE))
+
+    keep = {version_root, previous}
+    for name in os.listdir(root):
+        path = os.path.join(root, name)
+        if name.startswith('v') and os.path.isdir(path) and path not in keep:
+            shutil.rmtree(path, ignore_errors=True)
+
+    log.info(f"Built the {interval} price cube of {len(stored)}/{len(tickers)} tickers over {len(dates)} dates in {version_root}")
+    return PriceCube.open(root)
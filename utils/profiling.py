@@ -0,0 +1,138 @@
+import functools
+import json
+import threading
+import time
+
+# Stage timers and counters for finding where a scan spends its time. Profiling is off by
+# default; while off, stage() returns a shared no-op context manager and count() returns after
+# one attribute check, so the instrumentation can stay in the hot paths.
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.add_time(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class Profiler:
+    """
+    Collects per-stage timings (calls, total and max seconds) and named counters.
+
+        with profiler.stage('indicators'):
+            ...
+        profiler.count('cache.hits')
+
+    Timings of stages running on several threads add up, so a stage's total can exceed the
+    wall time of the scan. Stats gathered in worker processes are combined with merge().
+    """
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.timings = {}
+        self.counters = {}
+
+    def reset(self):
+        with self.lock:
+            self.timings = {}
+            self.counters = {}
+
+    def stage(self, name):
+        """Context manager timing the enclosed block as the stage name"""
+        if not self.enabled:
+            return NULL_STAGE
+        return _Stage(self, name)
+
+    def timed(self, name=None):
+        """Decorator timing every call of a function as a stage, named after the function by default"""
+        def decorator(function):
+            stage_name = name or f"{function.__module__}.{function.__qualname__}"
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with _Stage(self, stage_name):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def add_time(self, name, seconds, calls=1):
+        with self.lock:
+            entry = self.timings.get(name)
+            if entry is None:
+                self.timings[name] = [calls, seconds, seconds]
+            else:
+                entry[0] += calls
+                entry[1] += seconds
+                entry[2] = max(entry[2], seconds)
+
+    def count(self, name, value=1):
+        if not self.enabled:
+            return
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def snapshot(self) -> dict:
+        """Returns the collected stats as plain data, stages ordered by total time"""
+        with self.lock:
+            timings = sorted(self.timings.items(), key=lambda item: item[1][1], reverse=True)
+            return {
+                'timings': {name: {'calls': calls, 'total_s': total, 'max_s': longest}
+                            for name, (calls, total, longest) in timings},
+                'counters': dict(sorted(self.counters.items())),
+            }
+
+    def merge(self, snapshot: dict):
+        """Adds stats from snapshot(), e.g. of a worker process"""
+        with self.lock:
+            for name, timing in snapshot['timings'].items():
+                entry = self.timings.setdefault(name, [0, 0.0, 0.0])
+                entry[0] += timing['calls']
+                entry[1] += timing['total_s']
+                entry[2] = max(entry[2], timing['max_s'])
+            for name, value in snapshot['counters'].items():
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def write_report(self, path: str):
+        with open(path, 'w') as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+
+def profiled_call(function, *args):
+    """
+    Runs function(*args) with profiling on and returns (result, stats). Used to run tasks in
+    worker processes, the caller merges the stats into its own profiler.
+    """
+    profiler.reset()
+    profiler.enabled = True
+    try:
+        return function(*args), profiler.snapshot()
+    finally:
+        profiler.enabled = False
+
+
+profiler = Profiler()
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+from utils.constants import RESAMPLE_FROM_DAILY
+
+# Intervals built from daily bars instead of being downloaded, when RESAMPLE_FROM_DAILY is set
+RESAMPLED_INTERVALS = ('1wk', '1mo')
+
+# How the daily bars of a period combine into its bar, like Yahoo Finance builds weekly bars.
+# Columns not listed take the last value of the period.
+AGGREGATIONS = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Adj Close': 'last', 'Volume': 'sum'}
+
+
+def source_interval(interval: str) -> str:
+    """Returns the interval whose bars are stored and downloaded to answer requests for interval"""
+    return '1d' if RESAMPLE_FROM_DAILY and interval in RESAMPLED_INTERVALS else interval
+
+
+def period_starts(index: pd.DatetimeIndex, interval: str) -> pd.DatetimeIndex:
+    """
+    Returns the label of the period every timestamp falls in: the Monday of its week for '1wk'
+    and the first of its month for '1mo', as Yahoo Finance labels those bars. A week whose Monday
+    is a holiday is still labelled with the Monday.
+    """
+    days = index.normalize()
+    if interval == '1wk':
+        return days - pd.to_timedelta(days.weekday, unit='D')
+    if interval == '1mo':
+        return days - pd.to_timedelta(days.day - 1, unit='D')
+    raise ValueError(f"Cannot resample to interval '{interval}'")
+
+
+def resample_bars(daily: pd.DataFrame, interval: str) -> pd.DataFrame:
+    """
+    Builds weekly or monthly OHLCV bars from sorted daily bars.
+
+    Every period with at least one daily bar gets a bar, so a week of holidays has none. The
+    last period holds whatever daily bars it has so far, making it the forming bar when the
+    daily history runs up to today. load_stocks_data drops it by cutting the bars at
+    date_utils.get_end_date, also for requests without an end; live mode keeps it on purpose.
+    """
+    if daily is None or daily.empty:
+        return daily
+
+    labels = period_starts(daily.index, interval).to_numpy()
+    starts = np.flatnonzero(np.r_[True, labels[1:] != labels[:-1]])
+    ends = np.r_[starts[1:], len(labels)] - 1
+
+    columns = {}
+    for column in daily.columns:
+        values = daily[column].to_numpy()
+        how = AGGREGATIONS.get(column, 'last')
+        if how == 'first':
+            columns[column] = values[starts]
+        elif how == 'max':
+            columns[column] = np.fmax.reduceat(values, starts)
+        elif how == 'min':
+            columns[column] = np.fmin.reduceat(values, starts)
+        elif how == 'sum':
+            columns[column] = np.add.reduceat(np.nan_to_num(values), starts)
+        else:
+            columns[column] = values[ends]
+    return pd.DataFrame(columns, index=pd.DatetimeIndex(labels[starts], name=daily.index.name))
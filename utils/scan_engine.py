@@ -0,0 +1,178 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from config.strategy_config import STRATEGY_CONFIG
+from utils.calculations import required_indicators
+from utils.constants import TIMEFRAMES
+from utils.data_fetching import fetch_stock_data, fetch_stocks_data
+from utils.panel import BarPanel
+from utils.profiling import profiler, profiled_call
+from utils.signals import process_ticker_signals, fetch_or_get_stock_data
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# Fetching is network bound, so it gets more workers than there are CPUs
+DEFAULT_FETCH_WORKERS = 16
+DEFAULT_COMPUTE_WORKERS = os.cpu_count() or 1
+
+
+def fetch_ticker_data(ticker, selected_timeframes, fetched_data, as_of_date, fetch=fetch_stock_data):
+    """Fetch every selected timeframe of a ticker into fetched_data and return the ticker's slice of it"""
+    all_data_fetched = True
+    for timeframe_name in selected_timeframes:
+        if timeframe_name not in STRATEGY_CONFIG:
+            continue
+
+        interval, period = TIMEFRAMES.get(timeframe_name, ('1d', '6mo'))
+        if not interval:
+            continue
+
+        if fetch_or_get_stock_data(ticker, interval, period, fetched_data, as_of_date, fetch=fetch) is None:
+            all_data_fetched = False
+            break
+    return {ticker: fetched_data.get(ticker, {})}, all_data_fetched
+
+
+def scan_tickers(stock_tickers, selected_timeframes, fetched_data, as_of_date,
+                 fetch_workers=DEFAULT_FETCH_WORKERS, compute_workers=DEFAULT_COMPUTE_WORKERS, fetch=fetch_stock_data):
+    """
+    Runs the fetch -> indicators -> strategies pipeline for every ticker.
+
+    Fetching runs on a thread pool and each fetched ticker is handed to a process pool for
+    process_ticker_signals, so network waits overlap with indicator and strategy evaluation.
+    Results are yielded as soon as a ticker completes, in completion order.
+
+    Args:
+        stock_tickers (list): Tickers to scan.
+        selected_timeframes (list): Timeframe names from STRATEGY_CONFIG.
+        fetched_data (dict): Shared ticker -> interval -> DataFrame cache, filled by the fetch stage.
+        as_of_date (date): Date to run the scan as of.
+        fetch_workers (int): Number of fetch threads.
+        compute_workers (int): Number of evaluation processes, 0 evaluates on the fetch threads instead.
+        fetch (callable): Fetches a ticker missing from fetched_data, called like data_fetching.fetch_stock_data.
+
+    Yields:
+        tuple: (signals_for_ticker, latest_close_1d, all_data_fetched) as returned by process_ticker_signals.
+    """
+    if not compute_workers:
+        with ThreadPoolExecutor(max_workers=fetch_workers) as fetch_pool:
+            futures = {
+                fetch_pool.submit(process_ticker_signals, ticker, selected_timeframes, fetched_data, as_of_date, fetch): ticker
+                for ticker in stock_tickers
+            }
+            for future in as_completed(futures):
+                yield ticker_result(future, futures[future])
+        return
+
+    with ThreadPoolExecutor(max_workers=fetch_workers) as fetch_pool, \
+            ProcessPoolExecutor(max_workers=compute_workers) as compute_pool:
+        fetch_futures = {
+            fetch_pool.submit(fetch_ticker_data, ticker, selected_timeframes, fetched_data, as_of_date, fetch): ticker
+            for ticker in stock_tickers
+        }
+        pending = set(fetch_futures)
+        compute_futures = {}
+
+        while pending or compute_futures:
+            done, _ = wait(pending.union(compute_futures), return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in pending:
+                    pending.discard(future)
+                    ticker = fetch_futures[future]
+                    try:
+                        ticker_data, all_data_fetched = future.result()
+                    except Exception as e:
+                        log.error(f"Fetching {ticker} failed: {e}")
+                        all_data_fetched = False
+                    if not all_data_fetched:
+                        yield {'Ticker': ticker}, None, False
+                        continue
+                    if profiler.enabled:
+                        # Workers profile into their own process, their stats come back with the result
+                        compute_futures[compute_pool.submit(
+                            profiled_call, process_ticker_signals, ticker, selected_timeframes, ticker_data, as_of_date
+                        )] = ticker
+                    else:
+                        compute_futures[compute_pool.submit(
+                            process_ticker_signals, ticker, selected_timeframes, ticker_data, as_of_date
+                        )] = ticker
+                else:
+                    yield ticker_result(future, compute_futures.pop(future), profiled=profiler.enabled)
+
+
+def ticker_result(future, ticker, profiled=False):
+    """Returns the result of a ticker's evaluation, a not fetched row for the ticker if it raised"""
+    try:
+        result = future.result()
+    except Exception as e:
+        log.error(f"Evaluating {ticker} failed: {e}")
+        return {'Ticker': ticker}, None, False
+    if profiled:
+        result, stats = result
+        profiler.merge(stats)
+    return result
+
+
+def panel_supported(selected_timeframes):
+    """Whether every strategy configured for the timeframes has a panel variant"""
+    return all(
+        'panel_function' in strategy
+        for timeframe_name in selected_timeframes if timeframe_name in STRATEGY_CONFIG
+        for strategy in STRATEGY_CONFIG[timeframe_name]
+    )
+
+
+def scan_panel(stock_tickers, selected_timeframes, fetched_data, as_of_date=None, fetch=fetch_stocks_data):
+    """
+    Evaluates the configured strategies for the whole universe at once on a BarPanel per timeframe,
+    from data prefetched into fetched_data. Tickers missing from it are fetched into it with one
+    fetch call (like data_fetching.fetch_stocks_data) per timeframe first, those still without
+    data count as not fetched.
+
+    Returns:
+        list: (signals_for_ticker, latest_close_1d, all_data_fetched) per ticker in stock_tickers,
+        the same rows process_ticker_signals builds.
+    """
+    signals = {ticker: {'Ticker': ticker} for ticker in stock_tickers}
+    fetched = dict.fromkeys(stock_tickers, True)
+    latest_close = {}
+
+    for timeframe_name in selected_timeframes:
+        if timeframe_name not in STRATEGY_CONFIG:
+            continue
+
+        interval, period = TIMEFRAMES.get(timeframe_name, ('1d', '6mo'))
+        if not interval:
+            continue
+
+        missing = [ticker for ticker in stock_tickers if interval not in fetched_data.get(ticker, {})]
+        if missing:
+            for ticker, stock_data in fetch(missing, period=period, interval=interval, as_of_date=as_of_date).items():
+                fetched_data.setdefault(ticker, {})[interval] = stock_data
+
+        strategies = STRATEGY_CONFIG[timeframe_name]
+        stocks_data = {}
+        for ticker in stock_tickers:
+            data = fetched_data.get(ticker, {}).get(interval)
+            if data is None or data.empty:
+                fetched[ticker] = False
+            else:
+                stocks_data[ticker] = data
+        if not stocks_data:
+            continue
+
+        with profiler.stage('panel.build'):
+            panel = BarPanel.from_stocks_data(stocks_data, required_indicators(strategies))
+        latest_signals = {}
+        for strategy in strategies:
+            with profiler.stage(f"panel_strategy.{strategy['name']}"):
+                latest_signals[strategy['name']] = strategy['panel_function'](panel)[-1]
+        signal_dates = panel.last_dates.strftime('%Y-%m-%d')
+        for j, ticker in enumerate(panel.tickers):
+            detected_signals = [name for name, latest in latest_signals.items() if latest[j]]
+            signals[ticker][f'{timeframe_name} Signals'] = ', '.join(detected_signals) if detected_signals else "No Signal"
+            signals[ticker][f'{timeframe_name} Signal Date'] = signal_dates[j] if detected_signals else "N/A"
+            if timeframe_name == '1 Day':
+                latest_close[ticker] = f"{panel['Close'][-1, j]:.2f}"
+
+    return [(signals[ticker], latest_close.get(ticker), fetched[ticker]) for ticker in stock_tickers]
@@ -0,0 +1,139 @@
+import pandas as pd
+from utils.data_fetching import fetch_stock_data, fetch_stocks_data
+from utils.calculations import required_indicators, DEFAULT_INDICATORS
+from utils.bars import Bars
+from config.strategy_config import STRATEGY_CONFIG
+from utils.constants import TIMEFRAMES
+from utils.memo import compute_cache, data_fingerprint
+from utils.profiling import profiler
+
+def calculate_signals_for_ticker(data, timeframe, latest_only=False):
+    """
+    Calculate signals based on configured strategies for the timeframe. With latest_only the
+    strategies only evaluate the final bar and the signals hold that single row.
+    """
+    if timeframe not in STRATEGY_CONFIG:
+        return pd.DataFrame(), {}
+    
+    all_signals = pd.DataFrame(index=data.index[-1:] if latest_only else data.index)
+    entry_levels = {}
+    
+    for strategy in STRATEGY_CONFIG[timeframe]:
+        strategy_func = strategy['function']
+        strategy_name = strategy['name']
+        with profiler.stage(f'strategy.{strategy_name}'):
+            signal_df = strategy_func(data, latest_only=latest_only)
+        all_signals[strategy_name] = signal_df['signal']
+        if signal_df['signal'].iloc[-1]:
+            entry_levels[strategy_name] = signal_df['entry_level'].iloc[-1]
+    
+    return all_signals, entry_levels
+
+def get_indicator_frame(ticker, interval, data, columns=None, cache=compute_cache):
+    """
+    Returns a read-only frame of data with the indicator columns added, computed once per data
+    fingerprint. The bars are shared with data rather than copied.
+    """
+    columns = tuple(DEFAULT_INDICATORS if columns is None else columns)
+    key = ('indicators', ticker, interval, data_fingerprint(data), columns)
+    def compute():
+        with profiler.stage('indicators'):
+            return Bars.from_frame(data).with_indicators(list(columns)).frame()
+    return cache.get_or_compute(key, compute)
+
+def get_signals_for_ticker(ticker, interval, data, timeframe, latest_only=False, cache=compute_cache):
+    """calculate_signals_for_ticker, computed once per data fingerprint and configured strategies"""
+    strategies = tuple(strategy['name'] for strategy in STRATEGY_CONFIG.get(timeframe, []))
+    key = ('signals', ticker, interval, data_fingerprint(data), timeframe, strategies, latest_only)
+    return cache.get_or_compute(key, lambda: calculate_signals_for_ticker(data, timeframe, latest_only=latest_only))
+
+def process_ticker_signals(ticker, selected_timeframes, fetched_data, as_of_date, fetch=fetch_stock_data):
+    signals_for_ticker = {'Ticker': ticker}
+    all_data_fetched = True
+    latest_close_1d = None
+
+    for timeframe_name in selected_timeframes:
+        if timeframe_name not in STRATEGY_CONFIG:
+            continue
+
+        interval, period = TIMEFRAMES.get(timeframe_name, ('1d', '6mo'))
+        if not interval:
+            continue
+
+        stock_data = fetch_or_get_stock_data(ticker, interval, period, fetched_data, as_of_date, fetch=fetch)
+        if stock_data is None:
+            all_data_fetched = False
+            break
+
+        data = get_indicator_frame(ticker, interval, stock_data, required_indicators(STRATEGY_CONFIG[timeframe_name]))
+        # Only the latest signal ends up in the table
+        breakout_signals, entry_levels = get_signals_for_ticker(ticker, interval, data, timeframe_name, latest_only=True)
+        latest_signal = breakout_signals.tail(1)
+
+        latest_close_1d = update_latest_close(data, timeframe_name, latest_close_1d)
+        update_signals_for_ticker(signals_for_ticker, timeframe_name, latest_signal)
+
+    return signals_for_ticker, latest_close_1d, all_data_fetched
+
+def build_signal_row(signals_for_ticker, latest_close_1d, all_data_fetched, selected_timeframes):
+    """Return the summary table row for a scanned ticker, or None if it has nothing to show"""
+    if all_data_fetched and any(
+        signals_for_ticker.get(f'{tf} Signals') != "No Signal" for tf in selected_timeframes
+    ):
+        if latest_close_1d:
+            signals_for_ticker['Last Close'] = latest_close_1d
+        return signals_for_ticker
+    return None
+
+def prefetch_stock_data(stock_tickers, selected_timeframes, fetched_data, as_of_date, fetch=fetch_stocks_data):
+    """
+    Bulk download every selected timeframe up front so the per-ticker loop reads from fetched_data.
+    fetch is called like data_fetching.fetch_stocks_data, the Streamlit app passes its cached one.
+    """
+    for timeframe_name in selected_timeframes:
+        if timeframe_name not in STRATEGY_CONFIG:
+            continue
+
+        interval, period = TIMEFRAMES.get(timeframe_name, ('1d', '6mo'))
+        if not interval:
+            continue
+
+        missing = [ticker for ticker in stock_tickers if interval not in fetched_data.get(ticker, {})]
+        if not missing:
+            continue
+
+        stocks_data = fetch(missing, period=period, interval=interval, as_of_date=as_of_date)
+        for ticker, stock_data in stocks_data.items():
+            fetched_data.setdefault(ticker, {})[interval] = stock_data
+
+def fetch_or_get_stock_data(ticker, interval, period, fetched_data, as_of_date, fetch=fetch_stock_data):
+    """Returns the ticker's bars from fetched_data, fetching them into it with fetch if missing"""
+    if ticker not in fetched_data or interval not in fetched_data[ticker]:
+        stock_data = fetch(ticker, period=period, interval=interval, as_of_date=as_of_date)
+        if stock_data is not None:
+            if ticker not in fetched_data:
+                fetched_data[ticker] = {}
+            fetched_data[ticker][interval] = stock_data
+        return stock_data
+    return fetched_data[ticker][interval]
+
+def update_latest_close(data, timeframe_name, latest_close_1d):
+    if timeframe_name == '1 Day' and not data.empty:
+        return f"{data['Close'].iloc[-1]:.2f}"
+    elif timeframe_name == '1 Day':
+        return "N/A"
+    return latest_close_1d
+
+def update_signals_for_ticker(signals_for_ticker, timeframe_name, latest_signal):
+    detected_signals = []
+    if not latest_signal.empty and latest_signal.any(axis=1).iloc[0]:
+        for strategy_name in latest_signal.columns:
+            if latest_signal[strategy_name].iloc[0]:
+                detected_signals.append(strategy_name)
+
+    signals_for_ticker[f'{timeframe_name} Signals'] = ', '.join(detected_signals) if detected_signals else "No Signal"
+    if not latest_signal.empty:
+        signal_dates = latest_signal[latest_signal.any(axis=1)].index.strftime('%Y-%m-%d')
+        signals_for_ticker[f'{timeframe_name} Signal Date'] = signal_dates[-1] if not signal_dates.empty else "N/A"
+    else:
+        signals_for_ticker[f'{timeframe_name} Signal Date'] = "N/A"
@@ -0,0 +1,112 @@
+import functools
+import os
+from datetime import date, datetime, time, timedelta
+import numpy as np
+import pandas as pd
+from utils.constants import DATA_DIR
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+HOLIDAYS_PATH = os.path.join(DATA_DIR, 'raw', 'nse_holidays.csv')
+
+# NSE regular session in IST
+MARKET_OPEN = time(9, 15)
+MARKET_CLOSE = time(15, 30)
+
+# Days the lookup tables are precomputed for; holidays are only known for the years listed in
+# HOLIDAYS_PATH, outside of those only weekends are excluded
+CALENDAR_START = date(2000, 1, 1)
+CALENDAR_END = date(2040, 12, 31)
+
+
+def _to_date(day) -> date:
+    return day.date() if isinstance(day, datetime) else day
+
+
+class TradingCalendar:
+    """
+    Trading sessions of the exchange between CALENDAR_START and CALENDAR_END: weekdays that are
+    not holidays.
+
+    The sessions are precomputed once, so the scalar lookups are a subtraction and an array
+    index, and `sessions` can be used for vectorized work (e.g. reindexing a panel of bars).
+
+    covered_years are the years the holidays are known for; a lookup in any other year logs a
+    warning (once per year), its weekdays are all taken for sessions.
+    """
+
+    def __init__(self, holidays=(), start=CALENDAR_START, end=CALENDAR_END, covered_years=None):
+        self.start = start
+        self.end = end
+        self.covered_years = None if covered_years is None else set(covered_years)
+        self._warned_years = set()
+        self.holidays = pd.DatetimeIndex(pd.to_datetime(list(holidays))).normalize()
+        self.sessions = pd.bdate_range(start, end, freq='C', holidays=self.holidays)
+
+        days = np.arange(start.toordinal(), end.toordinal() + 1)
+        session_days = np.array([day.toordinal() for day in self.sessions.date])
+        self._is_session = np.isin(days, session_days)
+        # Position in sessions of the last session on or before each day, -1 before the first
+        self._last_session = np.searchsorted(session_days, days, side='right') - 1
+
+    @classmethod
+    def from_csv(cls, path=HOLIDAYS_PATH):
+        holidays = pd.read_csv(path, parse_dates=['Date'])['Date']
+        return cls(holidays, covered_years=holidays.dt.year.unique())
+
+    def _offset(self, day) -> int:
+        day = _to_date(day)
+        if not self.start <= day <= self.end:
+            raise ValueError(f"{day} is outside the trading calendar ({self.start} to {self.end})")
+        if self.covered_years is not None and day.year not in self.covered_years and day.year not in self._warned_years:
+            self._warned_years.add(day.year)
+            log.warning(f"No exchange holidays are known for {day.year}, treating every weekday as a session; "
+                        f"add them to {HOLIDAYS_PATH}")
+        return day.toordinal() - self.start.toordinal()
+
+    def is_session(self, day) -> bool:
+        return bool(self._is_session[self._offset(day)])
+
+    def last_session(self, day) -> date:
+        """Returns the last session on or before day"""
+        position = self._last_session[self._offset(day)]
+        if position < 0:
+            raise ValueError(f"No session on or before {day} in the trading calendar")
+        return self.sessions[position].date()
+
+    def previous_session(self, day) -> date:
+        """Returns the last session strictly before day"""
+        return self.last_session(_to_date(day) - timedelta(days=1))
+
+    def session_bounds(self, day) -> tuple:
+        """Returns the (open, close) datetimes of the session on day"""
+        day = _to_date(day)
+        if not self.is_session(day):
+            raise ValueError(f"{day} is not a trading session")
+        return datetime.combine(day, MARKET_OPEN), datetime.combine(day, MARKET_CLOSE)
+
+    @staticmethod
+    def week_start(day) -> date:
+        """Returns the Monday of day's week, the date Yahoo Finance labels weekly bars with"""
+        day = _to_date(day)
+        return day - timedelta(days=day.weekday())
+
+    def last_session_of_week(self, day):
+        """Returns the last session of day's week, None if the whole week is closed"""
+        week_start = self.week_start(day)
+        session = self.last_session(week_start + timedelta(days=6))
+        return session if session >= week_start else None
+
+    def last_session_of_month(self, day):
+        """Returns the last session of day's month, None if the whole month is closed"""
+        month_start = _to_date(day).replace(day=1)
+        next_month = (month_start + timedelta(days=32)).replace(day=1)
+        session = self.last_session(next_month - timedelta(days=1))
+        return session if session >= month_start else None
+
+
+@functools.lru_cache(maxsize=None)
+def get_trading_calendar() -> TradingCalendar:
+    """Returns the NSE calendar built from the holiday table, loaded once per process"""
+    return TradingCalendar.from_csv()